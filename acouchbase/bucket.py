@@ -6,6 +6,8 @@ except ImportError:
 from acouchbase.asyncio_iops import IOPS
 from acouchbase.iterator import AView, AN1QLRequest
 from couchbase.async.bucket import AsyncBucket
+from couchbase.hedging import HedgedRead
+from couchbase.items import ItemCollection
 from couchbase.experimental import enabled_or_raise; enabled_or_raise()
 
 
@@ -28,7 +30,7 @@ class Bucket(AsyncBucket):
     def _meth_factory(meth, name):
         def ret(self, *args, **kwargs):
             rv = meth(self, *args, **kwargs)
-            ft = asyncio.Future()
+            ft = asyncio.Future(loop=self._loop)
             def on_ok(res):
                 ft.set_result(res)
                 rv.clear_callbacks()
@@ -55,6 +57,82 @@ class Bucket(AsyncBucket):
 
     locals().update(AsyncBucket._gen_memd_wrappers(_meth_factory))
 
+    def get_hedged(self, key, policy, quiet=None, **kwargs):
+        """
+        Retrieve a key, also reading from a replica if the active node
+        has not answered within the delay dictated by `policy`.
+
+        :param policy: A :class:`~couchbase.hedging.HedgePolicy`
+        :return: A future resolved with the first successful result, or
+            with the error of the active read
+        """
+        ft = asyncio.Future(loop=self._loop)
+        hr = HedgedRead(policy, ft.set_result, ft.set_exception)
+
+        def relay(ok, err):
+            def on_done(f):
+                if f.cancelled():
+                    return
+                if f.exception():
+                    err(f.exception())
+                else:
+                    ok(f.result())
+            return on_done
+
+        def fire():
+            if hr.fire():
+                self.rget(key, quiet=quiet).add_done_callback(
+                    relay(hr.replica_ok, hr.replica_err))
+
+        hr.cancel_timer = self._loop.call_later(policy.delay, fire).cancel
+        self.get(key, quiet=quiet, **kwargs).add_done_callback(
+            relay(hr.active_ok, hr.active_err))
+        return ft
+
+    def multi_futures(self, opname, keys, *args, **kwargs):
+        """
+        Perform a ``*_multi`` operation, returning a future for each key
+        rather than a single future for the whole
+        :class:`~couchbase.result.MultiResult`.
+
+        All the futures are resolved together, in a single pass, once
+        the operation completes. This is much cheaper than issuing a
+        single-key operation for every key.
+
+        :param string opname: The name of the operation, e.g.
+            ``'get_multi'``
+        :param keys: The keys (or key-value dictionary, or
+            :class:`~couchbase.items.ItemCollection`) for the operation
+        :return: A ``dict`` of ``key -> Future``. Each future is resolved
+            with the key's :class:`~couchbase.result.Result`, or with an
+            exception if the key failed.
+
+        .. code-block:: python
+
+            fts = cb.multi_futures('get_multi', keys)
+            for key in keys:
+                res = yield from fts[key]
+        """
+        klist = self._fanout_keys(opname, keys)
+        if not isinstance(keys, (dict, ItemCollection)):
+            keys = klist
+
+        fts = dict((k, asyncio.Future(loop=self._loop)) for k in klist)
+        opres = getattr(AsyncBucket, opname)(self, keys, *args, **kwargs)
+
+        def on_ok(key, res):
+            ft = fts[key]
+            if not ft.cancelled():
+                ft.set_result(res)
+
+        def on_err(key, exc):
+            ft = fts[key]
+            if not ft.cancelled():
+                ft.set_exception(exc)
+
+        self._fanout(opres, klist, on_ok, on_err)
+        return fts
+
     def connect(self):
         if not self.connected:
             self._connect()
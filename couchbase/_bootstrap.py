@@ -33,7 +33,8 @@ import pickle
 
 import couchbase.exceptions as E
 import couchbase._libcouchbase as C
-from couchbase.items import ItemCollection, ItemOptionDict, ItemSequence
+from couchbase.items import (
+    ItemCollection, ItemOptionDict, ItemSequence, ItemArray)
 from couchbase.result import SubdocResult
 from couchbase.subdocument import MultiValue
 
@@ -145,6 +146,7 @@ def run_init(m):
                     itmcoll_base_type=ItemCollection,
                     itmopts_dict_type=ItemOptionDict,
                     itmopts_seq_type=ItemSequence,
+                    itmarray_type=ItemArray,
                     fmt_auto=_FMT_AUTO,
                     view_path_helper=_view_path_helper,
                     sd_result_type=SubdocResult,
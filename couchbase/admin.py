@@ -23,7 +23,8 @@ from time import time, sleep
 import couchbase._libcouchbase as LCB
 import couchbase.exceptions as E
 from couchbase.user_constants import FMT_JSON
-from couchbase._pyport import ulp
+from couchbase._pyport import basestring, ulp
+from couchbase.retry import RetryPolicy
 
 METHMAP = {
     'GET': LCB.LCB_HTTP_METHOD_GET,
@@ -227,30 +228,54 @@ class Admin(LCB.Bucket):
         """
         return self.http_request(path='/pools/default/buckets/' + name)
 
-    def wait_ready(self, name, timeout=5.0, sleep_interval=0.2):
+    def _bucket_ready(self, name):
+        info = self.bucket_info(name).value
+        for node in info['nodes']:
+            if node['status'] != 'healthy':
+                raise NotReadyError.pyexc('Not all nodes are healthy')
+
+    def wait_ready(self, name, timeout=5.0, sleep_interval=0.2,
+                   max_interval=2.0):
         """
         Wait for a newly created bucket to be ready.
 
-        :param string name: the name to wait for
+        :param name: the name to wait for, or a list of names. Several
+            buckets are checked together, within the same `timeout`
         :param seconds timeout: the maximum amount of time to wait
-        :param seconds sleep_interval: the number of time to sleep
-            between each probe
+        :param seconds sleep_interval: the time to sleep after the first
+            probe. The interval then grows (with some random jitter)
+            between successive probes
+        :param seconds max_interval: the upper bound for the interval
+            between two probes
         :raise: :exc:`.CouchbaseError` on internal HTTP error
         :raise: :exc:`NotReadyError` if all nodes could not be
             ready in time
         """
+        pending = [name] if isinstance(name, basestring) else list(name)
+        policy = RetryPolicy(initial_backoff=sleep_interval,
+                             max_backoff=max(max_interval, sleep_interval),
+                             multiplier=1.5, jitter=0.5)
         end = time() + timeout
+        attempt = 0
+
         while True:
-            try:
-                info = self.bucket_info(name).value
-                for node in info['nodes']:
-                    if node['status'] != 'healthy':
-                        raise NotReadyError.pyexc('Not all nodes are healthy')
+            err = None
+            for cur in list(pending):
+                try:
+                    self._bucket_ready(cur)
+                    pending.remove(cur)
+                except E.CouchbaseError as e:
+                    if err is None:
+                        err = e
+
+            if not pending:
                 return  # No error and all OK
-            except E.CouchbaseError:
-                if time() + sleep_interval > end:
-                    raise
-                sleep(sleep_interval)
+
+            attempt += 1
+            delay = policy.backoff(attempt)
+            if time() + delay > end:
+                raise err
+            sleep(delay)
 
     def bucket_update(self, name, current, bucket_password=None, replicas=None,
                       ram_quota=None, flush_enabled=None):
@@ -24,7 +24,8 @@ from couchbase._libcouchbase import (
 from couchbase.result import AsyncResult
 from couchbase.async.view import AsyncViewBase
 from couchbase.bucket import Bucket
-from couchbase.exceptions import ArgumentError
+from couchbase.exceptions import ArgumentError, CouchbaseError
+from couchbase.items import ItemCollection
 
 class AsyncBucket(Bucket):
     """
@@ -129,12 +130,17 @@ class AsyncBucket(Bucket):
 
         :param iops: An :class:`~couchbase.iops.base.IOPS`-interface
           conforming object. This object must not be used between two
-          instances, and is owned by the connection object.
+          instances, and is owned by the connection object. (Only
+          synchronous buckets may share a plugin, see
+          :func:`couchbase.multi.shared_iops`). This may be
+          `None` if the ``_ioloop`` keyword argument is passed instead,
+          in which case I/O is performed by libcouchbase's own plugin
+          for that loop (a tuple of ``(plugin_name, loop_address)``).
 
         :param kwargs: Additional arguments to pass to
           the :class:`~couchbase.bucket.Bucket` constructor
         """
-        if not iops:
+        if not iops and not kwargs.get('_ioloop'):
             raise ValueError("Must have IOPS")
 
         kwargs.setdefault('_flags', 0)
@@ -174,3 +180,66 @@ class AsyncBucket(Bucket):
         res = super(AsyncBucket, self).endure_multi([key], *args, **kwargs)
         res._set_single()
         return res
+
+    def _fanout_keys(self, opname, keys):
+        """
+        Validate `opname` as the name of a ``*_multi`` operation, and
+        return the list of keys which will be present in its result.
+        """
+        if not opname.endswith('_multi') or not hasattr(self, opname):
+            raise ArgumentError.pyexc('Not a multi operation', opname)
+        if isinstance(keys, ItemCollection):
+            return [itm.key for itm, _ in keys]
+        return list(keys)
+
+    def _fanout(self, opres, keys, on_key_ok, on_key_err):
+        """
+        Deliver the results of a multi operation to per-key callbacks.
+
+        The callbacks are invoked for all keys in a single pass once the
+        whole operation completes, so that a framework which wraps each
+        key in its own future object pays for a single callback from
+        the library rather than one per key.
+
+        :param opres: The :class:`~couchbase.result.AsyncResult` returned
+          by a ``*_multi`` method
+        :param keys: The keys of the operation, as returned by
+          :meth:`_fanout_keys`
+        :param on_key_ok: Invoked as ``on_key_ok(key, result)``
+        :param on_key_err: Invoked as ``on_key_err(key, exc)``
+
+        If the operation as a whole failed, every key whose result was not
+        successful (including a value which could not be decoded) is passed
+        to `on_key_err` with an exception of the appropriate class for its
+        error code; otherwise all keys are passed
+        to `on_key_ok` (which may then receive unsuccessful results, as
+        permitted by `quiet`). A key without any result (for example
+        because the key received from the server could not be decoded)
+        is passed to `on_key_err` with the exception of the operation.
+        """
+        def deliver(mres, exc):
+            opres.clear_callbacks()
+            seen = set()
+            for k in keys:
+                if k in seen:
+                    continue
+                seen.add(k)
+
+                v = mres.get(k)
+                if v is None:
+                    on_key_err(k, exc or CouchbaseError.pyexc(
+                        'No result received for key', k))
+                elif exc is None or v.success:
+                    on_key_ok(k, v)
+                else:
+                    cls = CouchbaseError.rc_to_exctype(v.rc)
+                    on_key_err(k, cls({'rc': v.rc, 'key': k, 'result': v}))
+
+        def on_ok(mres):
+            deliver(mres, None)
+
+        def on_err(mres, excls, excval, exctb):
+            deliver(mres, excval)
+
+        opres.set_callbacks(on_ok, on_err)
+        return opres
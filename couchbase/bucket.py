@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from hashlib import sha1
+import os.path
+from time import time
 from warnings import warn
 
 import couchbase._bootstrap
@@ -24,6 +27,8 @@ from couchbase.exceptions import *
 from couchbase.user_constants import *
 from couchbase.result import *
 from couchbase.bucketmanager import BucketManager
+from couchbase.items import ItemCollection, ItemSequence
+from couchbase.subdocument import CompiledSpecs
 
 import couchbase.exceptions as exceptions
 from couchbase.views.params import make_dvpath, make_options_string
@@ -39,6 +44,33 @@ def _depr(fn, usage, stacklevel=3):
          stacklevel=stacklevel, category=DeprecationWarning)
 
 
+def _config_cache_path(directory, connstr):
+    """Name of the configuration cache file for a connection string"""
+    digest = sha1(str(connstr).encode('utf-8')).hexdigest()
+    return os.path.join(directory, 'pycbc-{0}.json'.format(digest))
+
+
+def _unwrap_specs(specs):
+    """Allow a single :class:`~.CompiledSpecs` in place of the specs"""
+    if len(specs) == 1 and isinstance(specs[0], CompiledSpecs):
+        return specs[0]
+    return specs
+
+
+def _specs_by_key(keys, specs):
+    """Build the ``key -> specs`` mapping for the subdoc multi methods"""
+    if isinstance(keys, dict):
+        if specs:
+            raise ArgumentError.pyexc(
+                'Specs may not be passed with a dictionary of keys')
+        return dict((k, _unwrap_specs(v)) for k, v in keys.items())
+
+    if not specs:
+        raise ArgumentError.pyexc('One or more specs required')
+    specs = _unwrap_specs(specs)
+    return dict((k, specs) for k in keys)
+
+
 class Pipeline(object):
     def __init__(self, parent):
         """
@@ -147,6 +179,16 @@ class Bucket(_Base):
         :param lockmode: The *lockmode* for threaded access.
             See :ref:`multiple_threads` for more information.
 
+        :param string config_cache_dir: If set, the cluster map is
+            persisted to a file in this directory, named after the
+            connection string. When a bucket with the same connection
+            string is created later (e.g. when a worker process starts),
+            the map is loaded from the file and the constructor returns
+            without waiting for the cluster. The library fetches a new
+            map (and updates the file) as soon as the cached one turns
+            out to be outdated. See :attr:`config_cache_loaded` and
+            :attr:`bootstrap_time`.
+
         :raise: :exc:`.BucketNotFoundError` or :exc:`.AuthError` if
             there is no such bucket to connect to, or if invalid
             credentials were supplied.
@@ -193,6 +235,13 @@ class Bucket(_Base):
                   'config_cache in connection string')
             strcntls['config_cache'] = kwargs.pop('config_cache')
 
+        config_cache_dir = kwargs.pop('config_cache_dir', None)
+        if config_cache_dir is not None:
+            connstr = args[0] if args else kwargs.get(
+                'connection_string', kwargs.get('connstr'))
+            strcntls['config_cache'] = _config_cache_path(config_cache_dir,
+                                                          connstr)
+
         tc = kwargs.get('transcoder')
         if isinstance(tc, type):
             kwargs['transcoder'] = tc()
@@ -214,11 +263,19 @@ class Bucket(_Base):
         for ctl, val in _cntlopts.items():
             self._cntl(ctl, val)
 
+        #: The time (in seconds) the constructor spent connecting to the
+        #: cluster. For asynchronous buckets this only covers scheduling
+        #: the connection
+        self.bootstrap_time = None
+
+        begin = time()
         try:
             self._do_ctor_connect()
         except exceptions.CouchbaseError as e:
             if not _no_connect_exceptions:
                 raise
+        finally:
+            self.bootstrap_time = time() - begin
 
     def _do_ctor_connect(self):
         """This should be overidden by subclasses which want to use a
@@ -281,6 +338,51 @@ class Bucket(_Base):
         """
         return Pipeline(self)
 
+    def key_locations(self, keys):
+        """
+        Determine where each key is stored in the cluster, according to
+        the current cluster map.
+
+        :param keys: An iterable of keys
+        :return: A ``dict`` of ``key -> (vbucket, server_index)``. The
+            server index is ``-1`` if the vBucket currently has no
+            active server
+
+        All keys are mapped in a single call; no network I/O is
+        performed.
+
+        .. seealso:: :meth:`keys_by_node`
+        """
+        keys = list(keys)
+        return dict(zip(keys, self._vbmap_multi(keys)))
+
+    def keys_by_node(self, keys):
+        """
+        Partition keys according to the server owning them, e.g. to
+        dispatch batches of work per node.
+
+        :param keys: An iterable of keys
+        :return: A ``dict`` of ``"host:port" -> [keys]``, where each list
+            keeps the order in which its keys were passed. Keys whose
+            vBucket has no active server are grouped under ``None``
+
+        .. code-block:: python
+
+            for node, node_keys in cb.keys_by_node(all_keys).items():
+                queues[node].put(node_keys)
+
+        The mapping reflects the cluster map when the method is called;
+        operations remain correct if the map changes afterwards.
+        """
+        keys = list(keys)
+        groups = {}
+        for key, (_, ix) in zip(keys, self._vbmap_multi(keys)):
+            try:
+                groups[ix].append(key)
+            except KeyError:
+                groups[ix] = [key]
+        return dict((self._node_host(ix), grp) for ix, grp in groups.items())
+
     # We have these wrappers so that IDEs can do param tooltips and the
     # like. we might move this directly into C some day
 
@@ -732,7 +834,8 @@ class Bucket(_Base):
         """Perform multiple atomic modifications within a document.
 
         :param key: The key of the document to modify
-        :param specs: A list of specs (See :mod:`.couchbase.subdocument`)
+        :param specs: A list of specs (See :mod:`.couchbase.subdocument`),
+            or a single :class:`~.couchbase.subdocument.CompiledSpecs`
         :param kwargs: CAS, etc.
         :return: A :class:`~.couchbase.result.SubdocResult` object.
 
@@ -747,13 +850,15 @@ class Bucket(_Base):
 
         .. seealso:: :mod:`.couchbase.subdocument`
         """
-        return super(Bucket, self).mutate_in(key, specs, **kwargs)
+        return super(Bucket, self).mutate_in(key, _unwrap_specs(specs),
+                                             **kwargs)
 
     def lookup_in(self, key, *specs, **kwargs):
         """Atomically retrieve one or more paths from a document.
 
         :param key: The key of the document to lookup
-        :param spec: A list of specs (see :mod:`.couchbase.subdocument`)
+        :param spec: A list of specs (see :mod:`.couchbase.subdocument`),
+            or a single :class:`~.couchbase.subdocument.CompiledSpecs`
         :return: A :class:`.couchbase.result.SubdocResult` object.
             This object contains the results and any errors of the
             operation.
@@ -772,7 +877,56 @@ class Bucket(_Base):
 
         .. seealso:: :meth:`retrieve_in` which acts as a convenience wrapper
         """
-        return super(Bucket, self).lookup_in({key: specs}, **kwargs)
+        return super(Bucket, self).lookup_in({key: _unwrap_specs(specs)},
+                                             **kwargs)
+
+    def lookup_in_multi(self, keys, *specs, **kwargs):
+        """Atomically retrieve the same paths from multiple documents.
+
+        :param keys: The keys of the documents to lookup. This may also be
+            a dictionary mapping each key to its own tuple of specs, in
+            which case `specs` must be empty
+        :param specs: The specs to apply to every key
+            (see :mod:`.couchbase.subdocument`), or a single
+            :class:`~.couchbase.subdocument.CompiledSpecs`
+        :param quiet: Whether to suppress errors for missing documents
+        :return: A :class:`~.MultiResult` containing a
+            :class:`~.couchbase.result.SubdocResult` for each key. All
+            results refer to the same specs.
+
+        All lookups are scheduled together, and the specs are only
+        converted once if they are compiled::
+
+            import couchbase.subdocument as SD
+            fields = SD.compile(SD.get('name'), SD.get('email'))
+            for key, rv in cb.lookup_in_multi(user_ids, fields).items():
+                name, email = rv
+
+        .. seealso:: :meth:`lookup_in`
+        """
+        return super(Bucket, self).lookup_in_multi(
+            _specs_by_key(keys, specs), **kwargs)
+
+    def mutate_in_multi(self, keys, *specs, **kwargs):
+        """Perform the same modifications within multiple documents.
+
+        :param keys: The keys of the documents to modify, or a dictionary
+            mapping each key to its own tuple of specs
+        :param specs: The specs to apply to every key
+            (see :mod:`.couchbase.subdocument`), or a single
+            :class:`~.couchbase.subdocument.CompiledSpecs`
+        :param kwargs: ``ttl``, ``persist_to`` and ``replicate_to``,
+            applied to every key
+        :return: A :class:`~.MultiResult` containing a
+            :class:`~.couchbase.result.SubdocResult` for each key
+
+        Each document is modified atomically, but the batch as a whole
+        is not.
+
+        .. seealso:: :meth:`mutate_in`
+        """
+        return super(Bucket, self).mutate_in_multi(
+            _specs_by_key(keys, specs), **kwargs)
 
     def retrieve_in(self, key, *paths, **kwargs):
         """Atomically fetch one or more paths from a document.
@@ -1063,7 +1217,8 @@ class Bucket(_Base):
                                    persist_to=persist_to,
                                    replicate_to=replicate_to)
 
-    def get_multi(self, keys, ttl=0, quiet=None, replica=False, no_format=False):
+    def get_multi(self, keys, ttl=0, quiet=None, replica=False, no_format=False,
+                  compact=False):
         """Get multiple keys. Multi variant of :meth:`get`
 
         :param keys: keys the keys to fetch
@@ -1073,12 +1228,45 @@ class Bucket(_Base):
             Whether the results should be obtained from a replica
             instead of the master. See :meth:`get` for more information
             about this parameter.
+        :param boolean compact: Store the results in a
+            :class:`~.CompactMultiResult`, which only creates a
+            :class:`~.ValueResult` for the keys that are looked up. This
+            saves memory (and garbage collection time) for large batches
+            where only the values are needed. Cannot be used with
+            :class:`~couchbase.items.Item` collections, in a
+            :meth:`pipeline`, nor with the Twisted API.
         :return: A :class:`~.MultiResult` object. This is a dict-like
             object  and contains the keys (passed as) `keys` as the
             dictionary keys, and :class:`~.Result` objects as values
         """
-        return _Base.get_multi(self, keys, ttl=ttl, quiet=quiet,
-                               replica=replica, no_format=no_format)
+        if not compact:
+            return _Base.get_multi(self, keys, ttl=ttl, quiet=quiet,
+                                   replica=replica, no_format=no_format)
+
+        if self._privflags & _LCB.PYCBC_CONN_F_ASYNC:
+            # The result would still be pending, and cannot be wrapped yet
+            raise ArgumentError.pyexc(
+                'compact is not supported by asynchronous buckets')
+
+        return self._get_multi_compact(lambda mres: mres, keys, ttl=ttl,
+                                       quiet=quiet, replica=replica,
+                                       no_format=no_format)
+
+    def _get_multi_compact(self, wait, keys, **kwargs):
+        """
+        Perform a ``get_multi(compact=True)``.
+
+        :param wait: Called with the raw result, and returns it once the
+            operation is complete. Asynchronous subclasses which can block
+            on their results (e.g. gevent) pass their wait function here
+        """
+        try:
+            mres = wait(_Base.get_multi(self, keys, compact=True, **kwargs))
+        except CouchbaseError as e:
+            if isinstance(e.all_results, MultiResult):
+                e.all_results = CompactMultiResult(e.all_results)
+            raise
+        return CompactMultiResult(mres)
 
     def touch_multi(self, keys, ttl=0):
         """Touch multiple keys. Multi variant of :meth:`touch`
@@ -1435,6 +1623,32 @@ class Bucket(_Base):
 
         return rv
 
+    def get_items(self, items, **kwargs):
+        """
+        Retrieve multiple :class:`~.Item` objects, updating them in place.
+
+        The ``value``, ``cas`` and ``flags`` fields of each `Item` are
+        replaced with those retrieved from the server, and its ``rc`` field
+        reflects the status of this retrieval. No new result objects are
+        created, so a long-lived set of items may be refreshed repeatedly.
+        The value of an item which could not be retrieved is left
+        unchanged; check its ``success`` field.
+
+        :param items: The items to retrieve
+        :type items: :class:`~couchbase.items.ItemCollection`, or a list
+            of :class:`~.Item` objects
+
+        The rest of the options are passed verbatim to :meth:`get_multi`
+
+        :return: A :class:`~couchbase.result.MultiResult` whose values
+            are the items passed
+
+        .. seealso:: :meth:`get_multi`
+        """
+        if not isinstance(items, ItemCollection):
+            items = ItemSequence(items)
+        return self.get_multi(items, **kwargs)
+
     @property
     def closed(self):
         """Returns True if the object has been closed with :meth:`_close`"""
@@ -1517,6 +1731,18 @@ class Bucket(_Base):
         mode = self._cntl(op=_LCB.LCB_CNTL_SSL_MODE, value_type='int')
         return mode & _LCB.LCB_SSL_ENABLED != 0
 
+    @property
+    def config_cache_loaded(self):
+        """
+        Read-only boolean property indicating whether the cluster map
+        was loaded from the configuration cache, rather than fetched
+        from the cluster during bootstrap.
+
+        .. seealso:: The `config_cache_dir` parameter of :meth:`__init__`
+        """
+        return self._cntl(op=_LCB.LCB_CNTL_CONFIG_CACHE_LOADED,
+                          value_type='int') != 0
+
     _OLDOPS = { 'set': 'upsert', 'add': 'insert', 'delete': 'remove'}
     for o, n in _OLDOPS.items():
         for variant in ('', '_multi'):
@@ -1546,7 +1772,7 @@ class Bucket(_Base):
                              'observe', 'rget', 'stats',
                              'set', 'add', 'delete', 'lookup_in', 'mutate_in')
 
-    _MEMCACHED_NOMULTI = ('stats', 'lookup_in', 'mutate_in')
+    _MEMCACHED_NOMULTI = ('stats',)
 
     @classmethod
     def _gen_memd_wrappers(cls, factory):
@@ -23,6 +23,11 @@ import couchbase.exceptions as exceptions
 from couchbase.exceptions import CouchbaseError, ArgumentError
 from couchbase.views.params import Query, SpatialQuery, STALE_OK
 from couchbase._pyport import single_dict_key
+from couchbase.retry import RetryPolicy
+
+# Delays between the rounds of design document polling
+_POLL_BACKOFF = RetryPolicy(initial_backoff=0.05, max_backoff=1.0,
+                            multiplier=1.5, jitter=0.5)
 
 class BucketManager(object):
     """
@@ -78,17 +83,36 @@ class BucketManager(object):
             pass
         return True
 
-    def _design_poll(self, name, mode, oldres, timeout=5, use_devmode=False):
+    def _design_ready(self, name, mode, old_rev, use_devmode):
         """
-        Poll for an 'async' action to be complete.
-        :param string name: The name of the design document
-        :param string mode: One of ``add`` or ``del`` to indicate whether
-            we should check for addition or deletion of the document
-        :param oldres: The old result from the document's previous state, if
-            any
+        Check once whether an 'async' design action has completed.
+        :return: True if the action is complete
+        """
+        try:
+            cur_resp = self.design_get(name, use_devmode=use_devmode)
+        except CouchbaseError:
+            # Deleted, whopee!
+            return mode == 'del'
+
+        if old_rev and self._doc_rev(cur_resp) == old_rev:
+            return False
+
+        try:
+            return self._poll_vq_single(name, use_devmode, cur_resp.value)
+        except CouchbaseError:
+            return False
+
+    def _design_poll_multi(self, pending, timeout=5):
+        """
+        Poll for several 'async' actions to be complete.
+        :param dict pending: A dictionary of ``name -> (mode, old_rev,
+            use_devmode)`` for the design documents to check. See
+            :meth:`_design_poll` for the meaning of `mode`
         :param float timeout: How long to poll for. If this is 0 then this
             function returns immediately
-        :type oldres: :class:`~couchbase.result.HttpResult`
+
+        All remaining documents are checked in each round, and the delay
+        between rounds grows (with jitter) while some are still pending.
         """
         if not timeout:
             return True
@@ -97,33 +121,46 @@ class BucketManager(object):
             raise ArgumentError.pyexc("Interval must not be negative")
 
         t_end = time.time() + timeout
-        old_rev = None
-
-        if oldres:
-            old_rev = self._doc_rev(oldres)
+        pending = dict(pending)
+        attempt = 0
 
-        while time.time() < t_end:
-            try:
-                cur_resp = self.design_get(name, use_devmode=use_devmode)
-                if old_rev and self._doc_rev(cur_resp) == old_rev:
-                    continue
+        while True:
+            for name, (mode, old_rev, use_devmode) in list(pending.items()):
+                if self._design_ready(name, mode, old_rev, use_devmode):
+                    del pending[name]
 
-                try:
-                    if not self._poll_vq_single(
-                            name, use_devmode, cur_resp.value):
-                        continue
-                    return True
+            if not pending:
+                return True
 
-                except CouchbaseError:
-                    continue
+            remaining = t_end - time.time()
+            if remaining <= 0:
+                break
 
-            except CouchbaseError:
-                if mode == 'del':
-                    # Deleted, whopee!
-                    return True
+            attempt += 1
+            time.sleep(min(_POLL_BACKOFF.backoff(attempt), remaining))
 
         raise exceptions.TimeoutError.pyexc(
-            "Wait time for design action completion exceeded")
+            "Wait time for design action completion exceeded",
+            sorted(pending))
+
+    def _design_poll(self, name, mode, oldres, timeout=5, use_devmode=False):
+        """
+        Poll for an 'async' action to be complete.
+        :param string name: The name of the design document
+        :param string mode: One of ``add`` or ``del`` to indicate whether
+            we should check for addition or deletion of the document
+        :param oldres: The old result from the document's previous state, if
+            any
+        :param float timeout: How long to poll for. If this is 0 then this
+            function returns immediately
+        :type oldres: :class:`~couchbase.result.HttpResult`
+        """
+        old_rev = None
+        if timeout and oldres:
+            old_rev = self._doc_rev(oldres)
+
+        return self._design_poll_multi({name: (mode, old_rev, use_devmode)},
+                                       timeout=timeout)
 
     def design_create(self, name, ddoc, use_devmode=True, syncwait=0):
         """
@@ -187,6 +224,45 @@ class BucketManager(object):
                           use_devmode=use_devmode)
         return ret
 
+    def design_create_multi(self, ddocs, use_devmode=True, syncwait=0):
+        """
+        Store several design documents, and optionally wait for all of
+        them to be ready.
+
+        :param dict ddocs: A dictionary of ``name -> ddoc``. See
+            :meth:`design_create`
+        :param bool use_devmode: See :meth:`design_create`
+        :param float syncwait: How long to poll, in total, for all the
+            documents to be ready. The documents are polled together, so
+            this does not need to grow with the number of documents
+        :return: A dictionary of ``name ->``
+            :class:`~couchbase.result.HttpResult`
+        :raise: :exc:`couchbase.exceptions.TimeoutError` if ``syncwait``
+            was specified and not all documents could be verified within
+            the interval. The names of the documents still pending are in
+            the exception's :attr:`objextra`
+
+        .. seealso:: :meth:`design_create`
+        """
+        pending = {}
+        ret = {}
+        for name, ddoc in ddocs.items():
+            dname = self._mk_devmode(name, use_devmode)
+            old_rev = None
+            if syncwait:
+                try:
+                    old_rev = self._doc_rev(
+                        self.design_get(dname, use_devmode=False))
+                except CouchbaseError:
+                    pass
+
+            ret[name] = self.design_create(name, ddoc,
+                                           use_devmode=use_devmode)
+            pending[dname] = ('add', old_rev, use_devmode)
+
+        self._design_poll_multi(pending, timeout=syncwait)
+        return ret
+
     def design_get(self, name, use_devmode=True):
         """
         Retrieve a design document
@@ -0,0 +1,175 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Node-aware execution of large bulk operations.
+
+A single ``*_multi`` call completes only once its slowest key has
+completed, so one slow node holds up the keys of all other nodes.
+:class:`NodeScheduler` partitions the keys by the node owning them (see
+:meth:`~couchbase.bucket.Bucket.keys_by_node`) and gives each node its
+own connection and thread. Each node is sent batches of at most
+`max_inflight` keys, one batch at a time, so a slow node only delays its
+own keys, and throughput grows with the number of nodes.
+"""
+from threading import Lock, Thread
+
+from couchbase.exceptions import ArgumentError, CouchbaseError
+from couchbase.result import MultiResult
+from couchbase._pyport import xrange
+
+
+class NodeScheduler(object):
+    def __init__(self, connect, max_inflight=256):
+        """
+        Scheduler running bulk operations with one connection per node.
+
+        :param connect: A callable taking no arguments and returning a new
+            :class:`~couchbase.bucket.Bucket`, e.g.
+            ``partial(Bucket, 'couchbase://host/bucket')``. It is called
+            once to map keys to nodes, and once for each node
+        :param int max_inflight: The maximum number of keys outstanding
+            against a single node
+
+        .. code-block:: python
+
+            sched = NodeScheduler(partial(Bucket, connstr), max_inflight=512)
+            results = sched.run('get_multi', keys, quiet=True)
+            sched.close()
+
+        Connections are kept between calls to :meth:`run`. A node's
+        connection is only ever used by one thread at a time.
+        """
+        if max_inflight < 1:
+            raise ArgumentError.pyexc('max_inflight must be at least 1',
+                                      max_inflight)
+        self._connect = connect
+        self.max_inflight = max_inflight
+        self._router = connect()
+        self._buckets = {}
+        self._lock = Lock()
+
+    def _bucket_for(self, node):
+        with self._lock:
+            bucket = self._buckets.get(node)
+        if bucket is not None:
+            return bucket
+
+        # Connect without holding the lock, so the connections to all
+        # nodes are established in parallel
+        bucket = self._connect()
+        with self._lock:
+            return self._buckets.setdefault(node, bucket)
+
+    def partition(self, keys):
+        """
+        :param keys: An iterable of keys
+        :return: A ``dict`` of ``node -> [keys]``. See
+            :meth:`~couchbase.bucket.Bucket.keys_by_node`
+        """
+        return self._router.keys_by_node(keys)
+
+    def _run_node(self, node, meth_name, keys, values, args, kwargs, out):
+        bucket = self._bucket_for(node)
+        meth = getattr(bucket, meth_name)
+        for ix in xrange(0, len(keys), self.max_inflight):
+            batch = keys[ix:ix + self.max_inflight]
+            if values is not None:
+                batch = dict((k, values[k]) for k in batch)
+            try:
+                out.append((meth(batch, *args, **kwargs), None))
+            except CouchbaseError as e:
+                out.append((e.all_results, e))
+            except Exception as e:
+                out.append((None, e))
+                return
+
+    def run(self, meth_name, keys, *args, **kwargs):
+        """
+        Execute a ``*_multi`` operation, with the keys of each node
+        handled by that node's own connection and thread.
+
+        :param string meth_name: The name of the multi method, e.g.
+            ``'get_multi'`` or ``'upsert_multi'``
+        :param keys: The keys, or a ``dict`` of ``key -> value`` for
+            methods which take one
+        :param args: Additional positional arguments for the method
+        :param kwargs: Additional keyword arguments for the method
+        :return: A :class:`~couchbase.result.MultiResult` containing the
+            result of every key
+        :raise: The first exception raised by any batch, once *all*
+            nodes are done. If it is a
+            :exc:`~couchbase.exceptions.CouchbaseError`, its
+            :attr:`all_results` contains the results of every key.
+        """
+        values = keys if isinstance(keys, dict) else None
+        groups = self.partition(keys)
+
+        outputs = []
+        threads = []
+        for node, node_keys in groups.items():
+            out = []
+            outputs.append(out)
+            threads.append(Thread(
+                target=self._run_node,
+                args=(node, meth_name, node_keys, values, args, kwargs, out)))
+
+        for t in threads:
+            t.daemon = True
+            t.start()
+        for t in threads:
+            t.join()
+
+        results = []
+        err = None
+        for out in outputs:
+            for mres, exc in out:
+                if mres is not None:
+                    results.append(mres)
+                if exc is not None and err is None:
+                    err = exc
+
+        if err is not None and (not results or
+                                not isinstance(err, CouchbaseError)):
+            raise err
+
+        # Merge into a result object whose all_ok is accurate
+        merged = None
+        for mres in results:
+            if not getattr(mres, 'all_ok', True):
+                merged = mres
+                break
+        if merged is None:
+            if not results:
+                return MultiResult()
+            merged = results[0]
+        for mres in results:
+            if mres is not merged:
+                merged.update(mres)
+
+        if err is not None:
+            err.all_results = merged
+            raise err
+        return merged
+
+    def close(self):
+        """
+        Drop the per-node connections. They are recreated as needed if
+        the scheduler is used again
+        """
+        with self._lock:
+            self._buckets.clear()
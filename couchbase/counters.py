@@ -0,0 +1,142 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Counters which are spread over several keys.
+
+Every increment of a counter stored in a single key is handled by the
+one server owning that key, and concurrent increments of it contend for
+the same document. A :class:`ShardedCounter` stores its value as the sum
+of several *shard* keys (which map to different vBuckets, and usually to
+different servers), spreads increments over them, and reads the total
+back with a single batched get.
+"""
+from random import randrange
+
+from couchbase.exceptions import ArgumentError
+from couchbase._pyport import xrange
+
+
+class ShardedCounter(object):
+    def __init__(self, parent, key, nshards=16, ttl=0):
+        """
+        Counter whose value is the sum of `nshards` keys.
+
+        :param parent: The :class:`~couchbase.bucket.Bucket` to use
+        :param string key: The name of the counter. Shards are stored
+            under ``key::0`` through ``key::<nshards - 1>``
+        :param int nshards: The number of shards. All clients of the
+            same counter must use the same number of shards
+        :param int ttl: The expiration applied to the shards whenever
+            they are modified
+
+        Shards are created on demand, so a new counter has a value of
+        ``0`` until it is first incremented.
+
+        .. code-block:: python
+
+            views = ShardedCounter(cb, 'page_views', nshards=32)
+            views.incr()
+            views.incr_multi([1, 1, 5])
+            print(views.value())
+
+        .. note::
+
+            Only increments are supported. The server never decrements a
+            counter below zero, so decrementing individual shards would
+            not reliably decrement the total.
+        """
+        if nshards < 1:
+            raise ArgumentError.pyexc('nshards must be at least 1', nshards)
+
+        self._parent = parent
+        self.key = key
+        self.ttl = ttl
+
+        #: The keys of the shards
+        self.shard_keys = ['{0}::{1}'.format(key, ix)
+                           for ix in xrange(nshards)]
+
+        # Start at a random shard, so that many clients do not all
+        # begin with the same key
+        self._next = randrange(nshards)
+
+    def _next_shard(self):
+        key = self.shard_keys[self._next]
+        self._next = (self._next + 1) % len(self.shard_keys)
+        return key
+
+    def incr(self, delta=1):
+        """
+        Add `delta` to the counter, using the next shard.
+
+        :param int delta: The (non-negative) amount to add
+        :return: The :class:`~.ValueResult` of the shard modified. Its
+            `value` is the value of the shard, not of the counter
+        """
+        if delta < 0:
+            raise ArgumentError.pyexc('delta must not be negative', delta)
+        return self._parent.counter(self._next_shard(), delta=delta,
+                                    initial=delta, ttl=self.ttl)
+
+    def incr_multi(self, deltas):
+        """
+        Add several amounts to the counter with a single batched
+        operation.
+
+        :param deltas: An iterable of (non-negative) amounts. These are
+            distributed over the shards and summed per shard before being
+            sent, so at most one operation is performed per shard
+        :return: A :class:`~.MultiResult` of the shards modified
+        """
+        per_shard = {}
+        for delta in deltas:
+            if delta < 0:
+                raise ArgumentError.pyexc('delta must not be negative', delta)
+            key = self._next_shard()
+            per_shard[key] = per_shard.get(key, 0) + delta
+
+        return self._parent.counter_multi(
+            dict((k, {'delta': d, 'initial': d})
+                 for k, d in per_shard.items()),
+            ttl=self.ttl)
+
+    def shard_values(self):
+        """
+        :return: A ``dict`` of ``shard_key -> value`` for the shards
+            which exist
+        """
+        rv = self._parent.get_multi(self.shard_keys, quiet=True,
+                                    compact=True)
+        return rv.value_dict()
+
+    def value(self):
+        """
+        Retrieve the current value of the counter, with a single batched
+        get of all its shards.
+
+        :return: The sum of all the shards
+        """
+        rv = self._parent.get_multi(self.shard_keys, quiet=True,
+                                    compact=True)
+        return sum(v for v in rv.values() if v is not None)
+
+    def reset(self):
+        """
+        Remove all the shards, so that the counter's value is ``0``
+        """
+        self._parent.remove_multi(self.shard_keys, quiet=True)
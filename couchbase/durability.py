@@ -0,0 +1,222 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Batched durability checking for bulk mutations.
+
+Passing ``persist_to`` or ``replicate_to`` to a ``*_multi`` mutation
+checks the durability of each key independently, as soon as that key's
+mutation completes. For large batches it is cheaper to perform all the
+mutations first and then check all keys together with a single
+:meth:`~couchbase.bucket.Bucket.endure_multi` call: the library then
+combines the status requests for all keys on a given server into one
+request per polling interval.
+
+:class:`BatchEndure` does this, polling with a short interval at first
+(for keys which persist quickly) and backing off for keys which take
+longer, and records how long each key took to become durable.
+"""
+from bisect import bisect_left
+from time import time
+
+from couchbase.exceptions import (
+    ArgumentError, CouchbaseError, TimeoutError, exc_from_rc)
+
+
+class DurabilityHistogram(object):
+    #: Upper bounds (in seconds) of the histogram buckets
+    BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+              1.0, 2.0, 5.0, 10.0)
+
+    def __init__(self):
+        """
+        Histogram of the time taken for keys to satisfy their durability
+        requirements.
+        """
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0
+
+    def add(self, seconds, count=1):
+        self.counts[bisect_left(self.BOUNDS, seconds)] += count
+        self.total += count
+
+    def percentile(self, pct):
+        """
+        :param float pct: A percentile, between 0 and 100
+        :return: The upper bound (in seconds) of the bucket containing the
+            given percentile, or ``None`` if the histogram is empty. The
+            last bucket has no upper bound and yields ``float('inf')``
+        """
+        if not self.total:
+            return None
+        wanted = self.total * pct / 100.0
+        seen = 0
+        for ix, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= wanted:
+                break
+        return self.BOUNDS[ix] if ix < len(self.BOUNDS) else float('inf')
+
+    def as_dict(self):
+        """
+        :return: A dictionary of ``upper_bound -> count``
+        """
+        bounds = self.BOUNDS + (float('inf'),)
+        return dict(zip(bounds, self.counts))
+
+    def clear(self):
+        self.counts = [0] * len(self.counts)
+        self.total = 0
+
+
+class BatchEndure(object):
+    def __init__(self, parent, persist_to=-1, replicate_to=-1, timeout=5.0,
+                 initial_interval=0.001, max_interval=0.1, multiplier=2.0,
+                 polls_per_round=4):
+        """
+        Check durability requirements of many keys together.
+
+        :param parent: The :class:`~couchbase.bucket.Bucket` to use
+        :param int persist_to: See :meth:`~couchbase.bucket.Bucket.endure`
+        :param int replicate_to: See
+            :meth:`~couchbase.bucket.Bucket.endure`
+        :param float timeout: Total time, in seconds, allowed for all
+            keys to satisfy the requirements
+        :param float initial_interval: The polling interval used at first
+        :param float max_interval: The polling interval is increased by
+            `multiplier` each round, up to this value
+        :param int polls_per_round: How many times each interval is used
+            before it is increased
+
+        .. code-block:: python
+
+            be = BatchEndure(cb, persist_to=1)
+            be.upsert_multi(docs)
+            print(be.histogram.percentile(99))
+        """
+        if persist_to == 0 and replicate_to == 0:
+            raise ArgumentError.pyexc(
+                'persist_to and/or replicate_to must be specified')
+
+        self._parent = parent
+        self.persist_to = persist_to
+        self.replicate_to = replicate_to
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.polls_per_round = polls_per_round
+
+        #: :class:`DurabilityHistogram` of the time taken by keys to
+        #: become durable, measured from the start of :meth:`endure`
+        self.histogram = DurabilityHistogram()
+
+    def endure(self, results, check_removed=False):
+        """
+        Wait until all successful results in `results` satisfy the
+        durability requirements.
+
+        :param results: A :class:`~couchbase.result.MultiResult` (or
+            ``dict``) of results from a mutation, or a ``dict`` of
+            ``key -> cas``
+        :param bool check_removed: Whether the mutation was a removal
+        :return: A ``dict`` of ``key ->`` :class:`~.OperationResult`
+        :raise: :exc:`~couchbase.exceptions.CouchbaseError` if some keys
+            could not satisfy the requirements. Its :attr:`all_results`
+            contains the durability result of every key.
+        """
+        pending = {}
+        for k, v in results.items():
+            if hasattr(v, 'success'):
+                if not v.success:
+                    continue
+                v = v.cas
+            pending[k] = v
+
+        begin = time()
+        deadline = begin + self.timeout
+        interval = self.initial_interval
+        final = {}
+        err = None
+
+        while pending:
+            round_timeout = min(max(deadline - time(), 0.001),
+                                interval * self.polls_per_round)
+            try:
+                mres = self._parent.endure_multi(
+                    pending, persist_to=self.persist_to,
+                    replicate_to=self.replicate_to, timeout=round_timeout,
+                    interval=interval, check_removed=check_removed)
+                err = None
+            except CouchbaseError as e:
+                if not e.all_results:
+                    raise
+                mres = e.all_results
+                err = e
+
+            done = 0
+            for k, v in mres.items():
+                if v.success:
+                    done += 1
+                elif TimeoutError._can_derive(v.rc):
+                    continue
+                final[k] = v
+                del pending[k]
+            self.histogram.add(time() - begin, done)
+
+            if time() >= deadline:
+                # Keys still pending have timed out
+                for k in pending:
+                    final[k] = mres[k]
+                break
+
+            interval = min(interval * self.multiplier, self.max_interval)
+
+        failed = [v for v in final.values() if not v.success]
+        if failed:
+            if err is None:
+                err = exc_from_rc(failed[0].rc,
+                                  'Durability requirements not satisfied')
+            err.all_results = final
+            raise err
+        return final
+
+    def _mutate(self, meth, keys, args, kwargs, check_removed=False):
+        return self.endure(meth(keys, *args, **kwargs),
+                           check_removed=check_removed)
+
+    def upsert_multi(self, keys, *args, **kwargs):
+        """
+        Perform :meth:`~couchbase.bucket.Bucket.upsert_multi` and then
+        wait for durability of all keys. Returns the result of
+        :meth:`endure`.
+        """
+        return self._mutate(self._parent.upsert_multi, keys, args, kwargs)
+
+    def insert_multi(self, keys, *args, **kwargs):
+        """Like :meth:`upsert_multi`, but for inserts"""
+        return self._mutate(self._parent.insert_multi, keys, args, kwargs)
+
+    def replace_multi(self, keys, *args, **kwargs):
+        """Like :meth:`upsert_multi`, but for replacements"""
+        return self._mutate(self._parent.replace_multi, keys, args,
+                            kwargs)
+
+    def remove_multi(self, keys, *args, **kwargs):
+        """Like :meth:`upsert_multi`, but for removals"""
+        return self._mutate(self._parent.remove_multi, keys, args, kwargs,
+                            check_removed=True)
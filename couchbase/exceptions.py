@@ -109,6 +109,16 @@ class CouchbaseError(Exception):
         """
         return issubclass(cls.rc_to_exctype(rc), cls)
 
+    # Defaults for the attributes not passed to the constructor. Keeping
+    # them on the class means only the parameters actually supplied are
+    # set on the instance.
+    result = None
+    inner_cause = None
+    csrc_info = ()
+    key = None
+    objextra = None
+    message = None
+
     def __init__(self, params=None):
         if isinstance(params, str):
             params = {'message': params}
@@ -116,14 +126,10 @@ class CouchbaseError(Exception):
             self.__dict__.update(params.__dict__)
             return
 
-        self.rc = params.get('rc', self.CODE)
-        self.all_results = params.get('all_results', {})
-        self.result = params.get('result', None)
-        self.inner_cause = params.get('inner_cause', None)
-        self.csrc_info = params.get('csrc_info', ())
-        self.key = params.get('key', None)
-        self.objextra = params.get('objextra', None)
-        self.message = params.get('message', None)
+        self.rc = self.CODE
+        self.all_results = {}
+        if params:
+            self.__dict__.update(params)
 
     @classmethod
     def pyexc(cls, message=None, obj=None, inner=None):
@@ -611,6 +617,11 @@ for rc, oldcls in _LCB_ERRNO_MAP.items():
     del newcls
     del oldcls
 
+# Recorded for a key whose value could not be decoded. Added only now, so
+# that ValueFormatError.CODE (and thus the rc of other encoding errors)
+# remains 0
+_LCB_ERRNO_MAP[C.PYCBC_ERR_DECODE] = ValueFormatError
+
 _EXCTYPE_MAP = {
     C.PYCBC_EXC_ARGUMENTS:  ArgumentError,
     C.PYCBC_EXC_ENCODING:   ValueFormatError,
@@ -0,0 +1,202 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Hedged reads against replicas.
+
+A hedged read first issues a normal ``get`` to the active node. If no
+response has arrived after a delay derived from the observed latency of
+previous reads (e.g. their 95th percentile), a replica read is issued as
+well, and whichever of the two answers first is used. This trims the tail
+latency caused by a single slow node (for example during rebalance or a
+garbage collection pause) at the cost of a small amount of extra load.
+
+Hedging requires that both reads be in flight at the same time, and is
+therefore offered by the asynchronous :mod:`txcouchbase` and
+:mod:`acouchbase` buckets (``getHedged`` and ``get_hedged`` respectively).
+"""
+from collections import deque
+from time import time
+
+from couchbase.exceptions import ArgumentError, CouchbaseError
+
+
+class HedgePolicy(object):
+    def __init__(self, percentile=95.0, window=1024, min_samples=32,
+                 initial_delay=0.01, min_delay=0.001, max_delay=1.0):
+        """
+        Policy and statistics for hedged reads. A single policy object
+        is meant to be shared by all hedged reads against a bucket, so
+        that the hedging delay follows that bucket's latency.
+
+        :param float percentile: The percentile (0-100) of recent read
+            latencies after which the replica read is issued
+        :param int window: How many recent latency samples to consider
+        :param int min_samples: How many samples must be collected before
+            the percentile is used in place of `initial_delay`
+        :param float initial_delay: Delay (in seconds) used until enough
+            samples were collected
+        :param float min_delay: Lower bound for the computed delay
+        :param float max_delay: Upper bound for the computed delay
+        """
+        if not 0 < percentile <= 100:
+            raise ArgumentError.pyexc('percentile must be in (0, 100]',
+                                      percentile)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+        self._samples = deque(maxlen=window)
+        self._refresh_every = max(1, window // 16)
+        self._since_refresh = 0
+        self._delay = None
+
+        #: Number of hedged reads performed
+        self.total = 0
+        #: Number of reads for which a replica read was issued
+        self.fired = 0
+        #: Number of reads answered by the replica
+        self.won = 0
+
+    def record(self, latency):
+        """
+        Record the latency (in seconds) of a read against the active node
+        """
+        self._samples.append(latency)
+        self._since_refresh += 1
+        if self._since_refresh >= self._refresh_every:
+            self._delay = None
+
+    @property
+    def delay(self):
+        """
+        The current hedging delay, in seconds
+        """
+        if len(self._samples) < self.min_samples:
+            return self.initial_delay
+
+        if self._delay is None:
+            ordered = sorted(self._samples)
+            ix = int(len(ordered) * self.percentile / 100.0)
+            delay = ordered[min(ix, len(ordered) - 1)]
+            self._delay = min(max(delay, self.min_delay), self.max_delay)
+            self._since_refresh = 0
+
+        return self._delay
+
+    def stats(self):
+        """
+        :return: A dictionary with the ``total``, ``fired`` and ``won``
+            counters as well as the current ``delay``
+        """
+        return {'total': self.total, 'fired': self.fired, 'won': self.won,
+                'delay': self.delay}
+
+    def reset_stats(self):
+        """
+        Reset the counters. Latency samples are retained.
+        """
+        self.total = self.fired = self.won = 0
+
+
+def _is_recoverable(err):
+    """
+    Whether the error of the active read may be caused by the active node
+    itself (rather than by the data), so that a replica may still succeed.
+    `err` is either an exception or a Twisted ``Failure`` wrapping one.
+    """
+    if not isinstance(err, CouchbaseError):
+        err = getattr(err, 'value', None)
+    if not isinstance(err, CouchbaseError):
+        return False
+    return bool(err.is_transient or err.is_network)
+
+
+class HedgedRead(object):
+    def __init__(self, policy, on_ok, on_err):
+        """
+        Tracks the state of a single hedged read. Used internally by the
+        asynchronous bucket implementations, which feed it the outcome of
+        the active and replica reads as they arrive.
+
+        :param policy: The :class:`HedgePolicy` in use
+        :param on_ok: Called with the winning result
+        :param on_err: Called with the error of the active read, if it
+            fails before the replica read succeeds. Once the replica read
+            was issued, a transient or network error of the active read is
+            only delivered if the replica read fails as well
+        """
+        self.policy = policy
+        self._on_ok = on_ok
+        self._on_err = on_err
+        self._start = time()
+        self._done = False
+        self._fired = False
+        self._held_err = None
+        self.cancel_timer = None
+        policy.total += 1
+
+    def fire(self):
+        """
+        Called when the hedging delay expires.
+
+        :return: True if the replica read should be issued
+        """
+        if self._done:
+            return False
+        self._fired = True
+        self.policy.fired += 1
+        return True
+
+    def _finish(self):
+        self._done = True
+        if not self._fired and self.cancel_timer:
+            self.cancel_timer()
+        self.cancel_timer = None
+
+    def active_ok(self, res):
+        self.policy.record(time() - self._start)
+        if self._done:
+            return
+        self._finish()
+        self._on_ok(res)
+
+    def active_err(self, err):
+        if self._done:
+            return
+        if self._fired and _is_recoverable(err):
+            # The replica read may still succeed
+            self._held_err = err
+            return
+        self._finish()
+        self._on_err(err)
+
+    def replica_ok(self, res):
+        if self._done:
+            return
+        self.policy.won += 1
+        self._finish()
+        self._on_ok(res)
+
+    def replica_err(self, err):
+        # The active read remains authoritative for errors
+        if self._done or self._held_err is None:
+            return
+        self._finish()
+        self._on_err(self._held_err)
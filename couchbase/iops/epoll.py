@@ -0,0 +1,203 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Pure-Python I/O plugin built on the :mod:`selectors` module, which uses
+``epoll`` (or ``kqueue``, etc.) where available.
+
+Unlike :class:`~couchbase.iops.select.SelectIOPS`, sockets remain
+registered with the selector between polls and are only modified when
+their watched events change, and timers are kept in a heap. The cost of
+each poll is therefore proportional to the number of *ready* sockets and
+*expired* timers, rather than to the total number of sockets and timers.
+"""
+from __future__ import absolute_import
+
+from heapq import heappush, heappop, heapify
+from itertools import count
+import selectors
+
+try:
+    from time import monotonic as _now
+except ImportError:
+    from time import time as _now
+
+from couchbase._libcouchbase import (
+    Event, TimerEvent,
+    LCB_READ_EVENT, LCB_WRITE_EVENT,
+    PYCBC_EVSTATE_ACTIVE,
+    PYCBC_EVACTION_WATCH
+)
+
+_EVENTMAP = {
+    LCB_READ_EVENT: selectors.EVENT_READ,
+    LCB_WRITE_EVENT: selectors.EVENT_WRITE,
+    LCB_READ_EVENT | LCB_WRITE_EVENT:
+        selectors.EVENT_READ | selectors.EVENT_WRITE
+}
+
+
+class EpollTimer(TimerEvent):
+    def __init__(self):
+        super(EpollTimer, self).__init__()
+        # The timer's entry in the heap, or None
+        self.pydata = None
+
+    @property
+    def active(self):
+        return self.state == PYCBC_EVSTATE_ACTIVE
+
+
+class EpollIOPS(object):
+    def __init__(self):
+        self._do_watch = False
+        self._selector = selectors.DefaultSelector()
+
+        # event -> (fd, selector mask) for registered events
+        self._registered = {}
+
+        # Heap of [exptime, seq, timer]. Cancelled entries have their
+        # timer set to None and are discarded lazily
+        self._timers = []
+        self._ncancelled = 0
+        self._seq = count()
+
+    def _cancel_timer(self, timer):
+        entry = timer.pydata
+        if entry is None:
+            return
+        entry[2] = None
+        timer.pydata = None
+        self._ncancelled += 1
+
+        # Don't let cancelled entries dominate the heap
+        if self._ncancelled > 64 and self._ncancelled > len(self._timers) // 2:
+            self._timers = [e for e in self._timers if e[2] is not None]
+            heapify(self._timers)
+            self._ncancelled = 0
+
+    def update_timer(self, timer, action, usecs):
+        self._cancel_timer(timer)
+        if action != PYCBC_EVACTION_WATCH:
+            return
+
+        entry = [_now() + usecs / 1000000.0, next(self._seq), timer]
+        timer.pydata = entry
+        heappush(self._timers, entry)
+
+    def _unregister_event(self, event):
+        reg = self._registered.pop(event, None)
+        if reg is None:
+            return
+        try:
+            self._selector.unregister(reg[0])
+        except (KeyError, ValueError, OSError):
+            # Already closed
+            pass
+
+    def update_event(self, event, action, flags, fd=None):
+        if action != PYCBC_EVACTION_WATCH:
+            self._unregister_event(event)
+            return
+
+        if fd is None:
+            fd = event.fd
+        mask = _EVENTMAP.get(flags & (LCB_READ_EVENT | LCB_WRITE_EVENT))
+        if not mask:
+            self._unregister_event(event)
+            return
+
+        reg = self._registered.get(event)
+        if reg == (fd, mask):
+            return
+
+        if reg is not None and reg[0] == fd:
+            self._selector.modify(fd, mask, event)
+        else:
+            self._unregister_event(event)
+            try:
+                self._selector.register(fd, mask, event)
+            except KeyError:
+                # The descriptor was closed (and its number reused) without
+                # its previous event being unwatched
+                # The kernel already dropped the old descriptor from the
+                # epoll set, so it must be added again rather than modified
+                stale = self._selector.unregister(fd).data
+                self._registered.pop(stale, None)
+                self._selector.register(fd, mask, event)
+        self._registered[event] = (fd, mask)
+
+    def _poll(self):
+        timers = self._timers
+        while timers and timers[0][2] is None:
+            heappop(timers)
+            self._ncancelled -= 1
+
+        if timers:
+            timeout = max(timers[0][0] - _now(), 0)
+        elif self._registered:
+            timeout = None
+        else:
+            # Nothing to wait for
+            self._do_watch = False
+            return
+
+        ready = []
+        for key, mask in self._selector.select(timeout):
+            flags = 0
+            if mask & selectors.EVENT_READ:
+                flags |= LCB_READ_EVENT
+            if mask & selectors.EVENT_WRITE:
+                flags |= LCB_WRITE_EVENT
+            ready.append((key.data, flags))
+
+        # Delivers to each event which is still active, in a single call
+        if ready:
+            Event.ready_all(ready)
+
+        # Collect expired timers before firing any, as their callbacks
+        # may re-arm them. The heap may have been compacted by the
+        # callbacks above
+        timers = self._timers
+        now = _now()
+        expired = []
+        while timers and timers[0][0] <= now:
+            entry = heappop(timers)
+            timer = entry[2]
+            if timer is None:
+                self._ncancelled -= 1
+                continue
+            timer.pydata = None
+            expired.append(timer)
+
+        for timer in expired:
+            if timer.active:
+                timer.ready(0)
+
+    def start_watching(self):
+        if self._do_watch:
+            return
+
+        self._do_watch = True
+        while self._do_watch:
+            self._poll()
+
+    def stop_watching(self):
+        self._do_watch = False
+
+    def timer_event_factory(self):
+        return EpollTimer()
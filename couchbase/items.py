@@ -200,3 +200,96 @@ class ItemSequence(ItemCollection):
     def __iter__(self):
         for e in self._seq:
             yield (e, None)
+
+class ItemArray(ItemCollection):
+    def __init__(self, keys=None, values=None, cas=None, ttl=None):
+        """
+        A collection of entries stored as parallel lists, rather than as
+        one :class:`Item` (and options dictionary) per entry. This is
+        intended for large bulk operations, where creating an `Item` for
+        each entry is a significant part of the cost.
+
+        :param list keys: The keys
+        :param list values: The values, for mutation operations (or the
+            deltas, for :meth:`~couchbase.bucket.Bucket.counter_multi`).
+            Ignored by retrieval operations
+        :param list cas: The CAS of each entry, or `None`. Entries of ``0``
+            perform the operation without a CAS check
+        :param list ttl: The expiration of each entry, or `None`. Entries of
+            ``0`` use the ``ttl`` passed to the operation itself. As with
+            the ``ttl`` argument of
+            :meth:`~couchbase.bucket.Bucket.get_multi`, a non-zero entry
+            turns a retrieval of its key into a get-and-touch
+
+        Each list which is not `None` must be of the same length as `keys`.
+        Mutation operations raise an
+        :exc:`~couchbase.exceptions.ArgumentError` if `values` is `None`.
+        Options which are shared by all entries (for example ``format``)
+        are passed to the operation as usual::
+
+            arr = ItemArray(keys, values, ttl=expiries)
+            cb.upsert_multi(arr, format=FMT_JSON)
+
+        Unlike the other collections, the results are the ordinary
+        :class:`~couchbase.result.OperationResult` objects, keyed by key;
+        this collection is not modified by the operation.
+        """
+        self.keys = [] if keys is None else list(keys)
+        self.values = None if values is None else list(values)
+        self.cas = None if cas is None else list(cas)
+        self.ttl = None if ttl is None else list(ttl)
+
+    def add(self, key, value=None, cas=0, ttl=0):
+        """
+        Append an entry to the collection.
+
+        :param key: The key
+        :param value: The value. If the collection did not have values yet,
+            preceding entries get a value of `None`
+        :param int cas: The CAS, or ``0``
+        :param int ttl: The expiration, or ``0``
+        """
+        n = len(self.keys)
+        if value is not None and self.values is None:
+            self.values = [None] * n
+        if cas and self.cas is None:
+            self.cas = [0] * n
+        if ttl and self.ttl is None:
+            self.ttl = [0] * n
+
+        self.keys.append(key)
+        if self.values is not None:
+            self.values.append(value)
+        if self.cas is not None:
+            self.cas.append(cas)
+        if self.ttl is not None:
+            self.ttl.append(ttl)
+
+    def _columns(self):
+        """
+        Used by the C implementation to access the lists directly
+        """
+        return self.keys, self.values, self.cas, self.ttl
+
+    def _subset(self, wanted):
+        ixs = [ix for ix, k in enumerate(self.keys) if k in wanted]
+
+        def pick(col):
+            return None if col is None else [col[ix] for ix in ixs]
+
+        return ItemArray([self.keys[ix] for ix in ixs], pick(self.values),
+                         pick(self.cas), pick(self.ttl))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        # Only used by code which does not know about this collection
+        for ix, key in enumerate(self.keys):
+            itm = Item(key, self.values[ix] if self.values else None)
+            if self.cas:
+                itm.cas = self.cas[ix]
+            opts = None
+            if self.ttl and self.ttl[ix]:
+                opts = {'ttl': self.ttl[ix]}
+            yield itm, opts
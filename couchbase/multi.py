@@ -0,0 +1,278 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Execution of operations spanning several :class:`~couchbase.bucket.Bucket`
+objects.
+
+Each bucket normally drives its own event loop, so operations issued
+against several buckets complete one bucket at a time. The helpers in
+this module schedule the operations on *all* buckets first and only then
+wait for them. If the buckets were created with the same I/O plugin
+(see :func:`shared_iops`), waiting on the first bucket drives network
+I/O for all of them, and the total latency collapses to that of the
+slowest bucket.
+
+.. code-block:: python
+
+    from functools import partial
+    from couchbase.bucket import Bucket
+    import couchbase.multi as cbmulti
+
+    iops = cbmulti.shared_iops()
+    users = Bucket('couchbase://localhost/users', _iops=iops)
+    events = Bucket('couchbase://localhost/events', _iops=iops)
+
+    ures, eres = cbmulti.run([
+        partial(users.get_multi, user_ids),
+        partial(events.upsert_multi, new_events)])
+
+Services using several buckets may also open them concurrently at
+startup with :func:`bootstrap`.
+"""
+from functools import partial
+from threading import Thread
+
+from couchbase.bucket import Bucket
+from couchbase.exceptions import ArgumentError, CouchbaseError
+
+
+def shared_iops():
+    """
+    Create an I/O plugin instance which may be passed as the ``_iops``
+    argument to several :class:`~couchbase.bucket.Bucket` constructors,
+    so that they all share a single event loop.
+
+    :return: A new :class:`~couchbase.iops.epoll.EpollIOPS` object, or
+        a :class:`~couchbase.iops.select.SelectIOPS` object if the
+        :mod:`selectors` module is not available
+
+    Sharing is safe for *synchronous* buckets used from a single thread:
+    every socket and timer belongs to exactly one bucket, and a bucket
+    only runs the loop while waiting for its own operations, stopping it
+    once they have completed. Events of the other buckets which arrive in
+    the meantime are simply delivered to them early. The plugin must not
+    be shared with asynchronous buckets, which hand control of the loop
+    to the application, nor used by buckets in different threads.
+    """
+    try:
+        from couchbase.iops.epoll import EpollIOPS
+        return EpollIOPS()
+    except ImportError:
+        from couchbase.iops.select import SelectIOPS
+        return SelectIOPS()
+
+
+def _bucket_of(fn):
+    if isinstance(fn, partial):
+        fn = fn.func
+    bucket = getattr(fn, '__self__', None)
+    if not hasattr(bucket, '_pipeline_begin'):
+        raise ArgumentError.pyexc(
+            'Operation must be a bound Bucket method or a partial of one',
+            fn)
+    return bucket
+
+
+class MultiPipeline(object):
+    def __init__(self, *buckets):
+        """
+        Pipeline context spanning several buckets. This works like
+        :meth:`~couchbase.bucket.Bucket.pipeline`, except that operations
+        may be issued on any of the buckets passed, and all of them are
+        waited for together when the context exits.
+
+        :param buckets: The buckets participating in the pipeline
+
+        .. code-block:: python
+
+            mp = MultiPipeline(users, events)
+            with mp:
+                users.get_multi(user_ids)
+                events.upsert_multi(new_events)
+            user_results, event_results = mp.results
+
+        .. seealso:: :func:`run`
+        """
+        self._buckets = []
+        for bucket in buckets:
+            if bucket not in self._buckets:
+                self._buckets.append(bucket)
+        self._results = None
+
+    def __enter__(self):
+        started = []
+        try:
+            for bucket in self._buckets:
+                bucket._pipeline_begin()
+                started.append(bucket)
+        except Exception:
+            for bucket in started:
+                try:
+                    bucket._pipeline_end()
+                except Exception:
+                    pass
+            raise
+        return self
+
+    def __exit__(self, *args):
+        # Every bucket must leave pipeline mode, even if one of them
+        # raises; the first error is propagated once all are done.
+        results = []
+        first_exc = None
+        for bucket in self._buckets:
+            try:
+                results.append(bucket._pipeline_end())
+            except Exception as e:
+                results.append(None)
+                if first_exc is None:
+                    first_exc = e
+
+        self._results = results
+        if first_exc is not None and args[0] is None:
+            raise first_exc
+        return False
+
+    @property
+    def results(self):
+        """
+        A list containing, for each bucket (in the order passed to the
+        constructor), the list of results of the operations performed on
+        it within the context. Elements are ``None`` for buckets whose
+        pipeline raised an exception.
+        """
+        return self._results
+
+
+def run(ops):
+    """
+    Execute operations on several buckets concurrently.
+
+    :param ops: An iterable of bound bucket methods (or
+        :func:`functools.partial` objects wrapping them) which take
+        no further arguments, e.g. ``partial(cb.get_multi, keys)``
+    :return: A list with the result of each operation, in the order
+        of `ops`
+    :raise: The first :exc:`~couchbase.exceptions.CouchbaseError`
+        encountered, once *all* operations have completed
+
+    Operations on the same bucket are allowed and are pipelined
+    together. Operations which cannot be pipelined (for example
+    view and N1QL queries) are rejected with a
+    :exc:`~couchbase.exceptions.PipelineError`.
+
+    .. seealso:: :class:`MultiPipeline`, :func:`shared_iops`
+    """
+    ops = list(ops)
+    buckets = [_bucket_of(op) for op in ops]
+    mp = MultiPipeline(*buckets)
+
+    with mp:
+        for op in ops:
+            op()
+
+    # Map the per-bucket result lists back onto the original op order
+    offsets = dict((id(b), 0) for b in mp._buckets)
+    per_bucket = dict((id(b), r) for b, r in zip(mp._buckets, mp.results))
+    ret = []
+    for bucket in buckets:
+        ix = offsets[id(bucket)]
+        ret.append(per_bucket[id(bucket)][ix])
+        offsets[id(bucket)] = ix + 1
+    return ret
+
+
+def warm_up(bucket, nprobes=1024):
+    """
+    Open the data connections of a bucket to every node of the cluster,
+    so that the first operations do not pay for connection setup.
+
+    :param bucket: A connected :class:`~couchbase.bucket.Bucket`
+    :param int nprobes: The number of candidate keys examined to find
+        one key owned by each node
+
+    A (non-existent) key owned by each node is looked up. Errors are
+    ignored, as the lookups only serve to establish the connections.
+    """
+    candidates = ['__pycbc_warmup_{0}'.format(ix) for ix in range(nprobes)]
+    probes = [keys[0] for node, keys in
+              bucket.keys_by_node(candidates).items() if node is not None]
+    if not probes:
+        return
+    try:
+        bucket.get_multi(probes, quiet=True)
+    except CouchbaseError:
+        pass
+
+
+def _connect_one(factory, warmup, out):
+    try:
+        if not callable(factory):
+            factory = partial(Bucket, factory)
+        bucket = factory()
+        if warmup:
+            warm_up(bucket)
+        out.append((bucket, None))
+    except Exception as e:
+        out.append((None, e))
+
+
+def bootstrap(factories, warmup=False):
+    """
+    Connect to several buckets concurrently.
+
+    :param factories: An iterable of connection strings, or of callables
+        taking no arguments and returning a new bucket (for example
+        ``partial(Bucket, connstr, password='secret')``)
+    :param bool warmup: Whether to also open the data connections of each
+        bucket to every node (see :func:`warm_up`)
+    :return: A list of the connected buckets, in the order of `factories`
+    :raise: The first exception raised while connecting, once *all*
+        buckets are done
+
+    Each bucket connects in its own thread. Since waiting for the
+    bootstrap releases the GIL, the total startup time is that of the
+    slowest bucket rather than the sum of all of them.
+
+    .. code-block:: python
+
+        users, events, sessions = cbmulti.bootstrap([
+            'couchbase://host/users',
+            'couchbase://host/events',
+            partial(Bucket, 'couchbase://host/sessions', password='s3cr3t')
+        ], warmup=True)
+    """
+    outputs = []
+    threads = []
+    for factory in factories:
+        out = []
+        outputs.append(out)
+        threads.append(Thread(target=_connect_one,
+                              args=(factory, warmup, out)))
+
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+
+    buckets = []
+    for bucket, exc in (out[0] for out in outputs):
+        if exc is not None:
+            raise exc
+        buckets.append(bucket)
+    return buckets
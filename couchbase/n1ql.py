@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 import json
+import struct
+from array import array
 
 import couchbase
 from couchbase._pyport import basestring
@@ -46,6 +48,66 @@ class MissingTokenError(CouchbaseError):
     pass
 
 
+_MS_MAGIC = b'CBMS\x01'
+
+try:
+    array('Q')
+    _U64_TYPECODE = 'Q'
+except ValueError:
+    # Python 2's array module has no 'Q'; 'L' is 64 bits on LP64 platforms
+    _U64_TYPECODE = 'L'
+
+
+class _ScanVector(object):
+    """
+    Mutation tokens of a single bucket, stored as arrays indexed by
+    vbucket id. A sequence number of 0 means no token for the vbucket.
+    """
+    __slots__ = ('seqs', 'uuids', 'count')
+
+    def __init__(self, nvbs=1024):
+        self.seqs = array(_U64_TYPECODE, [0]) * nvbs
+        self.uuids = array(_U64_TYPECODE, [0]) * nvbs
+        self.count = 0
+
+    def _grow(self, nvbs):
+        extra = nvbs - len(self.seqs)
+        self.seqs.extend(array(_U64_TYPECODE, [0]) * extra)
+        self.uuids.extend(array(_U64_TYPECODE, [0]) * extra)
+
+    def add(self, vb, uuid, seq):
+        if vb >= len(self.seqs):
+            self._grow(vb + 1)
+        cur = self.seqs[vb]
+        if not cur:
+            self.count += 1
+        elif self.uuids[vb] == uuid and cur >= seq:
+            return
+        self.seqs[vb] = seq
+        self.uuids[vb] = uuid
+
+    def merge(self, other):
+        for vb, uuid, seq in other:
+            self.add(vb, uuid, seq)
+
+    def columns(self):
+        vbs, uuids, seqs = [], [], []
+        for vb, uuid, seq in self:
+            vbs.append(vb)
+            uuids.append(uuid)
+            seqs.append(seq)
+        return vbs, uuids, seqs
+
+    def __iter__(self):
+        seqs, uuids = self.seqs, self.uuids
+        for vb in range(len(seqs)):
+            if seqs[vb]:
+                yield vb, uuids[vb], seqs[vb]
+
+    def __len__(self):
+        return self.count
+
+
 class MutationState(object):
     """
     .. warning::
@@ -89,16 +151,47 @@ class MutationState(object):
             # ...
     """
     def __init__(self):
-        self._sv = {}
+        self._vecs = {}
 
     def _add_scanvec(self, mutinfo):
         """
         Internal method used to specify a scan vector.
         :param mutinfo: A tuple in the form of
-            `(vbucket id, vbucket uuid, mutation sequence)`
+            `(vbucket id, vbucket uuid, mutation sequence, bucket name)`
         """
         vb, uuid, seq, bktname = mutinfo
-        self._sv.setdefault(bktname, {})[vb] = (seq, str(uuid))
+        try:
+            vec = self._vecs[bktname]
+        except KeyError:
+            vec = self._vecs[bktname] = _ScanVector()
+        vec.add(vb, uuid, seq)
+
+    @property
+    def _sv(self):
+        """
+        The scan vectors, in the form expected by the query service:
+        ``{bucket: {vb: (seq, str(uuid))}}``
+        """
+        ret = {}
+        for bktname, vec in self._vecs.items():
+            ret[bktname] = dict((vb, (seq, str(uuid)))
+                                for vb, uuid, seq in vec)
+        return ret
+
+    def merge(self, other):
+        """
+        Update this state to also reflect the mutations in `other`.
+
+        :param other: Another :class:`MutationState`
+        :return: This object
+        """
+        for bktname, ovec in other._vecs.items():
+            try:
+                vec = self._vecs[bktname]
+            except KeyError:
+                vec = self._vecs[bktname] = _ScanVector()
+            vec.merge(ovec)
+        return self
 
     def encode(self):
         """
@@ -118,8 +211,62 @@ class MutationState(object):
         """
         d = couchbase._from_json(s)
         o = MutationState()
-        o._sv = d
-        # TODO: Validate
+        for bktname, vbs in d.items():
+            for vb, (seq, uuid) in vbs.items():
+                o._add_scanvec((int(vb), int(uuid), int(seq), bktname))
+        return o
+
+    def encode_binary(self):
+        """
+        Encodes this state object to a compact byte string, which may be
+        passed to :meth:`decode_binary`. This is cheaper to produce and
+        parse than :meth:`encode`, and is suitable for passing state
+        between processes.
+
+        :return: A byte string representing the state
+        """
+        parts = [_MS_MAGIC]
+        for bktname, vec in self._vecs.items():
+            name = bktname.encode('utf-8')
+            vbs, uuids, seqs = vec.columns()
+            nvbs = len(vbs)
+            parts.append(struct.pack('<HI', len(name), nvbs))
+            parts.append(name)
+            parts.append(struct.pack('<{0}H'.format(nvbs), *vbs))
+            parts.append(struct.pack('<{0}Q'.format(nvbs), *uuids))
+            parts.append(struct.pack('<{0}Q'.format(nvbs), *seqs))
+        return b''.join(parts)
+
+    @classmethod
+    def decode_binary(cls, s):
+        """
+        Create a :class:`MutationState` from a string returned by
+        :meth:`encode_binary`
+
+        :param s: The encoded byte string
+        :return: A new MutationState restored from the string
+        """
+        if s[:len(_MS_MAGIC)] != _MS_MAGIC:
+            raise ValueError('Not an encoded MutationState')
+
+        o = MutationState()
+        pos = len(_MS_MAGIC)
+        while pos < len(s):
+            namelen, nvbs = struct.unpack_from('<HI', s, pos)
+            pos += 6
+            bktname = s[pos:pos + namelen].decode('utf-8')
+            pos += namelen
+            vbs = struct.unpack_from('<{0}H'.format(nvbs), s, pos)
+            pos += 2 * nvbs
+            uuids = struct.unpack_from('<{0}Q'.format(nvbs), s, pos)
+            pos += 8 * nvbs
+            seqs = struct.unpack_from('<{0}Q'.format(nvbs), s, pos)
+            pos += 8 * nvbs
+
+            vec = o._vecs[bktname] = _ScanVector(max(vbs) + 1 if vbs else 0)
+            for vb, uuid, seq in zip(vbs, uuids, seqs):
+                vec.add(vb, uuid, seq)
+        return o
 
     def add_results(self, *rvs, **kwargs):
         """
@@ -170,9 +317,10 @@ class MutationState(object):
             `quiet` was not specified
         """
         added = False
-        for mt in bucket._mutinfo():
+        bktname = bucket.bucket
+        for vb, uuid, seq in bucket._mutinfo():
             added = True
-            self._add_scanvec(mt)
+            self._add_scanvec((vb, uuid, seq, bktname))
         if not added and not quiet:
             raise MissingTokenError('Bucket object contains no tokens!')
         return added
@@ -181,7 +329,7 @@ class MutationState(object):
         return repr(self._sv)
 
     def __nonzero__(self):
-        return bool(self._sv)
+        return any(self._vecs.values())
 
     __bool__ = __nonzero__
 
@@ -240,6 +388,7 @@ class N1QLQuery(object):
 
         self._adhoc = True
         self._body = {'statement': query}
+        self._scanvec_state = None
         if args:
             self._add_pos_args(*args)
         if kwargs:
@@ -312,7 +461,7 @@ class N1QLQuery(object):
         if not state:
             raise TypeError('Passed empty or invalid state', state)
         self.consistency = 'at_plus'
-        self._body['scan_vectors'] = state._sv
+        self._scanvec_state = state
 
     # TODO: I really wish Sphinx were able to automatically
     # document instance vars
@@ -368,7 +517,11 @@ class N1QLQuery(object):
         This is used internally by the client, and can be useful
         to debug queries.
         """
-        return json.dumps(self._body)
+        body = self._body
+        if self._scanvec_state is not None and \
+                body.get('scan_consistency') == 'at_plus':
+            body = dict(body, scan_vectors=self._scanvec_state._sv)
+        return json.dumps(body)
 
     def __repr__(self):
         return ('<{cls} stmt={stmt} at {oid}>'.format(
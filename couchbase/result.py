@@ -26,6 +26,27 @@ from couchbase._libcouchbase import (
 from couchbase._pyport import long, xrange
 import couchbase._libcouchbase as C
 import couchbase.exceptions as E
+from couchbase.subdocument import CompiledSpecs
+
+
+def _path_index(specs):
+    """
+    Return a ``path -> index`` dictionary for `specs`. The dictionary is
+    kept on compiled spec lists, so results sharing them build it once
+    """
+    paths = getattr(specs, '_path_index', None)
+    if paths is None:
+        paths = dict((spec[1], x) for x, spec in enumerate(specs))
+        if isinstance(specs, CompiledSpecs):
+            specs._path_index = paths
+    return paths
+
+
+def _decode_sd_value(raw):
+    try:
+        return C._get_helper('json_decode')(raw.decode('utf-8'))
+    except Exception:
+        raise E.ValueFormatError.pyexc('Failed to decode bytes', raw)
 
 
 class SubdocResult(C._SDResult):
@@ -59,24 +80,34 @@ class SubdocResult(C._SDResult):
     def _pycbc_repr_extra(self):
         ret = ["specs={0}".format(repr(self._specs))]
         if hasattr(self, '_results'):
-            ret.append('results={0}'.format(repr(self._results)))
+            ret.append('results={0}'.format(
+                repr([self._resolve(x) for x in xrange(self.result_count)])))
         return ret
 
     def __path2index(self, path):
-        if not hasattr(self, '__path_cache'):
-            self.__path_cache = {}
-            for x in xrange(len(self._specs)):
-                spec = self._specs[x]
-                self.__path_cache[spec[1]] = x
-
-        return self.__path_cache[path]
+        try:
+            paths = self.__paths
+        except AttributeError:
+            paths = self.__paths = _path_index(self._specs)
+        return paths[path]
 
     def _resolve(self, item):
-        if isinstance(item, (int, long)):
-            # Get by value
-            return self._results[item]
-        else:
-            return self._results[self.__path2index(item)]
+        if not isinstance(item, (int, long)):
+            item = self.__path2index(item)
+
+        try:
+            return self.__decoded[item]
+        except AttributeError:
+            self.__decoded = {}
+        except KeyError:
+            pass
+
+        # Values are stored as raw JSON and decoded on first access
+        err, value = self._results[item]
+        if value is not None:
+            value = _decode_sd_value(value)
+        self.__decoded[item] = err, value
+        return err, value
 
     def __getitem__(self, item):
         rv = self._resolve(item)
@@ -86,10 +117,10 @@ class SubdocResult(C._SDResult):
             return rv[1]
 
     def __iter__(self):
-        for resinfo, specinfo in izip(self._results, self._specs):
-            err, value, path = resinfo[0], resinfo[1], specinfo[1]
+        for x in xrange(self.result_count):
+            err, value = self._resolve(x)
             if err:
-                raise E.exc_from_rc(err, obj=path)
+                raise E.exc_from_rc(err, obj=self._specs[x][1])
             yield value
 
     @property
@@ -158,4 +189,107 @@ class SubdocResult(C._SDResult):
 
     @property
     def value(self):
-        raise AttributeError(".value not applicable in multiple result operation")
\ No newline at end of file
+        raise AttributeError(".value not applicable in multiple result operation")
+
+class CompactMultiResult(object):
+    """
+    Read-only mapping returned by :meth:`~couchbase.bucket.Bucket.get_multi`
+    when called with ``compact=True``.
+
+    Keys and values are stored in lists, and CAS, flags and error codes in
+    arrays. A :class:`~.ValueResult` is only created when a key is looked
+    up with ``result[key]``; use :meth:`value` or :meth:`values` to obtain
+    just the values without creating any result objects.
+    """
+    def __init__(self, mres):
+        self._mres = mres
+        self._keys, self._values = mres._compact_columns()
+        self._index = None
+
+    def _ix(self, key):
+        if self._index is None:
+            self._index = dict((k, ix) for ix, k in enumerate(self._keys))
+        return self._index[key]
+
+    @property
+    def all_ok(self):
+        """Whether all the keys were retrieved successfully"""
+        return bool(self._mres.all_ok)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __contains__(self, key):
+        try:
+            self._ix(key)
+            return True
+        except KeyError:
+            return False
+
+    def __getitem__(self, key):
+        return self._mres._compact_result(self._ix(key))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self._keys)
+
+    def items(self):
+        """
+        Iterate over ``(key, result)`` pairs. This creates a result object
+        for every key.
+        """
+        for ix, key in enumerate(self._keys):
+            yield key, self._mres._compact_result(ix)
+
+    def value(self, key, default=None):
+        """
+        Get the value of a key.
+
+        :param key: The key
+        :param default: Returned if the key was not retrieved successfully
+        """
+        try:
+            ix = self._ix(key)
+        except KeyError:
+            return default
+        value = self._values[ix]
+        if value is None and not self._mres._compact_result(ix).success:
+            return default
+        return value
+
+    def values(self):
+        """
+        Iterate over the values of all keys, in the order in which they were
+        received. Keys which could not be retrieved yield `None`.
+        """
+        return iter(self._values)
+
+    def value_dict(self):
+        """
+        :return: A ``dict`` of ``key -> value`` for the keys which were
+            retrieved successfully
+        """
+        ret = dict(zip(self._keys, self._values))
+        for ix in self._mres._compact_failed():
+            del ret[self._keys[ix]]
+        return ret
+
+    def failed(self):
+        """
+        :return: A ``dict`` of ``key ->`` :class:`~.ValueResult` for the
+            keys which could not be retrieved
+        """
+        return dict((self._keys[ix], self._mres._compact_result(ix))
+                    for ix in self._mres._compact_failed())
+
+    def __repr__(self):
+        return '<{0} keys={1} all_ok={2}>'.format(
+            type(self).__name__, len(self), self.all_ok)
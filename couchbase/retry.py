@@ -0,0 +1,180 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Automatic retrying of the failed keys of ``*_multi`` operations.
+"""
+from random import random
+from time import sleep
+
+from couchbase.exceptions import (
+    ArgumentError, CouchbaseError, CouchbaseTransientError, exc_from_rc)
+from couchbase.items import ItemArray, ItemOptionDict, ItemSequence
+
+
+class RetryPolicy(object):
+    def __init__(self, max_attempts=5, initial_backoff=0.01,
+                 max_backoff=1.0, multiplier=2.0, jitter=0.5,
+                 retry_on=(CouchbaseTransientError,)):
+        """
+        Policy for retrying the keys of a multi operation which failed
+        with a temporary error.
+
+        :param int max_attempts: The maximum number of times the operation
+            is executed (including the first attempt)
+        :param float initial_backoff: Time (in seconds) to wait before the
+            first retry
+        :param float max_backoff: Upper bound for the time waited between
+            two attempts
+        :param float multiplier: Factor by which the backoff grows after
+            each attempt
+        :param float jitter: Fraction (between 0 and 1) of the backoff
+            which is randomized, so that many clients retrying at once do
+            not do so in lockstep
+        :param retry_on: Tuple of exception classes. Keys failing with an
+            error mapping to one of these classes are retried. By default
+            all :exc:`~couchbase.exceptions.CouchbaseTransientError`
+            errors (e.g. :exc:`~couchbase.exceptions.TemporaryFailError`
+            and :exc:`~couchbase.exceptions.BusyError`) are retried.
+
+        .. code-block:: python
+
+            policy = RetryPolicy(max_attempts=10)
+            policy.run(cb.upsert_multi, docs, ttl=3600)
+        """
+        if max_attempts < 1:
+            raise ArgumentError.pyexc('max_attempts must be at least 1',
+                                      max_attempts)
+        if not 0 <= jitter <= 1:
+            raise ArgumentError.pyexc('jitter must be between 0 and 1',
+                                      jitter)
+
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+
+    def backoff(self, attempt):
+        """
+        :param int attempt: The number of attempts made so far
+        :return: The time to wait before the next attempt, in seconds
+        """
+        delay = self.initial_backoff * (self.multiplier ** (attempt - 1))
+        delay = min(delay, self.max_backoff)
+        return delay * (1 - self.jitter * random())
+
+    def should_retry(self, rc):
+        """
+        :param int rc: The error code received for a key
+        :return: Whether the key should be retried
+        """
+        return issubclass(CouchbaseError.rc_to_exctype(rc), self.retry_on)
+
+    def run(self, meth, keys, *args, **kwargs):
+        """
+        Execute a multi operation, retrying the keys which failed with
+        a retryable error.
+
+        :param meth: A bound ``*_multi`` method, e.g. ``cb.upsert_multi``
+        :param keys: The keys (or key-value dictionary, or
+            :class:`~couchbase.items.ItemCollection`) to pass to `meth`
+        :param args: Additional positional arguments for `meth`
+        :param kwargs: Additional keyword arguments for `meth`
+        :return: A :class:`~couchbase.result.MultiResult` containing the
+            latest result for every key
+        :raise: :exc:`~couchbase.exceptions.CouchbaseError` if some keys
+            still failed after all attempts, or failed with a
+            non-retryable error. Its :attr:`all_results` contains the
+            latest result for every key.
+
+        `meth` may not be called with ``compact=True``, as compact results
+        cannot be merged.
+        """
+        if kwargs.get('compact'):
+            raise ArgumentError.pyexc(
+                'compact results cannot be retried', kwargs['compact'])
+
+        if not isinstance(keys, (dict, ItemArray, ItemOptionDict,
+                                 ItemSequence)):
+            keys = list(keys)
+
+        merged = {}
+        fatal_key = None
+        pending = keys
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                mres = meth(pending, *args, **kwargs)
+                err = None
+            except CouchbaseError as e:
+                if not e.all_results:
+                    raise
+                mres = e.all_results
+                err = e
+
+            merged.update(mres)
+            if err is None:
+                break
+
+            retry_keys = set()
+            for k, v in mres.items():
+                if v.success:
+                    continue
+                if self.should_retry(v.rc):
+                    retry_keys.add(k)
+                elif fatal_key is None:
+                    fatal_key = k
+
+            if not retry_keys or attempt == self.max_attempts:
+                break
+
+            sleep(self.backoff(attempt))
+            pending = _subset(keys, retry_keys)
+
+        # The last result object carries the final key set; fill in the
+        # results obtained by earlier attempts
+        mres.update(merged)
+        if fatal_key is not None:
+            # The exception raised by that attempt may be for another
+            # key, which may have succeeded since
+            err = exc_from_rc(mres[fatal_key].rc, obj=fatal_key)
+        if err is not None:
+            err.all_results = mres
+            raise err
+        return mres
+
+
+def _subset(keys, wanted):
+    """
+    Return the portion of `keys` (in whatever form was passed to the multi
+    method) whose keys are in the `wanted` set
+    """
+    if isinstance(keys, ItemOptionDict):
+        return ItemOptionDict(dict(
+            (itm, opts) for itm, opts in keys.dict.items()
+            if itm.key in wanted))
+    elif isinstance(keys, ItemArray):
+        return keys._subset(wanted)
+    elif isinstance(keys, ItemSequence):
+        return ItemSequence([itm for itm in keys.sequence
+                             if itm.key in wanted])
+    elif isinstance(keys, dict):
+        return dict((k, v) for k, v in keys.items() if k in wanted)
+    else:
+        return [k for k in keys if k in wanted]
@@ -2,7 +2,8 @@ from couchbase._libcouchbase import (
     LCB_SDCMD_REPLACE, LCB_SDCMD_DICT_ADD, LCB_SDCMD_DICT_UPSERT,
     LCB_SDCMD_ARRAY_ADD_FIRST, LCB_SDCMD_ARRAY_ADD_LAST,
     LCB_SDCMD_ARRAY_ADD_UNIQUE, LCB_SDCMD_EXISTS, LCB_SDCMD_GET,
-    LCB_SDCMD_COUNTER, LCB_SDCMD_REMOVE, LCB_SDCMD_ARRAY_INSERT
+    LCB_SDCMD_COUNTER, LCB_SDCMD_REMOVE, LCB_SDCMD_ARRAY_INSERT,
+    _get_helper
 )
 
 _SPECMAP = {}
@@ -238,3 +239,130 @@ def remove(path):
     :param path: The path to remove
     """
     return _gen_2spec(LCB_SDCMD_REMOVE, path)
+
+
+class _Param(object):
+    def __repr__(self):
+        return 'PARAM'
+
+#: Placeholder for a value which is only known when the operation is
+#: performed. See :func:`compile`
+PARAM = _Param()
+
+
+def _is_param(value):
+    return value is PARAM or (
+        isinstance(value, MultiValue) and len(value) == 1 and
+        value[0] is PARAM)
+
+
+def _encode_value(value):
+    encoded = _get_helper('json_encode')(value)
+    if not isinstance(encoded, bytes):
+        encoded = encoded.encode('utf-8')
+    if isinstance(value, MultiValue):
+        # The server expects the values without the enclosing brackets
+        encoded = encoded.strip()
+        if len(encoded) < 3:
+            raise ValueError('MultiValue must not be empty')
+        encoded = encoded[1:-1]
+    return encoded
+
+
+class CompiledSpec(Spec):
+    """
+    A :class:`Spec` whose path (and value, if known) have been encoded
+    in advance. The encoded forms follow the regular elements of the tuple
+    """
+    def __repr__(self):
+        nitems = 3 if len(self) > 5 else 2
+        details = [_SPECMAP.get(self[0])]
+        details.extend([repr(x) for x in self[1:nitems]])
+        return '{0}<{1}>'.format(self.__class__.__name__,
+                                 ', '.join(details))
+
+
+class CompiledSpecs(tuple):
+    """
+    Tuple of :class:`CompiledSpec` objects, as returned by :func:`compile`
+    """
+    def __new__(cls, specs):
+        return super(CompiledSpecs, cls).__new__(cls, specs)
+
+    @property
+    def nparams(self):
+        """The number of values to be passed to :meth:`bind`"""
+        return sum(1 for spec in self if len(spec) > 5 and spec[2] is PARAM)
+
+    def bind(self, *values):
+        """
+        Supply the values for the :data:`PARAM` placeholders.
+
+        :param values: One value for each placeholder, in the order of the
+            specs passed to :func:`compile`
+        :return: A new :class:`CompiledSpecs`. The values passed are
+            encoded when the operation is performed
+        """
+        if len(values) != self.nparams:
+            raise ValueError('Expected {0} values, got {1}'.format(
+                self.nparams, len(values)))
+
+        values = iter(values)
+        specs = []
+        for spec in self:
+            if len(spec) > 5 and spec[2] is PARAM:
+                value = next(values)
+                if spec[0] in _MULTIVALUE_OPS and \
+                        not isinstance(value, MultiValue):
+                    value = MultiValue(value)
+                spec = CompiledSpec(spec[0], spec[1], value, spec[3],
+                                    spec[4], None)
+            specs.append(spec)
+        return CompiledSpecs(specs)
+
+
+_MULTIVALUE_OPS = (LCB_SDCMD_ARRAY_ADD_FIRST, LCB_SDCMD_ARRAY_ADD_LAST,
+                   LCB_SDCMD_ARRAY_INSERT)
+
+
+def compile(*specs):
+    """
+    Prepare a list of specs for repeated use with :cb_bmeth:`lookup_in` or
+    :cb_bmeth:`mutate_in`. The paths, as well as any values which are
+    known in advance, are encoded once here rather than on each operation.
+
+    :param specs: The specs, as returned by the other functions in this
+        module. Values which are only known when the operation is
+        performed may be given as :data:`PARAM`, and are supplied using
+        :meth:`CompiledSpecs.bind`
+    :return: A :class:`CompiledSpecs` object. This is a tuple, and may be
+        passed in place of the specs themselves
+
+    .. code-block:: python
+
+        import couchbase.subdocument as SD
+        fields = SD.compile(SD.get('a.b'), SD.get('c'))
+        rv = cb.lookup_in(key, fields)
+
+        update = SD.compile(SD.upsert('status', SD.PARAM),
+                            SD.counter('updates', 1))
+        cb.mutate_in(key, update.bind('done'))
+    """
+    compiled = []
+    for spec in specs:
+        op, path = spec[0], spec[1]
+        if not isinstance(path, bytes):
+            path = path.encode('utf-8')
+
+        if len(spec) < 3:
+            compiled.append(CompiledSpec(op, spec[1], None, 0, path))
+            continue
+
+        value, create = spec[2], int(spec[3]) if len(spec) > 3 else 0
+        if _is_param(value):
+            compiled.append(CompiledSpec(op, spec[1], PARAM, create, path,
+                                         None))
+        else:
+            compiled.append(CompiledSpec(op, spec[1], value, create, path,
+                                         _encode_value(value)))
+    return CompiledSpecs(compiled)
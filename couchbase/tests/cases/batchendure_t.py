@@ -0,0 +1,60 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from couchbase.durability import BatchEndure, DurabilityHistogram
+from couchbase.exceptions import ArgumentError, TimeoutError
+from couchbase.tests.base import MockTestCase
+
+
+class BatchEndureTest(MockTestCase):
+    def test_histogram(self):
+        h = DurabilityHistogram()
+        self.assertIsNone(h.percentile(50))
+        h.add(0.0005, 90)
+        h.add(0.03, 9)
+        h.add(60)
+        self.assertEqual(100, h.total)
+        self.assertEqual(0.001, h.percentile(50))
+        self.assertEqual(0.05, h.percentile(99))
+        self.assertEqual(float('inf'), h.percentile(100))
+        self.assertEqual(9, h.as_dict()[0.05])
+
+    def test_batch_upsert(self):
+        kv = self.gen_kv_dict(prefix='batch_endure')
+        be = BatchEndure(self.cb, persist_to=-1, replicate_to=-1)
+        rvs = be.upsert_multi(kv)
+        self.assertEqual(set(kv.keys()), set(rvs.keys()))
+        self.assertTrue(all(rv.success for rv in rvs.values()))
+        self.assertEqual(len(kv), be.histogram.total)
+
+    def test_batch_timeout(self):
+        key = self.gen_key('batch_endure_timeout')
+        rv = self.cb.upsert(key, 'value')
+        self.mockclient.unpersist(key, on_master=True,
+                                  replica_count=self.mock.replicas)
+
+        be = BatchEndure(self.cb, persist_to=-1, replicate_to=-1,
+                         timeout=0.1)
+        try:
+            be.endure({key: rv})
+            self.fail('Expected TimeoutError')
+        except TimeoutError as e:
+            self.assertFalse(e.all_results[key].success)
+
+    def test_bad_args(self):
+        self.assertRaises(ArgumentError, BatchEndure, self.cb,
+                          persist_to=0, replicate_to=0)
@@ -0,0 +1,60 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from couchbase.bulk import NodeScheduler
+from couchbase.exceptions import ArgumentError, NotFoundError
+from couchbase.result import MultiResult
+from couchbase.tests.base import ConnectionTestCase
+
+
+class NodeSchedulerTest(ConnectionTestCase):
+    def test_run(self):
+        sched = NodeScheduler(self.make_connection, max_inflight=3)
+        keys = [self.gen_key('nodesched_{0}'.format(x)) for x in range(20)]
+        docs = dict((k, {'ix': ix}) for ix, k in enumerate(keys))
+
+        rv = sched.run('upsert_multi', docs)
+        self.assertTrue(rv.all_ok)
+        self.assertEqual(set(keys), set(rv.keys()))
+
+        rv = sched.run('get_multi', keys)
+        self.assertEqual(docs, dict((k, r.value) for k, r in rv.items()))
+
+        groups = sched.partition(keys)
+        self.assertEqual(sorted(keys), sorted(sum(groups.values(), [])))
+
+        missing = self.gen_key('nodesched_missing')
+        rv = sched.run('get_multi', keys + [missing], quiet=True)
+        self.assertFalse(rv.all_ok)
+        self.assertFalse(rv[missing].success)
+        self.assertEqual(len(keys) + 1, len(rv))
+
+        try:
+            sched.run('get_multi', keys + [missing])
+            self.fail('Expected NotFoundError')
+        except NotFoundError as e:
+            self.assertEqual(len(keys) + 1, len(e.all_results))
+            self.assertTrue(e.all_results[keys[0]].success)
+
+        rv = sched.run('get_multi', [])
+        self.assertIsInstance(rv, MultiResult)
+        self.assertEqual(0, len(rv))
+        sched.close()
+
+    def test_badargs(self):
+        self.assertRaises(ArgumentError, NodeScheduler,
+                          self.make_connection, max_inflight=0)
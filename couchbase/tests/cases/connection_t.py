@@ -17,6 +17,7 @@
 
 import tempfile
 import os
+import shutil
 
 from nose.plugins.attrib import attr
 
@@ -91,6 +92,23 @@ class ConnectionTest(CouchbaseTestCase):
         # TODO, see what happens when bad path is used
         # apparently libcouchbase does not report this failure.
 
+    def test_config_cache_dir(self):
+        cachedir = tempfile.mkdtemp()
+        try:
+            connargs = self.make_connargs()
+            cb = self.factory(config_cache_dir=cachedir, **connargs)
+            self.assertTrue(cb.upsert("foo", "bar").success)
+            self.assertFalse(cb.config_cache_loaded)
+            self.assertTrue(cb.bootstrap_time >= 0)
+            self.assertEqual(1, len(os.listdir(cachedir)))
+
+            cb2 = self.factory(config_cache_dir=cachedir, **connargs)
+            self.assertTrue(cb2.config_cache_loaded)
+            self.assertEqual("bar", cb2.get("foo").value)
+            self.assertEqual(1, len(os.listdir(cachedir)))
+        finally:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
     def test_invalid_hostname(self):
         self.assertRaises(InvalidError, self.factory,
                           str('couchbase://12345:qwer###/default'))
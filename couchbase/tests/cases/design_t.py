@@ -93,3 +93,22 @@ class DesignDocManagementTest(DDocTestCase):
         self.assertTrue(rv.headers)
         print(rv.headers)
         self.assertTrue('X-Couchbase-Meta' in rv.headers)
+
+    def test_design_create_multi(self):
+        names = [DNAME + '_multi_{0}'.format(x) for x in range(3)]
+        try:
+            rvs = self.mgr.design_create_multi(
+                dict((name, DESIGN_JSON) for name in names),
+                use_devmode=True, syncwait=10)
+            self.assertEqual(set(names), set(rvs.keys()))
+            for name in names:
+                self.assertTrue(rvs[name].success)
+                rv = self.cb._view(name, VNAME, use_devmode=True,
+                                   params={'limit': 10})
+                self.assertTrue(rv.success)
+        finally:
+            for name in names:
+                try:
+                    self.mgr.design_delete(name, use_devmode=True)
+                except HTTPError:
+                    pass
@@ -83,3 +83,23 @@ class ExceptionsTest(ConnectionTestCase):
         str(exc)
         repr(exc)
         del exc
+
+    def test_exc_defaults(self):
+        exc = E.NotFoundError({'key': 'foo'})
+        self.assertEqual(E.NotFoundError.CODE, exc.rc)
+        self.assertEqual('foo', exc.key)
+        self.assertEqual({}, exc.all_results)
+        self.assertIsNone(exc.message)
+        self.assertIsNone(exc.inner_cause)
+        self.assertIsNone(exc.result)
+        self.assertEqual((), exc.csrc_info)
+
+        # all_results is not shared between instances
+        exc.all_results['foo'] = None
+        self.assertEqual({}, E.NotFoundError().all_results)
+
+        exc = E.exc_from_rc(E.KeyExistsError.CODE, 'msg', 'obj')
+        self.assertIsInstance(exc, E.KeyExistsError)
+        self.assertEqual('msg', exc.message)
+        self.assertEqual('obj', exc.objextra)
+        str(exc)
@@ -24,7 +24,8 @@ from couchbase import FMT_JSON, FMT_PICKLE, FMT_UTF8, FMT_BYTES
 
 from couchbase.exceptions import (
     CouchbaseError, ValueFormatError, NotFoundError)
-from couchbase.result import MultiResult, Result
+from couchbase.result import (
+    MultiResult, Result, ValueResult, CompactMultiResult)
 from couchbase.tests.base import ConnectionTestCase, SkipTest
 
 class GetTest(ConnectionTestCase):
@@ -188,5 +189,51 @@ class GetTest(ConnectionTestCase):
             self.assertTrue(k in kvs)
             self.assertTrue(NotFoundError._can_derive(v.rc))
 
+
+class CompactResultTest(ConnectionTestCase):
+    def test_compact_get_multi(self):
+        kv = dict((k, k + '_value')
+                  for k in self.gen_key_list(amount=10, prefix='compact'))
+        self.cb.upsert_multi(kv)
+
+        rvs = self.cb.get_multi(list(kv), compact=True)
+        self.assertIsInstance(rvs, CompactMultiResult)
+        self.assertTrue(rvs.all_ok)
+        self.assertEqual(len(kv), len(rvs))
+        self.assertEqual(set(kv), set(rvs))
+        self.assertEqual(kv, rvs.value_dict())
+        self.assertEqual(sorted(kv.values()), sorted(rvs.values()))
+
+        key = list(kv)[0]
+        rv = rvs[key]
+        self.assertIsInstance(rv, ValueResult)
+        self.assertTrue(rv.success)
+        self.assertTrue(rv.cas)
+        self.assertEqual(key, rv.key)
+        self.assertEqual(kv[key], rv.value)
+        self.assertEqual(kv[key], rvs.value(key))
+        self.assertFalse('nonexist' in rvs)
+
+    def test_compact_missing(self):
+        key = self.gen_key('compact_found')
+        missing = self.gen_key('compact_missing')
+        self.cb.upsert(key, 'value')
+        self.cb.remove(missing, quiet=True)
+
+        rvs = self.cb.get_multi([key, missing], quiet=True, compact=True)
+        self.assertFalse(rvs.all_ok)
+        self.assertEqual({key: 'value'}, rvs.value_dict())
+        self.assertEqual('default', rvs.value(missing, 'default'))
+        self.assertEqual([missing], list(rvs.failed()))
+        self.assertFalse(rvs[missing].success)
+
+        try:
+            self.cb.get_multi([key, missing], compact=True)
+        except NotFoundError as e:
+            self.assertIsInstance(e.all_results, CompactMultiResult)
+            self.assertEqual('value', e.all_results.value(key))
+        else:
+            self.fail('NotFoundError not raised')
+
 if __name__ == '__main__':
     unittest.main()
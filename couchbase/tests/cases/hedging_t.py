@@ -0,0 +1,84 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from couchbase.hedging import HedgePolicy, HedgedRead
+from couchbase.exceptions import ArgumentError, exc_from_rc
+import couchbase._libcouchbase as _LCB
+from couchbase.tests.base import CouchbaseTestCase
+
+
+class HedgingTest(CouchbaseTestCase):
+    def test_policy_delay(self):
+        policy = HedgePolicy(percentile=90, window=100, min_samples=10,
+                             initial_delay=0.5, min_delay=0, max_delay=10)
+        self.assertEqual(0.5, policy.delay)
+        for x in range(100):
+            policy.record(x / 100.0)
+        self.assertEqual(0.9, policy.delay)
+
+        policy.max_delay = 0.2
+        for x in range(100):
+            policy.record(1.0)
+        self.assertEqual(0.2, policy.delay)
+
+        self.assertRaises(ArgumentError, HedgePolicy, percentile=0)
+
+    def test_read_state(self):
+        policy = HedgePolicy()
+        results = []
+
+        # Active answers first; replica is never fired
+        hr = HedgedRead(policy, results.append, results.append)
+        hr.active_ok('active')
+        self.assertFalse(hr.fire())
+
+        # Replica wins the race
+        hr = HedgedRead(policy, results.append, results.append)
+        self.assertTrue(hr.fire())
+        hr.replica_err('ignored')
+        hr.replica_ok('replica')
+        hr.active_ok('late')
+
+        self.assertEqual(['active', 'replica'], results)
+        self.assertEqual({'total': 2, 'fired': 1, 'won': 1,
+                          'delay': policy.delay}, policy.stats())
+
+    def test_read_active_error(self):
+        policy = HedgePolicy()
+        results = []
+        timeout = exc_from_rc(_LCB.LCB_ETIMEDOUT)
+        missing = exc_from_rc(_LCB.LCB_KEY_ENOENT)
+
+        # Transient errors wait for the replica read
+        hr = HedgedRead(policy, results.append, results.append)
+        self.assertTrue(hr.fire())
+        hr.active_err(timeout)
+        self.assertEqual([], results)
+        hr.replica_ok('replica')
+
+        # .. and are delivered if it fails too
+        hr = HedgedRead(policy, results.append, results.append)
+        self.assertTrue(hr.fire())
+        hr.active_err(timeout)
+        hr.replica_err('ignored')
+
+        # Data errors are authoritative
+        hr = HedgedRead(policy, results.append, results.append)
+        self.assertTrue(hr.fire())
+        hr.active_err(missing)
+        hr.replica_ok('late')
+
+        self.assertEqual(['replica', timeout, missing], results)
@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from couchbase.tests.base import CouchbaseTestCase
+from couchbase.tests.base import CouchbaseTestCase, SkipTest
 from couchbase.iops.select import SelectIOPS
 
 # For now, this just checks that basic set/get doesn't explode
@@ -40,3 +40,34 @@ class IopsTest(CouchbaseTestCase):
         rv = cb.get(key)
         self.assertTrue(rv.success)
         self.assertEqual(rv.value, value)
+
+
+class EpollIopsTest(IopsTest):
+    def _iops_connection(self, **kwargs):
+        try:
+            from couchbase.iops.epoll import EpollIOPS
+        except ImportError as e:
+            raise SkipTest(e)
+        return self.make_connection(_iops=EpollIOPS(), **kwargs)
+
+    def test_many_ops(self):
+        cb = self._iops_connection()
+        kv = self.gen_kv_dict(amount=50, prefix="iops-epoll-many")
+        cb.upsert_multi(kv)
+        for k, v in kv.items():
+            self.assertEqual(v, cb.get(k).value)
+
+    def test_dispatch_stats(self):
+        cb = self._iops_connection()
+        kv = self.gen_kv_dict(amount=10, prefix="iops-epoll-stats")
+        cb.upsert_multi(kv)
+        cb.get_multi(kv.keys())
+
+        stats = cb._iops_stats()
+        # Timers are fired individually, sockets in batches
+        self.assertTrue(stats['batched'] > 0)
+        self.assertTrue(stats['fired'] >= stats['batched'])
+        # Argument tuples are reused between calls
+        self.assertTrue(stats['tuples'] < stats['modevent'] +
+                        stats['modtimer'])
+        self.assertIsNone(self.make_connection()._iops_stats())
@@ -16,7 +16,7 @@
 #
 
 from couchbase.tests.base import ConnectionTestCase
-from couchbase.items import Item, ItemSequence, ItemOptionDict
+from couchbase.items import Item, ItemSequence, ItemOptionDict, ItemArray
 from couchbase.exceptions import (
     NotFoundError, ValueFormatError, ArgumentError, KeyExistsError)
 from couchbase.user_constants import FMT_BYTES, FMT_UTF8
@@ -193,3 +193,68 @@ class ItemTest(ConnectionTestCase):
         self.assertEqual(1, len(bar_options))
         self.assertEqual(-1, bar_options['replicate_to'])
 
+    def test_item_array(self):
+        keys = self.gen_key_list(amount=5, prefix="itm_array")
+        arr = ItemArray(keys, [k + '_value' for k in keys])
+        rvs = self.cb.upsert_multi(arr, format=FMT_UTF8)
+        self.assertTrue(rvs.all_ok)
+        self.assertFalse(isinstance(rvs[keys[0]], Item))
+
+        rvs = self.cb.get_multi(arr)
+        for k in keys:
+            self.assertEqual(k + '_value', rvs[k].value)
+
+        # Per-key CAS
+        arr.cas = [rvs[k].cas for k in keys]
+        arr.cas[0] += 1
+        self.assertRaises(KeyExistsError, self.cb.replace_multi, arr)
+        arr.cas[0] = 0
+        self.cb.replace_multi(arr)
+
+        arr = ItemArray()
+        for k in keys:
+            arr.add(k, ttl=100)
+        self.assertEqual([100] * len(keys), arr.ttl)
+        self.assertTrue(self.cb.touch_multi(arr).all_ok)
+        self.cb.remove_multi(arr)
+        self.assertRaises(NotFoundError, self.cb.get_multi, arr)
+
+    def test_item_array_badcolumns(self):
+        arr = ItemArray(['a', 'b'], ['a_value'])
+        self.assertRaises(ArgumentError, self.cb.upsert_multi, arr)
+
+    def test_item_array_novalues(self):
+        keys = self.gen_key_list(amount=2, prefix="itm_array_novalues")
+        self.assertRaises(ArgumentError, self.cb.upsert_multi,
+                          ItemArray(keys))
+
+    def test_get_items(self):
+        keys = self.gen_key_list(amount=3, prefix="itm_get_items")
+        self.cb.upsert_multi(dict((k, 'first') for k in keys))
+        items = [Item(k) for k in keys]
+
+        rvs = self.cb.get_items(items)
+        self.assertTrue(rvs.all_ok)
+        for itm in items:
+            self.assertTrue(rvs[itm.key] is itm)
+            self.assertEqual('first', itm.value)
+            self.assertTrue(itm.cas)
+
+        # Refresh the same items
+        old_cas = items[0].cas
+        self.cb.upsert_multi(dict((k, 'second') for k in keys))
+        self.cb.get_items(ItemSequence(items))
+        for itm in items:
+            self.assertEqual('second', itm.value)
+        self.assertNotEqual(old_cas, items[0].cas)
+
+        # Status must reflect the latest retrieval
+        self.cb.remove(keys[0])
+        self.cb.get_items(items, quiet=True)
+        self.assertFalse(items[0].success)
+        self.assertTrue(items[1].success)
+
+        self.cb.upsert(keys[0], 'third')
+        self.cb.get_items(items)
+        self.assertTrue(items[0].success)
+        self.assertEqual('third', items[0].value)
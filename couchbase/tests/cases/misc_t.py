@@ -140,6 +140,20 @@ class MiscTest(ConnectionTestCase):
         int(vb)
         int(ix)
 
+    def test_key_locations(self):
+        cb = self.make_connection()
+        keys = [self.gen_key('keyloc_{0}'.format(x)) for x in range(50)]
+        locs = cb.key_locations(keys)
+        self.assertEqual(set(keys), set(locs))
+        for k in keys[:5]:
+            self.assertEqual(cb._vbmap(k), locs[k])
+
+        groups = cb.keys_by_node(keys)
+        self.assertEqual(sorted(keys), sorted(sum(groups.values(), [])))
+        for node, node_keys in groups.items():
+            self.assertTrue(node is None or node in cb.server_nodes)
+            self.assertEqual(1, len(set(locs[k][1] for k in node_keys)))
+
     def test_logging(self):
         # Assume we don't have logging here..
         import couchbase
@@ -0,0 +1,86 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from functools import partial
+
+from couchbase.exceptions import ArgumentError, NotFoundError
+from couchbase.tests.base import ConnectionTestCase
+import couchbase.multi as cbmulti
+
+
+class CrossBucketTest(ConnectionTestCase):
+    def test_run(self):
+        iops = cbmulti.shared_iops()
+        cb1 = self.make_connection(_iops=iops)
+        cb2 = self.make_connection(_iops=iops)
+        kv = self.gen_kv_dict(prefix='multi_run')
+        k = self.gen_key('multi_run_single')
+        # Requests on different connections are not ordered with respect
+        # to each other, so the key read below must exist beforehand
+        cb1.upsert(k, 'value')
+
+        rvs = cbmulti.run([partial(cb1.upsert_multi, kv),
+                           partial(cb2.upsert, k, 'value'),
+                           partial(cb1.get, k)])
+        self.assertEqual(3, len(rvs))
+        self.assertTrue(rvs[0].all_ok)
+        self.assertTrue(rvs[1].success)
+        self.assertEqual('value', rvs[2].value)
+
+    def test_pipeline_errors(self):
+        cb2 = self.make_connection()
+        k = self.gen_key('multi_pipeline_missing')
+        self.cb.remove(k, quiet=True)
+
+        mp = cbmulti.MultiPipeline(self.cb, cb2)
+        def run_pipeline():
+            with mp:
+                self.cb.get(k)
+                cb2.upsert(k, 'value')
+        self.assertRaises(NotFoundError, run_pipeline)
+        self.assertIsNone(mp.results[0])
+        self.assertTrue(mp.results[1][0].success)
+
+        # Both buckets must have left pipeline mode
+        self.cb.remove(k)
+        cb2.upsert(k, 'value')
+
+    def test_bad_op(self):
+        self.assertRaises(ArgumentError, cbmulti.run, [len])
+
+
+class BootstrapTest(ConnectionTestCase):
+    def test_bootstrap(self):
+        buckets = cbmulti.bootstrap([self.make_connection] * 3, warmup=True)
+        self.assertEqual(3, len(buckets))
+        self.assertEqual(3, len(set(id(cb) for cb in buckets)))
+
+        k = self.gen_key('multi_bootstrap')
+        for cb in buckets:
+            self.assertTrue(cb.connected)
+            cb.upsert(k, 'value')
+
+    def test_bootstrap_error(self):
+        def bad_factory():
+            raise ArgumentError.pyexc('bad factory')
+
+        self.assertRaises(ArgumentError, cbmulti.bootstrap,
+                          [self.make_connection, bad_factory])
+
+    def test_warm_up(self):
+        # Should not fail, even if the probe keys do not exist
+        cbmulti.warm_up(self.cb)
+        cbmulti.warm_up(self.cb, nprobes=1)
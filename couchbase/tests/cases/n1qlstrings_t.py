@@ -112,4 +112,31 @@ class N1QLStringTest(CouchbaseTestCase):
 
         # Unset the timeout
         q.timeout = 0
-        self.assertFalse('timeout' in q._body)
\ No newline at end of file
+        self.assertFalse('timeout' in q._body)
+
+    def test_mutation_state_encoding(self):
+        ms = MutationState()
+        ms._add_scanvec((42, 3004, 3, 'default'))
+        ms._add_scanvec((1023, 3005, 12, 'default'))
+        ms._add_scanvec((666, 5551212, 99, 'other'))
+
+        self.assertEqual(ms._sv, MutationState.decode(ms.encode())._sv)
+        self.assertEqual(ms._sv,
+                         MutationState.decode_binary(ms.encode_binary())._sv)
+        self.assertRaises(ValueError, MutationState.decode_binary, b'junk')
+
+    def test_mutation_state_merge(self):
+        ms = MutationState()
+        ms._add_scanvec((42, 3004, 3, 'default'))
+
+        # Older sequence numbers do not override newer ones
+        ms._add_scanvec((42, 3004, 2, 'default'))
+        self.assertEqual({'default': {42: (3, '3004')}}, ms._sv)
+
+        other = MutationState()
+        other._add_scanvec((42, 3004, 7, 'default'))
+        other._add_scanvec((91, 7779, 23, 'default'))
+        ms.merge(other)
+        self.assertEqual({'default': {42: (7, '3004'), 91: (23, '7779')}},
+                         ms._sv)
+        self.assertFalse(MutationState())
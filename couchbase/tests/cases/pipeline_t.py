@@ -108,6 +108,12 @@ class PipelineTest(ConnectionTestCase):
         self.assertEqual(len(pipeline.results), 1)
         self.assertEqual(self.cb.get(k).value, "foo")
 
+        def compact():
+            with pipeline:
+                self.cb.get_multi([k], compact=True)
+
+        self.assertRaises(ArgumentError, compact)
+
     def test_multi_pipeline(self):
         kvs = self.gen_kv_dict(prefix="multi_pipeline")
 
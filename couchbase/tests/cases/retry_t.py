@@ -0,0 +1,98 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from couchbase.exceptions import (
+    ArgumentError, KeyExistsError, TemporaryFailError)
+from couchbase.retry import RetryPolicy
+from couchbase.tests.base import CouchbaseTestCase
+
+
+class FakeResult(object):
+    def __init__(self, key, rc):
+        self.key = key
+        self.rc = rc
+        self.success = rc == 0
+
+
+class RetryTest(CouchbaseTestCase):
+    def _flaky(self, failures):
+        # Returns a multi method failing each key with the rc
+        # at the head of its failure list
+        calls = []
+        def meth(keys):
+            calls.append(sorted(keys))
+            mres = {}
+            for k in keys:
+                rc = failures[k].pop(0) if failures[k] else 0
+                mres[k] = FakeResult(k, rc)
+            if any(not r.success for r in mres.values()):
+                raise TemporaryFailError({'all_results': mres})
+            return mres
+        return meth, calls
+
+    def test_backoff(self):
+        policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3,
+                             multiplier=2, jitter=0)
+        self.assertEqual([0.1, 0.2, 0.3, 0.3],
+                         [policy.backoff(x) for x in range(1, 5)])
+
+        policy.jitter = 0.5
+        for x in range(100):
+            self.assertTrue(0.05 <= policy.backoff(1) <= 0.1)
+
+        self.assertRaises(ArgumentError, RetryPolicy, max_attempts=0)
+        self.assertRaises(ArgumentError, RetryPolicy, jitter=2)
+
+    def test_retry_failed_keys(self):
+        tmpfail = TemporaryFailError.CODE
+        meth, calls = self._flaky({'a': [], 'b': [tmpfail, tmpfail], 'c': []})
+        policy = RetryPolicy(initial_backoff=0)
+        rv = policy.run(meth, ['a', 'b', 'c'])
+        self.assertEqual([['a', 'b', 'c'], ['b'], ['b']], calls)
+        self.assertTrue(all(r.success for r in rv.values()))
+
+    def test_give_up(self):
+        tmpfail = TemporaryFailError.CODE
+        meth, calls = self._flaky({'a': [tmpfail] * 5, 'b': []})
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0)
+        try:
+            policy.run(meth, {'a': 1, 'b': 2})
+            self.fail('Expected an exception')
+        except TemporaryFailError as e:
+            self.assertEqual(3, len(calls))
+            self.assertTrue(e.all_results['b'].success)
+            self.assertFalse(e.all_results['a'].success)
+
+    def test_non_retryable(self):
+        meth, calls = self._flaky({'a': [KeyExistsError.CODE], 'b': []})
+        policy = RetryPolicy(initial_backoff=0)
+        self.assertRaises(KeyExistsError, policy.run, meth, ['a', 'b'])
+        self.assertEqual(1, len(calls))
+
+        # The exception is for the key which still fails, not for the
+        # retried key which failed first
+        meth, calls = self._flaky({'a': [TemporaryFailError.CODE],
+                                   'b': [KeyExistsError.CODE]})
+        try:
+            policy.run(meth, ['a', 'b'])
+            self.fail('Expected an exception')
+        except KeyExistsError as e:
+            self.assertEqual([['a', 'b'], ['a']], calls)
+            self.assertTrue(e.all_results['a'].success)
+            self.assertFalse(e.all_results['b'].success)
+
+        self.assertRaises(ArgumentError, policy.run, meth, ['a'],
+                          compact=True)
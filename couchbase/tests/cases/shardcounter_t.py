@@ -0,0 +1,56 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from couchbase.counters import ShardedCounter
+from couchbase.exceptions import ArgumentError
+from couchbase.tests.base import ConnectionTestCase
+
+
+class ShardedCounterTest(ConnectionTestCase):
+    def test_sharded_counter(self):
+        counter = ShardedCounter(self.cb, self.gen_key('sharded'), nshards=4)
+        counter.reset()
+        self.assertEqual(0, counter.value())
+        self.assertEqual({}, counter.shard_values())
+
+        for _ in range(8):
+            counter.incr()
+        self.assertEqual(8, counter.value())
+
+        # Each shard was used twice
+        self.assertEqual(dict((k, 2) for k in counter.shard_keys),
+                         counter.shard_values())
+
+        mres = counter.incr_multi([1, 2, 3, 4, 5, 6])
+        self.assertTrue(mres.all_ok)
+        self.assertEqual(4, len(mres))
+        self.assertEqual(29, counter.value())
+
+        # Another client of the same counter sees the same total
+        other = ShardedCounter(self.cb, counter.key, nshards=4)
+        other.incr(10)
+        self.assertEqual(39, counter.value())
+
+        counter.reset()
+        self.assertEqual(0, other.value())
+
+    def test_badargs(self):
+        self.assertRaises(ArgumentError, ShardedCounter, self.cb, 'k',
+                          nshards=0)
+        counter = ShardedCounter(self.cb, self.gen_key('sharded_bad'))
+        self.assertRaises(ArgumentError, counter.incr, -1)
+        self.assertRaises(ArgumentError, counter.incr_multi, [1, -1])
@@ -232,3 +232,84 @@ class SubdocTest(ConnectionTestCase):
 
         cb.mutate_in(key, SD.array_prepend('array', [42]))
         self.assertEqual([[42], True, 1, 2, 3], cb.retrieve_in(key, 'array')[0])
+
+    def test_compiled_specs(self):
+        cb = self.cb
+        key = self.gen_key('sdcompiled')
+        cb.upsert(key, {'a': {'b': 1}, 'c': 'cval', 'tags': []})
+
+        lookup = SD.compile(SD.get('a.b'), SD.get('c'), SD.exists('d'))
+        self.assertIsInstance(lookup, tuple)
+        for _ in range(2):
+            rv = cb.lookup_in(key, lookup)
+            self.assertEqual(1, rv['a.b'])
+            self.assertEqual('cval', rv[1])
+            self.assertFalse(rv.exists('d'))
+
+        # Unpacked specs work as well
+        rv = cb.lookup_in(key, *lookup)
+        self.assertEqual('cval', rv['c'])
+
+        mutation = SD.compile(SD.upsert('c', SD.PARAM),
+                              SD.array_append('tags', SD.PARAM),
+                              SD.counter('a.b', 1))
+        self.assertEqual(2, mutation.nparams)
+        self.assertRaises(ValueError, mutation.bind, 'only_one')
+
+        cb.mutate_in(key, mutation.bind('first', 'dog'))
+        cb.mutate_in(key, mutation.bind({'nested': True},
+                                        SD.MultiValue('cat', 'mouse')))
+        self.assertEqual({'a': {'b': 3}, 'c': {'nested': True},
+                          'tags': ['dog', 'cat', 'mouse']},
+                         cb.get(key).value)
+
+    def test_subdoc_multi(self):
+        cb = self.cb
+        keys = [self.gen_key('sdmulti_{0}'.format(x)) for x in range(4)]
+        cb.upsert_multi(dict((k, {'n': x}) for x, k in enumerate(keys)))
+
+        mres = cb.mutate_in_multi(keys, SD.upsert('s', 'str'),
+                                  SD.counter('n', 10))
+        self.assertTrue(mres.all_ok)
+        self.assertEqual(set(keys), set(mres.keys()))
+
+        lookup = SD.compile(SD.get('n'), SD.get('s'))
+        mres = cb.lookup_in_multi(keys, lookup)
+        for x, k in enumerate(keys):
+            self.assertEqual(x + 10, mres[k]['n'])
+            self.assertEqual('str', mres[k][1])
+
+        # Different specs for each key
+        mres = cb.lookup_in_multi({keys[0]: (SD.get('n'),),
+                                   keys[1]: (SD.exists('s'),)})
+        self.assertEqual(10, mres[keys[0]][0])
+        self.assertTrue(mres[keys[1]].exists('s'))
+
+        mres = cb.lookup_in_multi({keys[0]: (lookup,)})
+        self.assertEqual(10, mres[keys[0]]['n'])
+
+        self.assertRaises(E.ArgumentError, cb.lookup_in_multi, keys)
+        self.assertRaises(E.ArgumentError, cb.lookup_in_multi,
+                          {keys[0]: (SD.get('n'),)}, SD.get('s'))
+
+        missing = self.gen_key('sdmulti_missing')
+        self.assertRaises(E.NotFoundError, cb.lookup_in_multi,
+                          [keys[0], missing], SD.get('n'))
+
+    def test_lazy_decode(self):
+        cb = self.cb
+        key = self.gen_key('sdlazy')
+        cb.upsert(key, {'a': {'nested': [1, 2]}, 'b': 'bval'})
+
+        rv = cb.lookup_in(key, SD.get('a'), SD.get('b'))
+        # Values are decoded once, on first access
+        self.assertEqual({'nested': [1, 2]}, rv['a'])
+        self.assertIs(rv['a'], rv[0])
+        self.assertEqual([{'nested': [1, 2]}, 'bval'], list(rv))
+
+        specs = SD.compile(SD.get('b'), SD.get('a'))
+        rv1 = cb.lookup_in(key, specs)
+        rv2 = cb.lookup_in(key, specs)
+        self.assertEqual('bval', rv1['b'])
+        self.assertEqual('bval', rv2['b'])
+        self.assertEqual({'b': 0, 'a': 1}, specs._path_index)
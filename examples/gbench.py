@@ -46,9 +46,15 @@ ap.add_argument('--vsize', default=128, type=int,
                 help="Value size to use")
 ap.add_argument('--iops', default=None, type=str,
                 help="Use Pure-Python IOPS plugin")
+ap.add_argument('--native-io', default=False, action='store_true',
+                help="Attach libcouchbase's libev plugin to the gevent "
+                "loop rather than dispatching I/O events through Python")
 ap.add_argument('-g', '--global-instance',
                 help="Use global instance", default=False,
                 action='store_true')
+ap.add_argument('--no-coalesce', default=False, action='store_true',
+                help="Schedule single-key operations of different "
+                "greenlets individually")
 ap.add_argument('--batch', '-N', type=int, help="Batch size", default=1)
 
 options = ap.parse_args()
@@ -56,7 +62,9 @@ options = ap.parse_args()
 GLOBAL_INSTANCE = None
 CONN_OPTIONS = {
         'connstr' : options.connstr,
-        'password': options.password
+        'password': options.password,
+        'native_io': options.native_io,
+        'coalesce': not options.no_coalesce
 }
 
 GLOBAL_INSTANCE = Bucket(**CONN_OPTIONS)
@@ -109,6 +117,8 @@ total_time = 0
 for t in worker_threads:
     total_time += t.wait_time
 
+print("I/O dispatch: %s" % ("native (libev)" if options.native_io
+                            else "Python IOPS"))
 print("Total run took an absolute time of %0.2f seconds" % (global_duration,))
 print("Did a total of %d operations" % (total_ops,))
 print("Total wait time of %0.2f seconds" % (total_time,))
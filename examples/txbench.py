@@ -22,6 +22,7 @@ from time import time
 from twisted.internet import reactor
 
 from txcouchbase.bucket import RawBucket, Bucket
+from txcouchbase.iops import v0Iops
 from couchbase import FMT_BYTES
 from couchbase.transcoder import Transcoder
 
@@ -58,6 +59,9 @@ ap.add_argument('--vsize', default=128, type=int,
                 help="Value size to use")
 
 ap.add_argument('--batch', '-N', type=int, default=1, help="Batch size to use")
+ap.add_argument('--legacy-iops', action='store_true', default=False,
+                help="Use the v0Iops reactor integration with one reactor "
+                "DelayedCall per timer, for comparison")
 
 options = ap.parse_args()
 
@@ -106,6 +110,8 @@ kwargs = {
 }
 if options.transcoder:
     kwargs['transcoder'] = Transcoder()
+if options.legacy_iops:
+    RawBucket._iops_class = v0Iops
 
 for _ in range(options.clients):
     cls = Bucket if options.deferreds else RawBucket
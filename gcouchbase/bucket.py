@@ -1,3 +1,6 @@
+from collections import OrderedDict
+import sys
+
 from gevent.event import AsyncResult, Event
 from gevent.hub import get_hub, getcurrent, Waiter
 
@@ -5,12 +8,98 @@ from couchbase.async.bucket import AsyncBucket
 from couchbase.async.view import AsyncViewBase
 from couchbase.async.n1ql import AsyncN1QLRequest
 from couchbase.views.iterator import AlreadyQueriedError
+from couchbase.exceptions import ArgumentError
 try:
     from gcouchbase.iops_gevent0x import IOPS
 except ImportError:
     from gcouchbase.iops_gevent10 import IOPS
 
 
+_STORE_OPTS = frozenset(('ttl', 'format', 'persist_to', 'replicate_to'))
+
+# Single-key operations which may be coalesced into their *_multi variant,
+# mapped to whether they take a value, and to the keyword arguments
+# which the *_multi variant accepts as well
+_COALESCE_OPS = {
+    'get': (False, frozenset(('ttl', 'quiet', 'replica', 'no_format'))),
+    'touch': (False, frozenset(('ttl',))),
+    'remove': (False, frozenset(('quiet',))),
+    'upsert': (True, _STORE_OPTS),
+    'insert': (True, _STORE_OPTS),
+    'replace': (True, _STORE_OPTS)
+}
+
+
+def _libev_unsupported(loop):
+    """
+    Check whether libcouchbase's libev plugin may run on `loop`.
+
+    The plugin links against the system's shared libev and operates on
+    the ``struct ev_loop`` directly. This is only safe if gevent uses that
+    same library: gevent's default embedded libev is built with different
+    options (e.g. an empty ``EV_COMMON``), so its loop structure has a
+    different layout, even for the same libev version.
+
+    :return: A string describing why the loop cannot be used, or `None`
+        if it can
+    """
+    modname = type(loop).__module__
+    if 'libev' not in modname and modname != 'gevent.core':
+        return 'the gevent loop is not based on libev'
+    core = sys.modules[modname]
+
+    embedded = getattr(core, 'LIBEV_EMBED', None)
+    if embedded is None:
+        return 'cannot determine whether gevent embeds its own libev'
+    if embedded:
+        return ('gevent uses its embedded libev. Build gevent with '
+                'LIBEV_EMBED=0 to use the system libev')
+
+    try:
+        gev = tuple(int(x) for x in
+                    core.get_version().split('-')[-1].split('.')[:2])
+    except (AttributeError, ValueError):
+        return 'cannot determine the libev version used by gevent'
+
+    try:
+        import ctypes
+        import ctypes.util
+        libname = ctypes.util.find_library('ev')
+        if not libname:
+            return 'cannot find the system libev'
+        libev = ctypes.CDLL(libname)
+        sysev = (libev.ev_version_major(), libev.ev_version_minor())
+    except (OSError, AttributeError):
+        return 'cannot determine the version of the system libev'
+
+    if gev != sysev:
+        return 'gevent uses libev {0}.{1}, but {2} is {3}.{4}'.format(
+            gev[0], gev[1], libname, sysev[0], sysev[1])
+
+    if not getattr(loop, 'ptr', None):
+        return 'cannot obtain the address of the gevent loop'
+    return None
+
+
+def native_loop():
+    """
+    Get the event loop of the current gevent hub in the form accepted by
+    the ``_ioloop`` argument of :class:`~couchbase.async.bucket.AsyncBucket`
+
+    :return: A tuple of ``(plugin_name, loop_address)``
+    :raise: :exc:`~couchbase.exceptions.ArgumentError` if the hub's loop
+        cannot be shared with libcouchbase's libev plugin. This requires
+        gevent to be built against the system libev (rather than its
+        embedded copy) which the plugin links against as well
+    """
+    loop = get_hub().loop
+    reason = _libev_unsupported(loop)
+    if reason:
+        raise ArgumentError.pyexc(
+            'Cannot use the gevent loop natively: ' + reason)
+    return ('libev', int(loop.ptr))
+
+
 class GRowsHandler(object):
     def __init__(self):
         """
@@ -78,8 +167,33 @@ class Bucket(AsyncBucket):
         This class is a 'GEvent'-optimized subclass of libcouchbase
         which utilizes the underlying IOPS structures and the gevent
         event primitives to efficiently utilize couroutine switching.
+
+        :param bool native_io: If true, libcouchbase's own libev plugin
+          is attached directly to the hub's event loop. Socket and timer
+          events are then handled entirely in C, and Python code only runs
+          when an operation completes. This requires a libev based gevent
+          loop built against the system libev (not gevent's
+          embedded copy), and the libev plugin for libcouchbase. See
+          :func:`native_loop`.
+        :param bool coalesce: If true (the default), compatible single-key
+          operations issued by different greenlets during the same
+          iteration of the event loop are scheduled together as one
+          ``*_multi`` operation, and their greenlets are woken from a
+          single completion callback. Operations passing options which the
+          ``*_multi`` variant does not support (for example `cas`) are
+          always scheduled individually.
         """
-        super(Bucket, self).__init__(IOPS(), *args, **kwargs)
+        self._coalesce = kwargs.pop('coalesce', True)
+        self._batches = OrderedDict()
+        self._batch_keys = set()
+        self._flush_pending = False
+
+        if kwargs.pop('native_io', False):
+            kwargs['_ioloop'] = native_loop()
+            iops = None
+        else:
+            iops = IOPS()
+        super(Bucket, self).__init__(iops, *args, **kwargs)
 
     def _do_ctor_connect(self):
         if self.connected:
@@ -104,9 +218,96 @@ class Bucket(AsyncBucket):
 
         return get_hub().switch()
 
+    def _batch_op(self, name, args, kwargs):
+        """
+        Queue a single-key operation to be scheduled together with others
+        of the same kind at the end of the current loop iteration.
+
+        :return: A :class:`Waiter` which receives the result, or `None` if
+          the operation cannot be coalesced
+        """
+        has_value, allowed = _COALESCE_OPS[name]
+        if len(args) != (2 if has_value else 1):
+            return None
+        if not allowed.issuperset(kwargs):
+            return None
+
+        key = args[0]
+        try:
+            gkey = (name, tuple(sorted(kwargs.items())))
+            if key in self._batch_keys:
+                # Operations on the same key must retain their order,
+                # whichever group the earlier one is in
+                self._flush_batches()
+            group = self._batches.get(gkey)
+        except TypeError:
+            # Unhashable key or option
+            return None
+
+        if group is None:
+            group = self._batches[gkey] = OrderedDict()
+
+        waiter = Waiter()
+        group[key] = (args[1] if has_value else None, waiter)
+        self._batch_keys.add(key)
+        if not self._flush_pending:
+            self._flush_pending = True
+            get_hub().loop.run_callback(self._flush_batches)
+        return waiter
+
+    def _flush_batches(self):
+        batches, self._batches = self._batches, OrderedDict()
+        self._batch_keys = set()
+        self._flush_pending = False
+        for (name, kwitems), group in batches.items():
+            self._schedule_batch(name, dict(kwitems), group)
+
+    def _schedule_batch(self, name, kwargs, group):
+        has_value = _COALESCE_OPS[name][0]
+        if len(group) == 1:
+            return self._schedule_each(name, kwargs, group)
+
+        if has_value:
+            keys = OrderedDict((k, v[0]) for k, v in group.items())
+        else:
+            keys = list(group)
+
+        try:
+            opres = getattr(AsyncBucket, name + '_multi')(self, keys, **kwargs)
+        except Exception:
+            # Most likely an invalid key or value. Schedule the operations
+            # one by one, so that only the offending ones fail
+            return self._schedule_each(name, kwargs, group)
+
+        self._fanout(opres, list(group),
+                     lambda k, res: group[k][1].switch(res),
+                     lambda k, exc: group[k][1].throw(exc))
+
+    def _schedule_each(self, name, kwargs, group):
+        meth = getattr(AsyncBucket, name)
+        has_value = _COALESCE_OPS[name][0]
+        for key, (value, waiter) in group.items():
+            args = (key, value) if has_value else (key,)
+            try:
+                opres = meth(self, *args, **kwargs)
+            except Exception:
+                # We may not be running in the hub
+                get_hub().loop.run_callback(waiter.throw, *sys.exc_info())
+                continue
+            opres.callback = waiter.switch
+            opres.errback = lambda r, x, y, z, w=waiter: w.throw(x, y, z)
+
     def _meth_factory(meth, name):
-        def ret(self, *args, **kwargs):
-            return self._waitwrap(meth(self, *args, **kwargs))
+        if name in _COALESCE_OPS:
+            def ret(self, *args, **kwargs):
+                if self._coalesce:
+                    waiter = self._batch_op(name, args, kwargs)
+                    if waiter is not None:
+                        return waiter.get()
+                return self._waitwrap(meth(self, *args, **kwargs))
+        else:
+            def ret(self, *args, **kwargs):
+                return self._waitwrap(meth(self, *args, **kwargs))
         return ret
 
     def _http_request(self, **kwargs):
@@ -134,3 +335,9 @@ class Bucket(AsyncBucket):
 
 
     locals().update(AsyncBucket._gen_memd_wrappers(_meth_factory))
+
+    def get_multi(self, keys, compact=False, **kwargs):
+        if compact:
+            # Wrap the results only once they have arrived
+            return self._get_multi_compact(self._waitwrap, keys, **kwargs)
+        return self._waitwrap(AsyncBucket.get_multi(self, keys, **kwargs))
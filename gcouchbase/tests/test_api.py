@@ -1,11 +1,13 @@
-from couchbase.tests.base import ApiImplementationMixin, SkipTest
+from couchbase.tests.base import (
+    ApiImplementationMixin, ConnectionTestCase, SkipTest)
 try:
     import gevent
 except ImportError as e:
     raise SkipTest(e)
 
-from gcouchbase.bucket import Bucket, GView
+from gcouchbase.bucket import Bucket, GView, native_loop
 from couchbase.tests.importer import get_configured_classes
+from couchbase.exceptions import ArgumentError, NotFoundError
 
 
 class GEventImplMixin(ApiImplementationMixin):
@@ -23,9 +25,68 @@ class GEventImplMixin(ApiImplementationMixin):
                 raise Exception("Not properly cleaned up!")
 
 
-skiplist = ('IopsTest', 'LockmodeTest', 'PipelineTest')
+skiplist = ('IopsTest', 'EpollIopsTest', 'LockmodeTest', 'PipelineTest',
+            'NodeSchedulerTest', 'BootstrapTest')
 
 configured_classes = get_configured_classes(GEventImplMixin,
                                             skiplist=skiplist)
 
 globals().update(configured_classes)
+
+
+class NativeIOBucket(Bucket):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('native_io', True)
+        super(NativeIOBucket, self).__init__(*args, **kwargs)
+
+
+class GEventNativeImplMixin(GEventImplMixin):
+    factory = NativeIOBucket
+
+
+def _have_native_loop():
+    try:
+        return native_loop() is not None
+    except ArgumentError:
+        return False
+
+
+if _have_native_loop():
+    globals().update(get_configured_classes(GEventNativeImplMixin,
+                                            skiplist=skiplist))
+
+
+class CoalesceTest(GEventImplMixin, ConnectionTestCase):
+    def test_coalesced_ops(self):
+        kv = self.gen_kv_dict(amount=20, prefix='coalesce')
+        self.cb.upsert_multi(kv)
+        missing = self.gen_key('coalesce_missing')
+        self.cb.remove(missing, quiet=True)
+
+        jobs = [gevent.spawn(self.cb.get, k) for k in kv]
+        jobs.append(gevent.spawn(self.cb.get, missing))
+        gevent.joinall(jobs)
+
+        for job, k in zip(jobs, kv):
+            self.assertTrue(job.successful())
+            self.assertEqual(kv[k], job.value.value)
+
+        self.assertIsInstance(jobs[-1].exception, NotFoundError)
+
+    def test_coalesced_same_key(self):
+        key = self.gen_key('coalesce_same_key')
+        jobs = [gevent.spawn(self.cb.upsert, key, x) for x in range(5)]
+        gevent.joinall(jobs)
+        self.assertTrue(all(job.successful() for job in jobs))
+        self.assertEqual(4, self.cb.get(key).value)
+
+    def test_coalesced_mixed_ops_same_key(self):
+        key = self.gen_key('coalesce_mixed_ops')
+        jobs = [gevent.spawn(self.cb.upsert, key, 'first'),
+                gevent.spawn(self.cb.get, key),
+                gevent.spawn(self.cb.replace, key, 'second'),
+                gevent.spawn(self.cb.get, key)]
+        gevent.joinall(jobs)
+        self.assertTrue(all(job.successful() for job in jobs))
+        self.assertEqual('first', jobs[1].value.value)
+        self.assertEqual('second', jobs[3].value.value)
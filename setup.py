@@ -84,6 +84,7 @@ SOURCEMODS = [
         'ctranscoder',
         'observe',
         'iops',
+        'nativeio',
         'connevents',
         'pipeline',
         'views',
@@ -291,6 +291,15 @@ Bucket__get_timings(pycbc_Bucket *self)
     return ll;
 }
 
+static PyObject *
+Bucket__iops_stats(pycbc_Bucket *self)
+{
+    if (!self->iopswrap) {
+        Py_RETURN_NONE;
+    }
+    return pycbc_iowrap_stats(self->iopswrap);
+}
+
 static PyObject *
 Bucket__mutinfo(pycbc_Bucket *self)
 {
@@ -484,6 +493,8 @@ static PyMethodDef Bucket_TABLE_methods[] = {
 
         OPFUNC(mutate_in, "Perform mutations in document paths"),
         OPFUNC(lookup_in, "Perform lookups in document paths"),
+        OPFUNC(mutate_in_multi, "Perform mutations in paths of multiple documents"),
+        OPFUNC(lookup_in_multi, "Perform lookups in paths of multiple documents"),
 
         OPFUNC(remove, "Delete a key in Couchbase"),
         OPFUNC(unlock, "Unlock a previously-locked key in Couchbase"),
@@ -582,12 +593,33 @@ static PyMethodDef Bucket_TABLE_methods[] = {
                 PyDoc_STR("Returns a tuple of (vbucket, server index) for a key")
         },
 
+        { "_vbmap_multi",
+                (PyCFunction)pycbc_Bucket__vbmap_multi,
+                METH_VARARGS,
+                PyDoc_STR("Returns a list of (vbucket, server index) tuples,\n"
+                          "one for each key in a sequence")
+        },
+
+        { "_node_host",
+                (PyCFunction)pycbc_Bucket__node_host,
+                METH_VARARGS,
+                PyDoc_STR("Returns the host:port of the data service for a\n"
+                          "server index, or None")
+        },
+
         { "_mutinfo",
                 (PyCFunction)Bucket__mutinfo,
                 METH_NOARGS,
                 PyDoc_STR("Gets known mutation information")
         },
 
+        { "_iops_stats",
+                (PyCFunction)Bucket__iops_stats,
+                METH_NOARGS,
+                PyDoc_STR("Gets the dispatch counters of a Python I/O plugin,\n"
+                          "or None if the bucket doesn't use one")
+        },
+
         { NULL, NULL, 0, NULL }
 };
 
@@ -601,6 +633,7 @@ Bucket__init__(pycbc_Bucket *self,
     lcb_error_t err;
     PyObject *unlock_gil_O = NULL;
     PyObject *iops_O = NULL;
+    PyObject *ioloop_O = NULL;
     PyObject *dfl_fmt = NULL;
     PyObject *tc = NULL;
 
@@ -624,7 +657,8 @@ Bucket__init__(pycbc_Bucket *self,
     X("lockmode", &self->lockmode, "i") \
     X("_flags", &self->flags, "I") \
     X("_conntype", &conntype, "i") \
-    X("_iops", &iops_O, "O")
+    X("_iops", &iops_O, "O") \
+    X("_ioloop", &ioloop_O, "O")
 
     static char *kwlist[] = {
         #define X(s, target, type) s,
@@ -668,6 +702,13 @@ Bucket__init__(pycbc_Bucket *self,
         self->iopswrap = pycbc_iowrap_new(self, iops_O);
         create_opts.v.v3.io = pycbc_iowrap_getiops(self->iopswrap);
         self->unlock_gil = 0;
+
+    } else if (ioloop_O && ioloop_O != Py_None) {
+        if (pycbc_nativeio_create(ioloop_O, &create_opts.v.v3.io) != 0) {
+            return -1;
+        }
+        self->nativeloop = 1;
+        self->unlock_gil = 0;
     }
 
     if (dfl_fmt == Py_None || dfl_fmt == NULL) {
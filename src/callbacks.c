@@ -37,6 +37,11 @@ cb_thr_end(pycbc_Bucket *self)
 static void
 cb_thr_begin(pycbc_Bucket *self)
 {
+    if (self->nativeloop) {
+        pycbc_nativeio_decref_leave(self);
+        return;
+    }
+
     if (Py_REFCNT(self) > 1) {
         Py_DECREF(self);
         PYCBC_CONN_THR_BEGIN(self);
@@ -88,6 +93,37 @@ maybe_push_operr(pycbc_MultiResult *mres, pycbc_Result *res, lcb_error_t err,
 }
 
 
+/*
+ * Decode a key or value of a response to `mres`. Once the operation has an
+ * exception pending, failures are not wrapped in another one, which
+ * pycbc_multiresult_adderr() would only discard
+ */
+static int
+mres_decode_key(pycbc_MultiResult *mres, const void *key, size_t nkey,
+                PyObject **pobj)
+{
+    int rv;
+    pycbc_Bucket *conn = mres->parent;
+
+    conn->tc_nowrap = mres->exceptions != NULL;
+    rv = pycbc_tc_decode_key(conn, key, nkey, pobj);
+    conn->tc_nowrap = 0;
+    return rv;
+}
+
+static int
+mres_decode_value(pycbc_MultiResult *mres, const void *value, size_t nvalue,
+                  lcb_U32 flags, PyObject **pobj)
+{
+    int rv;
+    pycbc_Bucket *conn = mres->parent;
+
+    conn->tc_nowrap = mres->exceptions != NULL;
+    rv = pycbc_tc_decode_value(conn, value, nvalue, flags, pobj);
+    conn->tc_nowrap = 0;
+    return rv;
+}
+
 static void
 operation_completed(pycbc_Bucket *self, pycbc_MultiResult *mres)
 {
@@ -139,7 +175,7 @@ get_common_objects(const lcb_RESPBASE *resp, pycbc_Bucket **conn,
 
     CB_THR_END(*conn);
 
-    rv = pycbc_tc_decode_key(*conn, resp->key, resp->nkey, &hkey);
+    rv = mres_decode_key(*mres, resp->key, resp->nkey, &hkey);
 
     if (rv < 0) {
         pycbc_multiresult_adderr(*mres);
@@ -202,7 +238,9 @@ get_common_objects(const lcb_RESPBASE *resp, pycbc_Bucket **conn,
         Py_DECREF(*res);
     }
 
-    if (resp->rc) {
+    if (resp->rc || ((*mres)->mropts & PYCBC_MRES_F_UALLOCED)) {
+        /* Items may be reused, and must not keep the status of a
+         * previous operation */
         (*res)->rc = resp->rc;
     }
 
@@ -336,6 +374,70 @@ durability_chain_common(lcb_t instance, int cbtype, const lcb_RESPBASE *resp)
     dur_chain2(conn, mres, res, cbtype, resp);
 }
 
+/**
+ * Handles a retrieval for a MultiResult in 'compact' mode. The value is
+ * placed in the result columns; a result object is only created for the
+ * failure (if any) to be raised.
+ */
+static void
+compact_value_callback(const lcb_RESPGET *resp)
+{
+    pycbc_MultiResult *mres = (pycbc_MultiResult *)resp->cookie;
+    pycbc_Bucket *conn = mres->parent;
+    PyObject *hkey = NULL, *value = NULL;
+    lcb_error_t rc = resp->rc;
+    Py_ssize_t ix;
+
+    CB_THR_END(conn);
+
+    if (mres_decode_key(mres, resp->key, resp->nkey, &hkey) < 0) {
+        pycbc_multiresult_adderr(mres);
+
+        /* Record the key under its raw bytes, so it is still accounted
+         * for in the results */
+        hkey = PyBytes_FromStringAndSize(resp->key, resp->nkey);
+        if (!hkey) {
+            PyErr_Clear();
+            goto GT_DONE;
+        }
+        rc = PYCBC_ERR_DECODE;
+    }
+
+    if (rc == LCB_SUCCESS) {
+        lcb_U32 eflags = resp->itmflags;
+        if (mres->mropts & PYCBC_MRES_F_FORCEBYTES) {
+            eflags = PYCBC_FMT_BYTES;
+        }
+        if (mres_decode_value(mres, resp->value, resp->nvalue,
+                              eflags, &value) < 0) {
+            pycbc_multiresult_adderr(mres);
+            rc = PYCBC_ERR_DECODE;
+        }
+    } else {
+        mres->all_ok = 0;
+    }
+
+    ix = pycbc_multiresult_compact_add(mres, hkey, value, resp->cas,
+                                       resp->itmflags, rc);
+    if (ix < 0) {
+        pycbc_multiresult_adderr(mres);
+
+    } else if (resp->rc != LCB_SUCCESS && mres->errop == NULL &&
+            !((mres->mropts & PYCBC_MRES_F_QUIET) &&
+                    resp->rc == LCB_KEY_ENOENT)) {
+        mres->errop = (PyObject *)pycbc_multiresult_compact_result(mres, ix);
+        if (!mres->errop) {
+            pycbc_multiresult_adderr(mres);
+        }
+    }
+
+    GT_DONE:
+    Py_XDECREF(hkey);
+    Py_XDECREF(value);
+    operation_completed(conn, mres);
+    CB_THR_BEGIN(conn);
+}
+
 static void
 value_callback(lcb_t instance, int cbtype, const lcb_RESPBASE *resp)
 {
@@ -344,6 +446,14 @@ value_callback(lcb_t instance, int cbtype, const lcb_RESPBASE *resp)
     pycbc_ValueResult *res = NULL;
     pycbc_MultiResult *mres = NULL;
 
+    if (cbtype != LCB_CALLBACK_COUNTER &&
+            (((pycbc_MultiResult *)resp->cookie)->mropts &
+                    PYCBC_MRES_F_COMPACT)) {
+        compact_value_callback((const lcb_RESPGET *)resp);
+        (void)instance;
+        return;
+    }
+
     rv = get_common_objects(resp, &conn, (pycbc_Result**)&res, RESTYPE_VALUE,
         &mres);
 
@@ -364,19 +474,23 @@ value_callback(lcb_t instance, int cbtype, const lcb_RESPBASE *resp)
         lcb_U32 eflags;
 
         res->flags = gresp->itmflags;
+        /* Clear the value of an Item from a previous operation */
+        Py_CLEAR(res->value);
         if (mres->mropts & PYCBC_MRES_F_FORCEBYTES) {
             eflags = PYCBC_FMT_BYTES;
         } else {
             eflags = gresp->itmflags;
         }
 
-        rv = pycbc_tc_decode_value(mres->parent, gresp->value, gresp->nvalue,
+        rv = mres_decode_value(mres, gresp->value, gresp->nvalue,
             eflags, &res->value);
         if (rv < 0) {
+            res->rc = PYCBC_ERR_DECODE;
             pycbc_multiresult_adderr(mres);
         }
     } else if (cbtype == LCB_CALLBACK_COUNTER) {
         const lcb_RESPCOUNTER *cresp = (const lcb_RESPCOUNTER *)resp;
+        Py_XDECREF(res->value);
         res->value = pycbc_IntFromULL(cresp->value);
     }
 
@@ -390,7 +504,16 @@ static void
 mk_sd_error(pycbc__SDResult *res,
     pycbc_MultiResult *mres, lcb_error_t rc, size_t ix)
 {
-    PyObject *spec = PyTuple_GET_ITEM(res->specs, ix);
+    PyObject *spec;
+
+    if (mres->exceptions) {
+        /* An exception is already pending. Don't build another one which
+         * would be discarded; the status is kept in the result's tuple */
+        mres->all_ok = 0;
+        return;
+    }
+
+    spec = PyTuple_GET_ITEM(res->specs, ix);
     PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_LCBERR, rc, "Subcommand failure", spec);
     pycbc_multiresult_adderr(mres);
 }
@@ -400,9 +523,13 @@ mk_sd_tuple(const lcb_SDENTRY *ent)
 {
     PyObject *val = NULL;
     PyObject *ret;
+
+    /* The value is kept as raw JSON, and is only decoded when accessed
+     * (see SubdocResult._resolve). Lookups often fetch more paths than
+     * the application ends up reading */
     if (ent->status == LCB_SUCCESS && ent->nvalue != 0) {
-        int rv = pycbc_tc_simple_decode(&val, ent->value, ent->nvalue, PYCBC_FMT_JSON);
-        if (rv != 0) {
+        val = PyBytes_FromStringAndSize(ent->value, ent->nvalue);
+        if (val == NULL) {
             return NULL;
         }
     }
@@ -585,7 +712,10 @@ observe_callback(lcb_t instance, int cbtype, const lcb_RESPBASE *resp_base)
 
     if (resp_base->rflags & LCB_RESP_F_FINAL) {
         mres = (pycbc_MultiResult*)resp_base->cookie;
-        operation_completed(mres->parent, mres);
+        conn = mres->parent;
+        CB_THR_END(conn);
+        operation_completed(conn, mres);
+        CB_THR_BEGIN(conn);
         return;
     }
 
@@ -636,6 +766,13 @@ start_global_callback(lcb_t instance, pycbc_Bucket **selfptr)
 static void
 end_global_callback(lcb_t instance, pycbc_Bucket *self)
 {
+    if (self->nativeloop) {
+        /* Still referenced from CB_THR_END() */
+        Py_DECREF((PyObject *)(self));
+        CB_THR_BEGIN(self);
+        return;
+    }
+
     Py_DECREF((PyObject *)(self));
 
     self = (pycbc_Bucket *)lcb_get_cookie(instance);
@@ -395,6 +395,7 @@ pycbc_Bucket__vbmap(pycbc_Bucket *conn, PyObject *args)
 
     if (!PyArg_ParseTuple(args, "s#", &s, &slen)) {
         PYCBC_EXCTHROW_ARGS();
+        return NULL;
     }
 
     memset(&info, 0, sizeof(info));
@@ -411,3 +412,83 @@ pycbc_Bucket__vbmap(pycbc_Bucket *conn, PyObject *args)
     PyTuple_SET_ITEM(rtuple, 1, pycbc_IntFromL(info.v.v0.server_index));
     return rtuple;
 }
+
+PyObject *
+pycbc_Bucket__vbmap_multi(pycbc_Bucket *conn, PyObject *args)
+{
+    PyObject *keys_O = NULL, *seq = NULL, *ret = NULL;
+    Py_ssize_t ii, nkeys;
+
+    if (!PyArg_ParseTuple(args, "O", &keys_O)) {
+        PYCBC_EXCTHROW_ARGS();
+        return NULL;
+    }
+
+    seq = PySequence_Fast(keys_O, "keys must be a sequence");
+    if (!seq) {
+        return NULL;
+    }
+
+    nkeys = PySequence_Fast_GET_SIZE(seq);
+    ret = PyList_New(nkeys);
+    if (!ret) {
+        goto GT_DONE;
+    }
+
+    for (ii = 0; ii < nkeys; ii++) {
+        struct vbinfo_st info;
+        pycbc_pybuffer keybuf = { NULL };
+        PyObject *rtuple;
+        lcb_error_t err;
+
+        if (pycbc_tc_encode_key(conn,
+                                PySequence_Fast_GET_ITEM(seq, ii),
+                                &keybuf) < 0) {
+            Py_CLEAR(ret);
+            goto GT_DONE;
+        }
+
+        memset(&info, 0, sizeof(info));
+        info.v.v0.key = keybuf.buffer;
+        info.v.v0.nkey = keybuf.length;
+        err = lcb_cntl(conn->instance, CNTL_GET, CNTL_VBMAP, &info);
+        PYCBC_PYBUF_RELEASE(&keybuf);
+
+        if (err != LCB_SUCCESS) {
+            PYCBC_EXC_WRAP(PYCBC_EXC_ARGUMENTS, 0, "lcb_cntl failed");
+            Py_CLEAR(ret);
+            goto GT_DONE;
+        }
+
+        rtuple = PyTuple_New(2);
+        PyTuple_SET_ITEM(rtuple, 0, pycbc_IntFromL(info.v.v0.vbucket));
+        PyTuple_SET_ITEM(rtuple, 1, pycbc_IntFromL(info.v.v0.server_index));
+        PyList_SET_ITEM(ret, ii, rtuple);
+    }
+
+    GT_DONE:
+    Py_DECREF(seq);
+    return ret;
+}
+
+PyObject *
+pycbc_Bucket__node_host(pycbc_Bucket *conn, PyObject *args)
+{
+    int ix = 0;
+    const char *host;
+
+    if (!PyArg_ParseTuple(args, "i", &ix)) {
+        PYCBC_EXCTHROW_ARGS();
+        return NULL;
+    }
+
+    if (ix < 0) {
+        Py_RETURN_NONE;
+    }
+
+    host = lcb_get_node(conn->instance, LCB_NODE_DATA, ix);
+    if (host == NULL) {
+        Py_RETURN_NONE;
+    }
+    return pycbc_SimpleStringZ(host);
+}
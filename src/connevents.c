@@ -61,12 +61,19 @@ struct dtor_info_st {
     PyObject *iowrap;
     PyObject *dtorcb;
     PyObject *conncb;
+    int nativeloop;
 };
 
 static void
 dtor_callback(const void *arg)
 {
     struct dtor_info_st *dti = (void*)arg;
+    PyGILState_STATE gstate = PyGILState_UNLOCKED;
+
+    if (dti->nativeloop) {
+        /* Invoked from an external loop, which doesn't hold the GIL */
+        gstate = PyGILState_Ensure();
+    }
 
     if (dti->conncb) {
         PyObject *ret;
@@ -95,6 +102,9 @@ dtor_callback(const void *arg)
     if (dti->iowrap) {
         Py_DECREF(dti->iowrap);
     }
+    if (dti->nativeloop) {
+        PyGILState_Release(gstate);
+    }
     free(dti);
 }
 
@@ -118,6 +128,7 @@ pycbc_schedule_dtor_event(pycbc_Bucket *self)
         dti->iowrap = self->iopswrap;
         dti->dtorcb = self->dtorcb;
         dti->conncb = self->conncb;
+        dti->nativeloop = self->nativeloop;
     }
 
     lcb_set_destroy_callback(self->instance, dtor_callback);
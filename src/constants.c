@@ -109,6 +109,7 @@ do_all_constants(PyObject *module,
     ADD_MACRO(PYCBC_EXC_THREADING);
     ADD_MACRO(PYCBC_EXC_DESTROYED);
     ADD_MACRO(PYCBC_EXC_PIPELINE);
+    ADD_MACRO(PYCBC_ERR_DECODE);
 
     ADD_MACRO(LCB_TYPE_BUCKET);
     ADD_MACRO(LCB_TYPE_CLUSTER);
@@ -175,6 +176,7 @@ do_all_constants(PyObject *module,
     ADD_MACRO(LCB_CNTL_SSL_MODE);
     ADD_MACRO(LCB_SSL_ENABLED);
     ADD_MACRO(LCB_CNTL_N1QL_TIMEOUT);
+    ADD_MACRO(LCB_CNTL_CONFIG_CACHE_LOADED);
 
     /* View options */
     ADD_MACRO(LCB_CMDVIEWQUERY_F_INCLUDE_DOCS);
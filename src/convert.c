@@ -47,7 +47,7 @@ enum {
 };
 
 static PyObject *
-convert_to_string(const char *buf, size_t nbuf, int mode)
+convert_to_string(const char *buf, size_t nbuf, int mode, int nowrap)
 {
     PyObject *ret = NULL;
 
@@ -62,7 +62,9 @@ convert_to_string(const char *buf, size_t nbuf, int mode)
     }
 
     if (mode == CONVERT_MODE_UTF8_ONLY) {
-        PYCBC_EXC_WRAP(PYCBC_EXC_ENCODING, 0, "Couldn't decode as UTF-8");
+        if (!nowrap) {
+            PYCBC_EXC_WRAP(PYCBC_EXC_ENCODING, 0, "Couldn't decode as UTF-8");
+        }
         return NULL;
     }
 
@@ -160,8 +162,13 @@ encode_common(PyObject *src, pycbc_pybuffer *dst, lcb_U32 flags)
 }
 
 
+/**
+ * If `nowrap` is set, a failure leaves the underlying Python error in place
+ * rather than wrapping it in a ValueFormatError. See pycbc_Bucket::tc_nowrap
+ */
 static int
-decode_common(PyObject **vp, const char *buf, size_t nbuf, lcb_uint32_t flags)
+decode_common(PyObject **vp, const char *buf, size_t nbuf, lcb_uint32_t flags,
+              int nowrap)
 {
     PyObject *decoded = NULL;
 
@@ -175,14 +182,14 @@ decode_common(PyObject **vp, const char *buf, size_t nbuf, lcb_uint32_t flags)
         (flags == PYCBC_FMT_LEGACY_##fmtbase)
 
     if (FMT_MATCHES(UTF8)) {
-        decoded = convert_to_string(buf, nbuf, CONVERT_MODE_UTF8_ONLY);
+        decoded = convert_to_string(buf, nbuf, CONVERT_MODE_UTF8_ONLY, nowrap);
         if (!decoded) {
             return -1;
         }
 
     } else if (FMT_MATCHES(BYTES)) {
         GT_BYTES:
-        decoded = convert_to_string(buf, nbuf, CONVERT_MODE_BYTES_ONLY);
+        decoded = convert_to_string(buf, nbuf, CONVERT_MODE_BYTES_ONLY, 0);
         pycbc_assert(decoded);
 
     } else {
@@ -192,12 +199,12 @@ decode_common(PyObject **vp, const char *buf, size_t nbuf, lcb_uint32_t flags)
 
         if (FMT_MATCHES(PICKLE)) {
             converter = pycbc_helpers.pickle_decode;
-            first_arg = convert_to_string(buf, nbuf, CONVERT_MODE_BYTES_ONLY);
+            first_arg = convert_to_string(buf, nbuf, CONVERT_MODE_BYTES_ONLY, 0);
             pycbc_assert(first_arg);
 
         } else if (FMT_MATCHES(JSON)) {
             converter = pycbc_helpers.json_decode;
-            first_arg = convert_to_string(buf, nbuf, CONVERT_MODE_UTF8_ONLY);
+            first_arg = convert_to_string(buf, nbuf, CONVERT_MODE_UTF8_ONLY, nowrap);
 
             if (!first_arg) {
                 return -1;
@@ -217,7 +224,11 @@ decode_common(PyObject **vp, const char *buf, size_t nbuf, lcb_uint32_t flags)
     }
 
     if (!decoded) {
-        PyObject *bytes_tmp = PyBytes_FromStringAndSize(buf, nbuf);
+        PyObject *bytes_tmp;
+        if (nowrap) {
+            return -1;
+        }
+        bytes_tmp = PyBytes_FromStringAndSize(buf, nbuf);
         PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ENCODING, 0, "Failed to decode bytes",
                            bytes_tmp);
         Py_XDECREF(bytes_tmp);
@@ -239,7 +250,7 @@ pycbc_tc_simple_encode(PyObject *src, pycbc_pybuffer *dst, lcb_U32 flags)
 int
 pycbc_tc_simple_decode(PyObject **vp, const char *buf, size_t nbuf, lcb_U32 flags)
 {
-    return decode_common(vp, buf, nbuf, flags);
+    return decode_common(vp, buf, nbuf, flags, 0);
 }
 
 enum {
@@ -292,6 +303,9 @@ do_call_tc(pycbc_Bucket *conn, PyObject *obj, PyObject *flags,
     *result = PyObject_Call(meth, args, NULL);
     if (*result) {
         ret = 0;
+    } else if (conn->tc_nowrap &&
+            (mode == DECODE_KEY || mode == DECODE_VALUE)) {
+        ret = -1;
     } else {
         PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ENCODING, 0,
                            "User-Defined transcoder failed",
@@ -366,7 +380,8 @@ pycbc_tc_decode_key(pycbc_Bucket *conn, const void *key, size_t nkey,
         *pobj = bobj;
 
     } else if (!conn->tc) {
-        return decode_common(pobj, key, nkey, PYCBC_FMT_UTF8);
+        return decode_common(pobj, key, nkey, PYCBC_FMT_UTF8,
+                             conn->tc_nowrap);
 
     } else {
         bobj = PyBytes_FromStringAndSize(key, nkey);
@@ -388,6 +403,10 @@ pycbc_tc_decode_key(pycbc_Bucket *conn, const void *key, size_t nkey,
     }
 
     if (PyObject_Hash(*pobj) == -1) {
+        if (conn->tc_nowrap) {
+            Py_XDECREF(*pobj);
+            return -1;
+        }
         PYCBC_EXC_WRAP_KEY(PYCBC_EXC_ENCODING, 0,
                            "Transcoder.decode_key must return a hashable object",
                            *pobj);
@@ -521,7 +540,7 @@ pycbc_tc_decode_value(pycbc_Bucket *conn,
     int rv;
 
     if (conn->data_passthrough == 0 && conn->tc == NULL) {
-        return decode_common(pobj, value, nvalue, flags);
+        return decode_common(pobj, value, nvalue, flags, conn->tc_nowrap);
     }
 
     if (conn->data_passthrough) {
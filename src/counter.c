@@ -76,6 +76,10 @@ handle_single_arith(pycbc_Bucket *self, struct pycbc_common_vars *cv,
         }
     }
 
+    if (cv->arritm.active && cv->arritm.ttl) {
+        my_params.ttl = cv->arritm.ttl;
+    }
+
     LCB_CMD_SET_KEY(&cmd, keybuf.buffer, keybuf.length);
     cmd.delta = my_params.delta;
     cmd.create = my_params.create;
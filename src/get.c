@@ -60,6 +60,14 @@ handle_single_key(pycbc_Bucket *self, struct pycbc_common_vars *cv, int optype,
 
     LCB_CMD_SET_KEY(&u_cmd.base, keybuf.buffer, keybuf.length);
 
+    if (cv->arritm.active) {
+        /* Values of an ItemArray are not meaningful for retrievals */
+        curval = NULL;
+        if (cv->arritm.ttl) {
+            ttl = cv->arritm.ttl;
+        }
+    }
+
     if (curval && gv->allow_dval && options == NULL) {
         options = curval;
     }
@@ -200,15 +208,16 @@ get_common(pycbc_Bucket *self, PyObject *args, PyObject *kwargs, int optype,
     PyObject *ttl_O = NULL;
     PyObject *replica_O = NULL;
     PyObject *nofmt_O = NULL;
+    PyObject *compact_O = NULL;
 
     struct pycbc_common_vars cv = PYCBC_COMMON_VARS_STATIC_INIT;
     struct getcmd_vars_st gv = { 0 };
     static char *kwlist[] = {
-            "keys", "ttl", "quiet", "replica", "no_format", NULL
+            "keys", "ttl", "quiet", "replica", "no_format", "compact", NULL
     };
 
-    rv = PyArg_ParseTupleAndKeywords(args, kwargs, "O|OOOO", kwlist,
-        &kobj, &ttl_O, &is_quiet, &replica_O, &nofmt_O);
+    rv = PyArg_ParseTupleAndKeywords(args, kwargs, "O|OOOOO", kwlist,
+        &kobj, &ttl_O, &is_quiet, &replica_O, &nofmt_O, &compact_O);
 
     if (!rv) {
         PYCBC_EXCTHROW_ARGS()
@@ -274,6 +283,26 @@ get_common(pycbc_Bucket *self, PyObject *args, PyObject *kwargs, int optype,
                 ? PYCBC_MRES_F_FORCEBYTES : 0;
     }
 
+    if (compact_O && PyObject_IsTrue(compact_O)) {
+        if (!(argopts & PYCBC_ARGOPT_MULTI) ||
+                optype == PYCBC_CMD_TOUCH || (seqtype & PYCBC_SEQTYPE_F_ITM)) {
+            PYCBC_EXC_WRAP(PYCBC_EXC_ARGUMENTS, 0,
+                           "compact is only valid for multi retrievals "
+                           "without Items");
+            goto GT_DONE;
+        }
+        if (self->pipeline_queue) {
+            /* The raw result would be placed in the pipeline's results,
+             * where the values in its compact columns are not visible */
+            PYCBC_EXC_WRAP(PYCBC_EXC_ARGUMENTS, 0,
+                           "compact is not supported in pipelines");
+            goto GT_DONE;
+        }
+        if (pycbc_multiresult_set_compact(cv.mres, ncmds) != 0) {
+            goto GT_DONE;
+        }
+    }
+
     if (argopts & PYCBC_ARGOPT_MULTI) {
         rv = pycbc_oputil_iter_multi(self, seqtype, kobj, &cv, optype,
             handle_single_key, &gv);
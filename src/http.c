@@ -116,6 +116,12 @@ pycbc_httpresult_complete(pycbc_HttpResult *htres, pycbc_MultiResult *mres,
 {
     int should_raise = 0;
     pycbc_Bucket *bucket = htres->parent;
+    int nativeloop = bucket->nativeloop;
+
+    if (nativeloop) {
+        /* Keep the bucket alive until we leave the callback */
+        Py_INCREF(bucket);
+    }
 
     if (htres->rc == LCB_SUCCESS) {
         htres->rc = err;
@@ -154,7 +160,11 @@ pycbc_httpresult_complete(pycbc_HttpResult *htres, pycbc_MultiResult *mres,
         ares->nops--;
         Py_INCREF(ares);
         pycbc_asyncresult_invoke(ares);
-        /* We don't handle the GIL in async mode */
+        /* We don't handle the GIL in async mode, unless it was acquired
+         * upon entry from an external loop */
+        if (nativeloop) {
+            pycbc_nativeio_decref_leave(bucket);
+        }
     }
 }
 
@@ -79,7 +79,10 @@ static void event_fire_common(pycbc_Event *ev, short which)
     }
     Py_INCREF(ev);
     parent = ev->parent;
-    Py_XINCREF(parent);
+    if (parent) {
+        Py_INCREF(parent);
+        ((pycbc_IOPSWrapper *)parent)->stats.fired++;
+    }
     ev->cb.handler(fd, which, ev->cb.data);
     Py_XDECREF(parent);
     Py_DECREF(ev);
@@ -128,6 +131,61 @@ Event_on_readwrite(pycbc_Event *ev)
     READY_RETURN();
 }
 
+/**
+ * e.g.:
+ * Event.ready_all([(event1, LCB_READ_EVENT), (event2, LCB_RW_EVENT)])
+ *
+ * Delivers a whole poll's worth of notifications in a single call. Events
+ * which are no longer active (e.g. because a previous notification in the
+ * same batch unwatched them) are skipped. Delivery stops at the first
+ * error; the remaining events are still ready and will be reported by
+ * the next poll.
+ */
+static PyObject *
+Event_ready_all(PyObject *unused, PyObject *events)
+{
+    PyObject *seq;
+    Py_ssize_t ii, nevents;
+
+    seq = PySequence_Fast(events, "ready_all() expects a sequence");
+    if (!seq) {
+        return NULL;
+    }
+
+    nevents = PySequence_Fast_GET_SIZE(seq);
+    for (ii = 0; ii < nevents && !PyErr_Occurred(); ii++) {
+        PyObject *pair = PySequence_Fast_GET_ITEM(seq, ii);
+        pycbc_Event *ev;
+        long flags;
+
+        if (!PyTuple_Check(pair) || PyTuple_GET_SIZE(pair) != 2 ||
+                !PyObject_TypeCheck(PyTuple_GET_ITEM(pair, 0),
+                                    &pycbc_EventType)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "Expected a sequence of (event, flags) tuples");
+            break;
+        }
+
+        flags = pycbc_IntAsL(PyTuple_GET_ITEM(pair, 1));
+        if (flags == -1 && PyErr_Occurred()) {
+            break;
+        }
+
+        ev = (pycbc_Event *)PyTuple_GET_ITEM(pair, 0);
+        if (ev->state != PYCBC_EVSTATE_ACTIVE) {
+            continue;
+        }
+        if (ev->parent) {
+            ((pycbc_IOPSWrapper *)ev->parent)->stats.batched++;
+        }
+        event_fire_common(ev, (short)flags);
+    }
+
+    Py_DECREF(seq);
+    (void)unused;
+    READY_RETURN();
+}
+
 static PyObject *
 IOEvent_fileno(pycbc_IOEvent *self, PyObject *args)
 {
@@ -172,6 +230,14 @@ static struct PyMethodDef pycbc_Event_TABLE_methods[] = {
                           "``ready(LCB_READ_EVENT|LCB_WRITE_EVENT)``\n")
         },
 
+        { "ready_all",
+                (PyCFunction)Event_ready_all,
+                METH_O|METH_STATIC,
+                PyDoc_STR("Deliver a sequence of (event, flags) tuples.\n"
+                          "This is equivalent to calling ``ready(flags)``\n"
+                          "on each active event, in a single call\n")
+        },
+
         { NULL }
 };
 
@@ -291,6 +357,7 @@ IOPSWrapper_traverse(pycbc_IOPSWrapper *self, visitproc visit, void *arg)
     #define X(n, ign) Py_VISIT(self->n);
     XIONAME_CACHENTRIES(X);
     #undef X
+    Py_VISIT(self->argtuple);
     Py_VISIT(self->parent);
     Py_VISIT(self->pyio);
     return 0;
@@ -302,6 +369,7 @@ IOPSWrapper_clear(pycbc_IOPSWrapper *self)
     #define X(n, ign) Py_CLEAR(self->n);
     XIONAME_CACHENTRIES(X);
     #undef X
+    Py_CLEAR(self->argtuple);
     Py_CLEAR(self->parent);
     Py_CLEAR(self->pyio);
 }
@@ -380,6 +448,52 @@ do_safecall(PyObject *callable, PyObject *args)
     return result;
 }
 
+/**
+ * Get the argument tuple for a call to update_event or update_timer. The
+ * cached tuple is used unless it is still referenced from elsewhere (e.g.
+ * if the Python method kept its *args)
+ */
+static PyObject *
+get_argtuple(pycbc_IOPSWrapper *pio)
+{
+    PyObject *ret = pio->argtuple;
+    pio->argtuple = NULL;
+    if (ret && Py_REFCNT(ret) == 1) {
+        return ret;
+    }
+
+    Py_XDECREF(ret);
+    pio->stats.tuples++;
+    ret = PyTuple_New(3);
+    PyTuple_SET_ITEM(ret, 0, Py_None); Py_INCREF(Py_None);
+    PyTuple_SET_ITEM(ret, 1, Py_None); Py_INCREF(Py_None);
+    PyTuple_SET_ITEM(ret, 2, Py_None); Py_INCREF(Py_None);
+    return ret;
+}
+
+static void
+set_tuple_item(PyObject *tuple, Py_ssize_t ix, PyObject *item)
+{
+    PyObject *old = PyTuple_GET_ITEM(tuple, ix);
+    PyTuple_SET_ITEM(tuple, ix, item);
+    Py_DECREF(old);
+}
+
+static void
+release_argtuple(pycbc_IOPSWrapper *pio, PyObject *argtuple)
+{
+    if (pio->argtuple || Py_REFCNT(argtuple) != 1) {
+        /* Nested call, or still referenced elsewhere */
+        Py_DECREF(argtuple);
+        return;
+    }
+
+    /* Don't keep the event (or anything else) alive through the cache */
+    Py_INCREF(Py_None);
+    set_tuple_item(argtuple, 0, Py_None);
+    pio->argtuple = argtuple;
+}
+
 static int
 modify_event_python(pycbc_IOPSWrapper *pio, pycbc_Event *ev,
                     pycbc_evaction_t action, lcb_socket_t newsock, void *arg)
@@ -393,26 +507,28 @@ modify_event_python(pycbc_IOPSWrapper *pio, pycbc_Event *ev,
     short flags = 0;
     unsigned long usecs = 0;
 
-    argtuple = PyTuple_New(3);
+    argtuple = get_argtuple(pio);
     Py_INCREF((PyObject *)ev);
-    PyTuple_SET_ITEM(argtuple, 0, (PyObject *)ev);
-    PyTuple_SET_ITEM(argtuple, 1, pycbc_IntFromL(action));
+    set_tuple_item(argtuple, 0, (PyObject *)ev);
+    set_tuple_item(argtuple, 1, pycbc_IntFromL(action));
 
     if (ev->type == PYCBC_EVTYPE_IO) {
         flags = *(short*)arg;
         o_arg = pycbc_IntFromL(flags);
         ((pycbc_IOEvent *)ev)->fd = newsock;
         meth = pio->modevent;
+        pio->stats.modevent++;
 
     } else {
         usecs = *(lcb_uint32_t*)arg;
         o_arg = pycbc_IntFromL(usecs);
         meth = pio->modtimer;
+        pio->stats.modtimer++;
     }
-    PyTuple_SET_ITEM(argtuple, 2, o_arg);
+    set_tuple_item(argtuple, 2, o_arg);
 
     result = do_safecall(meth, argtuple);
-    Py_DECREF(argtuple);
+    release_argtuple(pio, argtuple);
     Py_XDECREF(result);
 
     if (ev->type == PYCBC_EVTYPE_IO) {
@@ -520,6 +636,7 @@ update_event(lcb_io_opt_t io, lcb_socket_t sock, void *event, short flags,
     ev->cb.data = data;
 
     if (ev->flags == flags && new_state == ev->state && ev->fd == sock) {
+        PYCBC_IOW_FROM_IOPS(io)->stats.skipped++;
         return 0;
     }
 
@@ -534,6 +651,11 @@ delete_event(lcb_io_opt_t io, lcb_socket_t sock, void *event)
     pycbc_IOPSWrapper *pio = PYCBC_IOW_FROM_IOPS(io);
     short tmp = 0;
 
+    if (ev->state != PYCBC_EVSTATE_ACTIVE) {
+        /* Never watched, or already unwatched */
+        pio->stats.skipped++;
+        return;
+    }
     modify_event_python(pio, ev, PYCBC_EVACTION_UNWATCH, sock, &tmp);
 }
 
@@ -542,6 +664,11 @@ delete_timer(lcb_io_opt_t io, void *timer)
 {
     lcb_U32 dummy = 0;
     pycbc_IOPSWrapper *pio = PYCBC_IOW_FROM_IOPS(io);
+
+    if (((pycbc_Event *)timer)->state != PYCBC_EVSTATE_ACTIVE) {
+        pio->stats.skipped++;
+        return;
+    }
     modify_event_python(pio, (pycbc_Event*)timer, PYCBC_EVACTION_UNWATCH, -1,
                         &dummy);
 }
@@ -670,6 +797,27 @@ pycbc_iowrap_new(pycbc_Bucket *unused, PyObject *pyio)
     return (PyObject *)wrapper;
 }
 
+PyObject *
+pycbc_iowrap_stats(PyObject *iowrap)
+{
+    pycbc_IOPSWrapper *pio = (pycbc_IOPSWrapper *)iowrap;
+    PyObject *ret = PyDict_New();
+
+    #define X(name) { \
+        PyObject *tmp = PyLong_FromUnsignedLong(pio->stats.name); \
+        PyDict_SetItemString(ret, #name, tmp); \
+        Py_DECREF(tmp); \
+    }
+    X(modevent);
+    X(modtimer);
+    X(skipped);
+    X(fired);
+    X(batched);
+    X(tuples);
+    #undef X
+    return ret;
+}
+
 lcb_io_opt_t
 pycbc_iowrap_getiops(PyObject *iowrap)
 {
@@ -94,6 +94,27 @@ typedef struct pycbc_IOPSWrapper_st {
     PyObject *modtimer;
     PyObject *startwatch;
     PyObject *stopwatch;
+
+    /**
+     * Argument tuple for the modevent/modtimer methods, reused for each
+     * call unless the Python code retained a reference to it
+     */
+    PyObject *argtuple;
+
+    /** Counters, exposed via Bucket._iops_stats() */
+    struct {
+        /** Calls into the Python update_event/update_timer methods */
+        unsigned long modevent;
+        unsigned long modtimer;
+        /** Watch changes which were redundant and not passed to Python */
+        unsigned long skipped;
+        /** Readiness notifications delivered to the library */
+        unsigned long fired;
+        /** Of those, how many were delivered via Event.ready_all() */
+        unsigned long batched;
+        /** Argument tuples which had to be allocated */
+        unsigned long tuples;
+    } stats;
 } pycbc_IOPSWrapper;
 
 #define PYCBC_IOW_FROM_IOPS(p) LCB_IOPS_BASEFLD(p, cookie)
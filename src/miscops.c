@@ -62,6 +62,9 @@ handle_single_keyop(pycbc_Bucket *self, struct pycbc_common_vars *cv, int optype
     if (item) {
         cas = item->cas;
 
+    } else if (cv->arritm.active) {
+        cas = cv->arritm.cas;
+
     } else if (curval) {
         if (PyDict_Check(curval)) {
             PyObject *cas_o = PyDict_GetItemString(curval, "cas");
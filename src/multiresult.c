@@ -32,7 +32,195 @@ PyTypeObject pycbc_MultiResultType = {
         0
 };
 
+static void
+compact_free(pycbc_compact_results *compact)
+{
+    if (!compact) {
+        return;
+    }
+    Py_XDECREF(compact->keys);
+    Py_XDECREF(compact->values);
+    free(compact->cas);
+    free(compact->flags);
+    free(compact->rc);
+    free(compact);
+}
+
+int
+pycbc_multiresult_set_compact(pycbc_MultiResult *self, Py_ssize_t nhint)
+{
+    pycbc_compact_results *compact;
+
+    if (self->compact) {
+        return 0;
+    }
+
+    if (nhint < 1) {
+        nhint = 1;
+    }
+
+    compact = calloc(1, sizeof(*compact));
+    if (!compact) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    compact->keys = PyList_New(0);
+    compact->values = PyList_New(0);
+    compact->cas = malloc(sizeof(*compact->cas) * nhint);
+    compact->flags = malloc(sizeof(*compact->flags) * nhint);
+    compact->rc = malloc(sizeof(*compact->rc) * nhint);
+    compact->nalloc = nhint;
+
+    if (!compact->keys || !compact->values || !compact->cas ||
+            !compact->flags || !compact->rc) {
+        compact_free(compact);
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    self->compact = compact;
+    self->mropts |= PYCBC_MRES_F_COMPACT;
+    return 0;
+}
+
+Py_ssize_t
+pycbc_multiresult_compact_add(pycbc_MultiResult *self, PyObject *key,
+    PyObject *value, lcb_U64 cas, lcb_U32 flags, lcb_error_t rc)
+{
+    pycbc_compact_results *compact = self->compact;
+    Py_ssize_t ix = PyList_GET_SIZE(compact->keys);
+
+    if (ix == compact->nalloc) {
+        Py_ssize_t nalloc = compact->nalloc * 2;
+        void *p;
+
+        if (!(p = realloc(compact->cas, sizeof(*compact->cas) * nalloc))) {
+            goto GT_NOMEM;
+        }
+        compact->cas = p;
+        if (!(p = realloc(compact->flags, sizeof(*compact->flags) * nalloc))) {
+            goto GT_NOMEM;
+        }
+        compact->flags = p;
+        if (!(p = realloc(compact->rc, sizeof(*compact->rc) * nalloc))) {
+            goto GT_NOMEM;
+        }
+        compact->rc = p;
+        compact->nalloc = nalloc;
+    }
+
+    if (!value) {
+        value = Py_None;
+    }
+
+    if (PyList_Append(compact->keys, key) != 0) {
+        return -1;
+    }
+    if (PyList_Append(compact->values, value) != 0) {
+        PyList_SetSlice(compact->keys, ix, ix + 1, NULL);
+        return -1;
+    }
+
+    compact->cas[ix] = cas;
+    compact->flags[ix] = flags;
+    compact->rc[ix] = rc;
+    return ix;
+
+    GT_NOMEM:
+    PyErr_NoMemory();
+    return -1;
+}
+
+pycbc_ValueResult *
+pycbc_multiresult_compact_result(pycbc_MultiResult *self, Py_ssize_t ix)
+{
+    pycbc_compact_results *compact = self->compact;
+    pycbc_ValueResult *res;
+
+    if (!compact || ix < 0 || ix >= PyList_GET_SIZE(compact->keys)) {
+        PyErr_SetString(PyExc_IndexError, "No such compact result");
+        return NULL;
+    }
+
+    res = pycbc_valresult_new(self->parent);
+    if (!res) {
+        return NULL;
+    }
+
+    res->key = PyList_GET_ITEM(compact->keys, ix);
+    Py_INCREF(res->key);
+    res->rc = compact->rc[ix];
+    res->cas = compact->cas[ix];
+    res->flags = compact->flags[ix];
+    if (res->rc == LCB_SUCCESS) {
+        res->value = PyList_GET_ITEM(compact->values, ix);
+        Py_INCREF(res->value);
+    }
+    return res;
+}
+
+static PyObject *
+MultiResult_compact_columns(pycbc_MultiResult *self, PyObject *args)
+{
+    (void)args;
+    if (!self->compact) {
+        Py_RETURN_NONE;
+    }
+    return Py_BuildValue("(OO)", self->compact->keys, self->compact->values);
+}
+
+static PyObject *
+MultiResult_compact_result(pycbc_MultiResult *self, PyObject *arg)
+{
+    Py_ssize_t ix = PyNumber_AsSsize_t(arg, PyExc_IndexError);
+    if (ix == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return (PyObject *)pycbc_multiresult_compact_result(self, ix);
+}
+
+static PyObject *
+MultiResult_compact_failed(pycbc_MultiResult *self, PyObject *args)
+{
+    Py_ssize_t ii, nitems;
+    PyObject *ret = PyList_New(0);
+
+    (void)args;
+    if (!ret || !self->compact) {
+        return ret;
+    }
+
+    nitems = PyList_GET_SIZE(self->compact->keys);
+    for (ii = 0; ii < nitems; ii++) {
+        PyObject *ix;
+        if (self->compact->rc[ii] == LCB_SUCCESS) {
+            continue;
+        }
+        ix = pycbc_IntFromL((long)ii);
+        if (!ix || PyList_Append(ret, ix) != 0) {
+            Py_XDECREF(ix);
+            Py_DECREF(ret);
+            return NULL;
+        }
+        Py_DECREF(ix);
+    }
+    return ret;
+}
+
 static PyMethodDef MultiResult_TABLE_methods[] = {
+        { "_compact_columns", (PyCFunction)MultiResult_compact_columns,
+                METH_NOARGS,
+                PyDoc_STR("Get the (keys, values) lists of a compact result")
+        },
+        { "_compact_result", (PyCFunction)MultiResult_compact_result,
+                METH_O,
+                PyDoc_STR("Create a ValueResult for the given index")
+        },
+        { "_compact_failed", (PyCFunction)MultiResult_compact_failed,
+                METH_NOARGS,
+                PyDoc_STR("Get the indexes of the failed compact results")
+        },
         { NULL }
 };
 
@@ -140,6 +328,7 @@ MultiResultType__init__(pycbc_MultiResult *self, PyObject *args, PyObject *kwarg
     self->exceptions = NULL;
     self->errop = NULL;
     self->mropts = 0;
+    self->compact = NULL;
 
     return 0;
 }
@@ -150,6 +339,7 @@ MultiResult_dealloc(pycbc_MultiResult *self)
     Py_XDECREF(self->parent);
     Py_XDECREF(self->exceptions);
     Py_XDECREF(self->errop);
+    compact_free(self->compact);
     pycbc_multiresult_destroy_dict(self);
 }
 
@@ -268,10 +458,15 @@ pycbc_multiresult_adderr(pycbc_MultiResult* mres)
 {
     PyObject *etuple;
     mres->all_ok = 0;
-    if (!mres->exceptions) {
-        mres->exceptions = PyList_New(0);
+    if (mres->exceptions) {
+        /* Only the first exception is ever raised. The error codes of the
+         * other keys remain available in their results */
+        PyErr_Clear();
+        return;
     }
 
+    mres->exceptions = PyList_New(0);
+
     etuple = pycbc_exc_mktuple();
     PyList_Append(mres->exceptions, etuple);
     Py_DECREF(etuple);
@@ -0,0 +1,106 @@
+/**
+ *     Copyright 2016 Couchbase, Inc.
+ *
+ *   Licensed under the Apache License, Version 2.0 (the "License");
+ *   you may not use this file except in compliance with the License.
+ *   You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *   Unless required by applicable law or agreed to in writing, software
+ *   distributed under the License is distributed on an "AS IS" BASIS,
+ *   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *   See the License for the specific language governing permissions and
+ *   limitations under the License.
+ **/
+
+/**
+ * Support for libcouchbase's own I/O plugins running on an event loop
+ * owned by a Python framework (e.g. gevent's libev loop).
+ *
+ * Unlike the IOPS wrapper in iops.c, socket readiness and timers are
+ * handled entirely in C by the plugin; Python is entered only to deliver
+ * operation results. The framework runs its loop without holding the GIL,
+ * so it is acquired when the first callback is entered, and released once
+ * the outermost callback returns.
+ */
+
+#include "pycbc.h"
+
+int
+pycbc_nativeio_create(PyObject *spec, lcb_io_opt_t *io)
+{
+    const char *name = NULL;
+    unsigned PY_LONG_LONG addr = 0;
+    struct lcb_create_io_ops_st cio = { 0 };
+    lcb_error_t err;
+
+    if (!PyTuple_Check(spec) ||
+            !PyArg_ParseTuple(spec, "sK", &name, &addr)) {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                           "_ioloop must be a tuple of (name, address)",
+                           spec);
+        return -1;
+    }
+
+    if (addr == 0) {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                           "Loop address must not be NULL", spec);
+        return -1;
+    }
+
+    if (strcmp(name, "libev") == 0) {
+        cio.v.v0.type = LCB_IO_OPS_LIBEV;
+    } else {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                           "Unsupported loop type", spec);
+        return -1;
+    }
+
+    cio.version = 0;
+    cio.v.v0.cookie = (void *)(size_t)addr;
+
+    err = lcb_create_io_ops(io, &cio);
+    if (err != LCB_SUCCESS) {
+        PYCBC_EXC_WRAP(PYCBC_EXC_LCBERR, err,
+                       "Couldn't create I/O plugin for the event loop. "
+                       "The plugin may not be installed");
+        return -1;
+    }
+
+    /* Let the instance destroy the plugin along with itself */
+    (*io)->v.base.need_cleanup = 1;
+    return 0;
+}
+
+void
+pycbc_nativeio_enter(pycbc_Bucket *conn)
+{
+    if (conn->nativeloop_depth++ == 0) {
+        conn->nativeloop_gilstate = PyGILState_Ensure();
+    }
+}
+
+void
+pycbc_nativeio_leave(pycbc_Bucket *conn)
+{
+    pycbc_assert(conn->nativeloop_depth > 0);
+    if (--conn->nativeloop_depth == 0) {
+        PyGILState_Release(conn->nativeloop_gilstate);
+    }
+}
+
+void
+pycbc_nativeio_decref_leave(pycbc_Bucket *conn)
+{
+    PyGILState_STATE gstate = conn->nativeloop_gilstate;
+    int release;
+
+    pycbc_assert(conn->nativeloop_depth > 0);
+    release = --conn->nativeloop_depth == 0;
+
+    Py_DECREF((PyObject *)conn);
+    if (release) {
+        PyGILState_Release(gstate);
+    }
+}
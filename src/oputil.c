@@ -148,6 +148,15 @@ pycbc_oputil_check_sequence(PyObject *sequence,
         *seqtype = PYCBC_SEQTYPE_TUPLE;
         *ncmds = PyTuple_GET_SIZE(sequence);
 
+    } else if (PyObject_IsInstance(sequence, pycbc_helpers.itmarray_type)) {
+        *ncmds = PyObject_Length(sequence);
+        if (*ncmds == -1) {
+            PYCBC_EXC_WRAP(PYCBC_EXC_INTERNAL, 0,
+                           "ItemArray did not return proper length");
+            ret = -1;
+        }
+        *seqtype = PYCBC_SEQTYPE_GENERIC | PYCBC_SEQTYPE_F_ARRAY;
+
     } else if (PyObject_IsInstance(sequence, pycbc_helpers.itmcoll_base_type)) {
         *ncmds = PyObject_Length(sequence);
         if (*ncmds == -1) {
@@ -338,6 +347,98 @@ extract_item_params(struct pycbc_common_vars *cv,
     return 0;
 }
 
+#define _is_valid_column(c, n) \
+    ((c) == Py_None || (PyList_Check(c) && PyList_GET_SIZE(c) == (n)))
+
+/**
+ * Iterate over the columns of an ItemArray. No Item or options objects are
+ * involved; the per-key CAS and expiration are passed to the handler via
+ * cv->arritm
+ */
+static int
+iter_array(pycbc_Bucket *self,
+           PyObject *collection,
+           struct pycbc_common_vars *cv,
+           int optype,
+           pycbc_oputil_keyhandler handler,
+           void *arg)
+{
+    int rv = 0;
+    Py_ssize_t ii;
+    PyObject *cols, *keys, *values, *cas_l, *ttl_l;
+
+    cols = PyObject_CallMethod(collection, "_columns", NULL);
+    if (!cols) {
+        return -1;
+    }
+
+    if (!PyArg_ParseTuple(cols, "OOOO", &keys, &values, &cas_l, &ttl_l)) {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                           "Invalid ItemArray columns", cols);
+        Py_DECREF(cols);
+        return -1;
+    }
+
+    if (keys == Py_None || !_is_valid_column(keys, cv->ncmds) ||
+            !_is_valid_column(values, cv->ncmds) ||
+            !_is_valid_column(cas_l, cv->ncmds) ||
+            !_is_valid_column(ttl_l, cv->ncmds)) {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                           "ItemArray columns must be lists of equal length",
+                           cols);
+        Py_DECREF(cols);
+        return -1;
+    }
+
+    cv->arritm.active = 1;
+
+    for (ii = 0; ii < cv->ncmds; ii++) {
+        PyObject *k, *v = NULL;
+
+        cv->arritm.cas = 0;
+        cv->arritm.ttl = 0;
+
+        if (cas_l != Py_None) {
+            PyObject *cas_O = PyList_GET_ITEM(cas_l, ii);
+            cv->arritm.cas = pycbc_IntAsULL(cas_O);
+            if (cv->arritm.cas == (lcb_U64)-1 && PyErr_Occurred()) {
+                PyErr_Clear();
+                PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                                   "Invalid CAS specified", cas_O);
+                rv = -1;
+                break;
+            }
+        }
+
+        if (ttl_l != Py_None &&
+                pycbc_get_ttl(PyList_GET_ITEM(ttl_l, ii),
+                              &cv->arritm.ttl, 1) < 0) {
+            rv = -1;
+            break;
+        }
+
+        k = PyList_GET_ITEM(keys, ii);
+        if (values != Py_None) {
+            v = PyList_GET_ITEM(values, ii);
+        }
+
+        /* The handler may call into Python code which modifies the lists */
+        Py_INCREF(k);
+        Py_XINCREF(v);
+        rv = handler(self, cv, optype, k, v, NULL, NULL, arg);
+        Py_DECREF(k);
+        Py_XDECREF(v);
+
+        if (rv == -1) {
+            break;
+        }
+    }
+
+    cv->arritm.active = 0;
+    Py_DECREF(cols);
+    return rv;
+}
+
 int
 pycbc_oputil_iter_multi(pycbc_Bucket *self,
                         pycbc_seqtype_t seqtype,
@@ -353,6 +454,10 @@ pycbc_oputil_iter_multi(pycbc_Bucket *self,
     PyObject *seqobj;
     Py_ssize_t dictpos = 0;
 
+    if (seqtype & PYCBC_SEQTYPE_F_ARRAY) {
+        return iter_array(self, collection, cv, optype, handler, arg);
+    }
+
     seqobj = pycbc_oputil_iter_prepare(seqtype, collection, &iterobj, &dictpos);
     if (seqobj == NULL) {
         return -1;
@@ -457,6 +562,11 @@ pycbc_oputil_wait_common(pycbc_Bucket *self)
      * possible
      */
 
+    if (self->nativeloop) {
+        /* The loop is run by its owner; running it here would reenter it */
+        return;
+    }
+
     PYCBC_CONN_THR_BEGIN(self);
     lcb_wait3(self->instance, LCB_WAIT_NOCHECK);
     PYCBC_CONN_THR_END(self);
@@ -522,6 +632,117 @@ pycbc_encode_sd_keypath(pycbc_Bucket *conn, PyObject *src,
     return rv;
 }
 
+static int
+sd_encode_value(PyObject *pyspec, int op, PyObject *val, pycbc_pybuffer *valbuf)
+{
+    int is_multival = 0;
+
+    if (PyObject_IsInstance(val, pycbc_helpers.sd_multival_type)) {
+        /* Verify the operation allows it */
+        switch (op) {
+        case LCB_SDCMD_ARRAY_ADD_FIRST:
+        case LCB_SDCMD_ARRAY_ADD_LAST:
+        case LCB_SDCMD_ARRAY_INSERT:
+            is_multival = 1;
+            break;
+        default:
+            PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                "MultiValue not supported for operation", pyspec);
+            return -1;
+        }
+    }
+
+    if (pycbc_tc_simple_encode(val, valbuf, PYCBC_FMT_JSON) != 0) {
+        return -1;
+    }
+
+    if (is_multival) {
+        /* Strip first and last [ */
+        const char *buf = (const char *)valbuf->buffer;
+        size_t len = valbuf->length;
+
+        for (; isspace(*buf) && len; len--, buf++) {
+        }
+        for (; len && isspace(buf[len-1]); len--) {
+        }
+        if (len < 3 || buf[0] != '[' || buf[len-1] != ']') {
+            PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ENCODING, 0,
+                "Serialized MultiValue shows invalid JSON (maybe empty?)",
+                pyspec);
+            PYCBC_PYBUF_RELEASE(valbuf);
+            return -1;
+        }
+
+        buf++;
+        len -= 2;
+        valbuf->buffer = buf;
+        valbuf->length = len;
+    }
+    return 0;
+}
+
+static void
+sd_use_bytes(PyObject *bytesobj, pycbc_pybuffer *buf)
+{
+    Py_INCREF(bytesobj);
+    buf->pyobj = bytesobj;
+    buf->buffer = PyBytes_AS_STRING(bytesobj);
+    buf->length = PyBytes_GET_SIZE(bytesobj);
+}
+
+/**
+ * Convert a spec from couchbase.subdocument.compile(). These are tuples of
+ * (op, path, value, create, encoded_path[, encoded_value]); the path (and
+ * the value, if it was known at compile time) are already encoded.
+ * If encoded_value is None, the value is encoded here
+ */
+static int
+sd_convert_compiled(PyObject *pyspec, lcb_SDSPEC *sdspec,
+    pycbc_pybuffer *pathbuf, pycbc_pybuffer *valbuf)
+{
+    Py_ssize_t nitems = PyTuple_GET_SIZE(pyspec);
+    PyObject *encpath = PyTuple_GET_ITEM(pyspec, 4);
+    long op = pycbc_IntAsL(PyTuple_GET_ITEM(pyspec, 0));
+    long create = pycbc_IntAsL(PyTuple_GET_ITEM(pyspec, 3));
+
+    if ((op == -1 || create == -1) && PyErr_Occurred()) {
+        PyErr_Clear();
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0, "Invalid compiled spec",
+                           pyspec);
+        return -1;
+    }
+    if (nitems > 6 || !PyBytes_Check(encpath)) {
+        PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0, "Invalid compiled spec",
+                           pyspec);
+        return -1;
+    }
+
+    sdspec->sdcmd = op;
+    sdspec->options = create ? LCB_SDSPEC_F_MKINTERMEDIATES : 0;
+    sd_use_bytes(encpath, pathbuf);
+    LCB_SDSPEC_SET_PATH(sdspec, pathbuf->buffer, pathbuf->length);
+
+    if (nitems == 6) {
+        PyObject *encval = PyTuple_GET_ITEM(pyspec, 5);
+        if (encval == Py_None) {
+            if (sd_encode_value(pyspec, op,
+                                PyTuple_GET_ITEM(pyspec, 2), valbuf) != 0) {
+                PYCBC_PYBUF_RELEASE(pathbuf);
+                return -1;
+            }
+        } else if (PyBytes_Check(encval)) {
+            sd_use_bytes(encval, valbuf);
+        } else {
+            PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
+                               "Invalid compiled spec", pyspec);
+            PYCBC_PYBUF_RELEASE(pathbuf);
+            return -1;
+        }
+        LCB_SDSPEC_SET_VALUE(sdspec, valbuf->buffer, valbuf->length);
+    }
+    return 0;
+}
+
 static int
 sd_convert_spec(PyObject *pyspec, lcb_SDSPEC *sdspec,
     pycbc_pybuffer *pathbuf, pycbc_pybuffer *valbuf)
@@ -535,6 +756,10 @@ sd_convert_spec(PyObject *pyspec, lcb_SDSPEC *sdspec,
         return -1;
     }
 
+    if (PyTuple_GET_SIZE(pyspec) > 4) {
+        return sd_convert_compiled(pyspec, sdspec, pathbuf, valbuf);
+    }
+
     if (!PyArg_ParseTuple(pyspec, "iO|Oi", &op, &path, &val, &create)) {
         PYCBC_EXCTHROW_ARGS();
         return -1;
@@ -547,49 +772,9 @@ sd_convert_spec(PyObject *pyspec, lcb_SDSPEC *sdspec,
     sdspec->options = create ? LCB_SDSPEC_F_MKINTERMEDIATES : 0;
     LCB_SDSPEC_SET_PATH(sdspec, pathbuf->buffer, pathbuf->length);
     if (val != NULL) {
-        int is_multival = 0;
-
-        if (PyObject_IsInstance(val, pycbc_helpers.sd_multival_type)) {
-            /* Verify the operation allows it */
-            switch (op) {
-            case LCB_SDCMD_ARRAY_ADD_FIRST:
-            case LCB_SDCMD_ARRAY_ADD_LAST:
-            case LCB_SDCMD_ARRAY_INSERT:
-                is_multival = 1;
-                break;
-            default:
-                PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ARGUMENTS, 0,
-                    "MultiValue not supported for operation", pyspec);
-                goto GT_ERROR;
-            }
-        }
-
-        if (pycbc_tc_simple_encode(val, valbuf, PYCBC_FMT_JSON) != 0) {
+        if (sd_encode_value(pyspec, op, val, valbuf) != 0) {
             goto GT_ERROR;
         }
-
-        if (is_multival) {
-            /* Strip first and last [ */
-            const char *buf = (const char *)valbuf->buffer;
-            size_t len = valbuf->length;
-
-            for (; isspace(*buf) && len; len--, buf++) {
-            }
-            for (; len && isspace(buf[len-1]); len--) {
-            }
-            if (len < 3 || buf[0] != '[' || buf[len-1] != ']') {
-                PYCBC_EXC_WRAP_OBJ(PYCBC_EXC_ENCODING, 0,
-                    "Serialized MultiValue shows invalid JSON (maybe empty?)",
-                    pyspec);
-                goto GT_ERROR;
-            }
-
-            buf++;
-            len -= 2;
-            valbuf->buffer = buf;
-            valbuf->length = len;
-        }
-
         LCB_SDSPEC_SET_VALUE(sdspec, valbuf->buffer, valbuf->length);
     }
     return 0;
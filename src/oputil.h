@@ -45,7 +45,14 @@ typedef enum {
 
     /** Special sequence classes for Items */
     PYCBC_SEQTYPE_F_ITM     = 1 << 4,
-    PYCBC_SEQTYPE_F_OPTS    = 1 << 5
+    PYCBC_SEQTYPE_F_OPTS    = 1 << 5,
+
+    /**
+     * ItemArray. Keys and per-key parameters are read directly from its
+     * column lists by pycbc_oputil_iter_multi; other users iterate it as
+     * a generic sequence
+     */
+    PYCBC_SEQTYPE_F_ARRAY   = 1 << 6
 } pycbc_seqtype_t;
 
 
@@ -89,6 +96,17 @@ struct pycbc_common_vars {
     char is_seqcmd;
 
     lcb_MULTICMD_CTX *mctx;
+
+    /**
+     * Per-key CAS and expiration of the current key, when iterating over
+     * an ItemArray. Handlers use these in place of the values otherwise
+     * extracted from an Item or from the per-key value.
+     */
+    struct {
+        int active;
+        lcb_U64 cas;
+        unsigned long ttl;
+    } arritm;
 };
 
 #define PYCBC_COMMON_VARS_STATIC_INIT { 0 }
@@ -302,6 +320,7 @@ PYCBC_DECL_OP(prepend);
 
 /* subdoc (store.c) */
 PYCBC_DECL_OP(mutate_in);
+PYCBC_DECL_OP(mutate_in_multi);
 
 /* subdoc (get.c) */
 PYCBC_DECL_OP(lookup_in);
@@ -203,6 +203,13 @@ enum {
     PYCBC_EXC_PIPELINE
 };
 
+/**
+ * Error code recorded in the result of a key whose value could not be
+ * decoded. This is above the range reserved for libcouchbase's own codes
+ * (below LCB_MAX_ERROR, 0x1000), and maps to ValueFormatError
+ */
+#define PYCBC_ERR_DECODE 0x1001
+
 /* Argument options */
 enum {
     /** Entry point is a single key variant */
@@ -323,9 +330,25 @@ typedef struct {
     /** Whether GIL handling is in effect */
     unsigned int unlock_gil;
 
+    /**
+     * Whether I/O is driven from C by an external event loop (see
+     * pycbc_nativeio_create()). Callbacks arrive from that loop without
+     * the GIL, which is acquired for the outermost callback only.
+     */
+    unsigned int nativeloop;
+    unsigned int nativeloop_depth;
+    PyGILState_STATE nativeloop_gilstate;
+
     /** Don't decode anything */
     unsigned int data_passthrough;
 
+    /**
+     * Set while decoding a response of an operation which already has an
+     * exception pending. Decoding failures then leave the Python error as
+     * is, rather than wrapping it in an exception which would be discarded
+     */
+    unsigned int tc_nowrap;
+
     /** whether __init__ has already been called */
     unsigned char init_called;
 
@@ -451,8 +474,29 @@ enum {
     PYCBC_MRES_F_SINGLE = 1 << 6,
 
     /* Hint to dispatch to the view callback functions */
-    PYCBC_MRES_F_VIEWS = 1 << 7
+    PYCBC_MRES_F_VIEWS = 1 << 7,
+
+    /**
+     * Retrievals are stored in the 'compact' columns rather than as
+     * individual result objects in the dictionary
+     */
+    PYCBC_MRES_F_COMPACT = 1 << 8
 };
+
+/**
+ * Column storage for the results of a 'compact' retrieval. Keys and values
+ * are kept in lists; result objects are only created on request.
+ *
+ * See multiresult.c
+ */
+typedef struct {
+    PyObject *keys;
+    PyObject *values;
+    lcb_U64 *cas;
+    lcb_U32 *flags;
+    lcb_error_t *rc;
+    Py_ssize_t nalloc;
+} pycbc_compact_results;
 /**
  * Object containing the result of a 'Multi' operation. It's the same as a
  * normal dict, except we add an 'all_ok' field, so a user doesn't need to
@@ -482,6 +526,9 @@ typedef struct pycbc_MultiResult_st {
 
     /** Options for 'MultiResult' */
     int mropts;
+
+    /** Result columns, if PYCBC_MRES_F_COMPACT is set */
+    pycbc_compact_results *compact;
 } pycbc_MultiResult;
 
 typedef struct {
@@ -659,6 +706,7 @@ extern PyObject *pycbc_ExceptionType;
     X(itmcoll_base_type) \
     X(itmopts_dict_type) \
     X(itmopts_seq_type) \
+    X(itmarray_type) \
     X(fmt_auto) \
     X(view_path_helper) \
     X(sd_result_type) \
@@ -710,6 +758,8 @@ extern struct pycbc_helpers_ST pycbc_helpers;
     if ((conn)->unlock_gil) { \
         pycbc_assert((conn)->thrstate == NULL); \
         (conn)->thrstate = PyEval_SaveThread(); \
+    } else if ((conn)->nativeloop) { \
+        pycbc_nativeio_leave(conn); \
     }
 
 #define PYCBC_CONN_THR_END(conn) \
@@ -717,6 +767,8 @@ extern struct pycbc_helpers_ST pycbc_helpers;
         pycbc_assert((conn)->thrstate); \
         PyEval_RestoreThread((conn)->thrstate); \
         (conn)->thrstate = NULL; \
+    } else if ((conn)->nativeloop) { \
+        pycbc_nativeio_enter(conn); \
     }
 
 #else
@@ -878,6 +930,30 @@ int pycbc_multiresult_maybe_raise(pycbc_MultiResult *self);
  */
 PyObject* pycbc_multiresult_get_result(pycbc_MultiResult *self);
 
+/**
+ * Switch the MultiResult to 'compact' storage.
+ * @param self the object
+ * @param nhint the expected number of results
+ * @return 0 on success, -1 on error (with an exception set)
+ */
+int pycbc_multiresult_set_compact(pycbc_MultiResult *self, Py_ssize_t nhint);
+
+/**
+ * Append a result to the compact columns.
+ * @param value the decoded value, or NULL if not available
+ * @return the index of the result, or -1 on error (with an exception set)
+ */
+Py_ssize_t pycbc_multiresult_compact_add(pycbc_MultiResult *self,
+    PyObject *key, PyObject *value, lcb_U64 cas, lcb_U32 flags,
+    lcb_error_t rc);
+
+/**
+ * Create a ValueResult for the compact result at the given index.
+ * @return a new reference, or NULL on error
+ */
+pycbc_ValueResult *pycbc_multiresult_compact_result(pycbc_MultiResult *self,
+    Py_ssize_t ix);
+
 /**
  * Invokes a callback when an operation has been completed. This will either
  * invoke the operation's "error callback" or the operation's "result callback"
@@ -1076,6 +1152,35 @@ pycbc_iowrap_new(pycbc_Bucket *conn, PyObject *pyio);
 lcb_io_opt_t
 pycbc_iowrap_getiops(PyObject *iowrap);
 
+/**
+ * Returns a dictionary of the wrapper's dispatch counters
+ */
+PyObject *
+pycbc_iowrap_stats(PyObject *iowrap);
+
+/**
+ * Create a libcouchbase I/O plugin which attaches directly to an existing
+ * event loop.
+ * @param spec A tuple of (plugin_name, loop_address)
+ * @param[out] io the created I/O plugin, owned by the instance
+ * @return 0 on success, -1 on error (with a Python exception set)
+ */
+int
+pycbc_nativeio_create(PyObject *spec, lcb_io_opt_t *io);
+
+/**
+ * Enter and leave Python from a callback invoked by an external loop.
+ * These are invoked by PYCBC_CONN_THR_END() and PYCBC_CONN_THR_BEGIN()
+ */
+void pycbc_nativeio_enter(pycbc_Bucket *conn);
+void pycbc_nativeio_leave(pycbc_Bucket *conn);
+
+/**
+ * Like pycbc_nativeio_leave(), but also drops a reference to `conn`, which
+ * may be destroyed as a result
+ */
+void pycbc_nativeio_decref_leave(pycbc_Bucket *conn);
+
 /**
  * Event callback handling
  */
@@ -1097,6 +1202,8 @@ PyObject* pycbc_Bucket__end_pipeline(pycbc_Bucket *);
  */
 PyObject* pycbc_Bucket__cntl(pycbc_Bucket *, PyObject *, PyObject *);
 PyObject* pycbc_Bucket__vbmap(pycbc_Bucket *, PyObject *);
+PyObject* pycbc_Bucket__vbmap_multi(pycbc_Bucket *, PyObject *);
+PyObject* pycbc_Bucket__node_host(pycbc_Bucket *, PyObject *);
 PyObject* pycbc_Bucket__cntlstr(pycbc_Bucket *conn, PyObject *args, PyObject *kw);
 
 /**
@@ -120,6 +120,13 @@ handle_single_kv(pycbc_Bucket *self, struct pycbc_common_vars *cv, int optype,
     lcb_error_t err;
     lcb_CMDSTORE cmd = { 0 };
 
+    if (cv->arritm.active && curvalue == NULL) {
+        PYCBC_EXC_WRAP_KEY(PYCBC_EXC_ARGUMENTS, 0,
+                           "ItemArray must have values for mutations",
+                           curkey);
+        return -1;
+    }
+
     if (scv->argopts & PYCBC_ARGOPT_SDMULTI) {
         return handle_multi_mutate(self, cv, optype, curkey, curvalue, options, itm, arg);
     }
@@ -129,6 +136,13 @@ handle_single_kv(pycbc_Bucket *self, struct pycbc_common_vars *cv, int optype,
     skc.value = curvalue;
     skc.cas = scv->single_cas;
 
+    if (cv->arritm.active) {
+        skc.cas = cv->arritm.cas;
+        if (cv->arritm.ttl) {
+            skc.ttl = cv->arritm.ttl;
+        }
+    }
+
     rv = pycbc_tc_encode_key(self, curkey, &keybuf);
     if (rv < 0) {
         return -1;
@@ -365,3 +379,4 @@ DECLFUNC(append, LCB_APPEND, PYCBC_ARGOPT_SINGLE)
 DECLFUNC(prepend, LCB_PREPEND, PYCBC_ARGOPT_SINGLE)
 
 DECLFUNC(mutate_in, 0, PYCBC_ARGOPT_SINGLE | PYCBC_ARGOPT_SDMULTI)
+DECLFUNC(mutate_in_multi, 0, PYCBC_ARGOPT_MULTI | PYCBC_ARGOPT_SDMULTI)
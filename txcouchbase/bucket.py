@@ -18,16 +18,22 @@
 This file contains the twisted-specific bits for the Couchbase client.
 """
 
+from collections import deque
+
 from twisted.internet import reactor
-from twisted.internet.defer import Deferred
+from twisted.internet.defer import Deferred, CancelledError
+from twisted.internet.interfaces import IPushProducer
 from twisted.python.failure import Failure
+from zope.interface import implementer
 
 from couchbase.async.bucket import AsyncBucket
 from couchbase.async.view import AsyncViewBase
 from couchbase.async.n1ql import AsyncN1QLRequest
 from couchbase.async.events import EventQueue
 from couchbase.exceptions import CouchbaseError
-from txcouchbase.iops import v0Iops
+from couchbase.hedging import HedgedRead
+from couchbase.items import ItemCollection
+from txcouchbase.iops import CoalescingIops
 
 
 class BatchedRowMixin(object):
@@ -97,6 +103,113 @@ class BatchedN1QLRequest(BatchedRowMixin, AsyncN1QLRequest):
         BatchedRowMixin.__init__(self, *args, **kwargs)
 
 
+@implementer(IPushProducer)
+class StreamingRowMixin(object):
+    #: How many rows to receive from the library at a time
+    rows_per_call = 100
+
+    def __init__(self, *args, **kwargs):
+        """
+        Row-based result which delivers rows to a callback as they arrive,
+        rather than buffering the entire result set.
+
+        This object is an :class:`IPushProducer`. It may be registered with
+        a consumer (for example an HTTP request) which can then pause and
+        resume the flow of rows. While paused, reading from the network is
+        suspended for the whole bucket, so that the server is throttled
+        rather than having rows accumulate in memory.
+
+        Use :meth:`RawBucket.queryStream` or
+        :meth:`RawBucket.n1qlQueryStream` to create these objects.
+        """
+        self._d = Deferred()
+        self._onRow = None
+        self._iops = None
+        self._pending = deque()
+        self._paused = False
+        self._finished = False
+
+    @property
+    def deferred(self):
+        """
+        A :class:`Deferred` fired with this object once all rows have been
+        delivered, or with an error if the query failed
+        """
+        return self._d
+
+    def _startStream(self):
+        self.start()
+        self.raw.rows_per_call = self.rows_per_call
+
+    def _drain(self):
+        while self._pending and not self._paused:
+            self._onRow(self._pending.popleft())
+        if self._finished and not self._pending and self._d:
+            d, self._d = self._d, None
+            d.callback(self)
+
+    def on_rows(self, rowiter):
+        """
+        Reimplemented from :meth:`~AsyncViewBase.on_rows`
+        """
+        if self._d:
+            self._pending.extend(rowiter)
+            self._drain()
+
+    def on_error(self, ex):
+        """
+        Reimplemented from :meth:`~AsyncViewBase.on_error`
+        """
+        self._pending.clear()
+        self.resumeProducing()
+        if self._d:
+            d, self._d = self._d, None
+            d.errback()
+
+    def on_done(self):
+        """
+        Reimplemented from :meth:`~AsyncViewBase.on_done`
+        """
+        self._finished = True
+        self._drain()
+
+    def pauseProducing(self):
+        if self._paused:
+            return
+        self._paused = True
+        self._iops.suspend_reading()
+
+    def resumeProducing(self):
+        if not self._paused:
+            return
+        self._paused = False
+        self._iops.resume_reading()
+        self._drain()
+
+    def stopProducing(self):
+        """
+        Stop delivering rows. Rows still arriving from the network are
+        discarded and :attr:`deferred` fails with :exc:`CancelledError`.
+        """
+        self._pending.clear()
+        self.resumeProducing()
+        if self._d:
+            d, self._d = self._d, None
+            d.errback(CancelledError())
+
+
+class StreamingView(StreamingRowMixin, AsyncViewBase):
+    def __init__(self, *args, **kwargs):
+        AsyncViewBase.__init__(self, *args, **kwargs)
+        StreamingRowMixin.__init__(self, *args, **kwargs)
+
+
+class StreamingN1QLRequest(StreamingRowMixin, AsyncN1QLRequest):
+    def __init__(self, *args, **kwargs):
+        AsyncN1QLRequest.__init__(self, *args, **kwargs)
+        StreamingRowMixin.__init__(self, *args, **kwargs)
+
+
 class TxEventQueue(EventQueue):
     """
     Subclass of EventQueue. This implements the relevant firing methods,
@@ -121,6 +234,9 @@ class ConnectionEventQueue(TxEventQueue):
         raise err
 
 class RawBucket(AsyncBucket):
+    #: The IOPS implementation used to integrate with the reactor
+    _iops_class = CoalescingIops
+
     def __init__(self, connstr=None, **kwargs):
         """
         Bucket subclass for Twisted. This inherits from the 'AsyncBucket' class,
@@ -128,8 +244,9 @@ class RawBucket(AsyncBucket):
         """
         if connstr and 'connstr' not in kwargs:
             kwargs['connstr'] = connstr
-        iops = v0Iops(reactor)
+        iops = self._iops_class(reactor)
         super(RawBucket, self).__init__(iops=iops, **kwargs)
+        self._txiops = iops
 
         self._evq = {
             'connect': ConnectionEventQueue(),
@@ -338,6 +455,58 @@ class RawBucket(AsyncBucket):
         return o._getDeferred()
 
 
+    def _stream(self, meth, cls, onRow, args, kwargs):
+        kwargs['itercls'] = cls
+        o = meth(*args, **kwargs)
+        # Set these up front, so the object may be paused or resumed
+        # even before the bucket is connected
+        o._onRow = onRow
+        o._iops = self._txiops
+        if not self.connected:
+            def on_connect(x):
+                o._startStream()
+            self.connect().addCallback(on_connect).addErrback(o._d.errback)
+        else:
+            o._startStream()
+        return o
+
+    def queryStream(self, onRow, *args, **kwargs):
+        """
+        Query a view, invoking `onRow` for each row as it is received.
+
+        :param onRow: A callable invoked with each row
+        :return: A :class:`StreamingView`. This is an
+          :class:`IPushProducer` whose :attr:`~StreamingView.deferred`
+          fires once all rows were delivered.
+
+        Other arguments follow the conventions of
+        :meth:`~couchbase.bucket.Bucket.query`.
+
+        Example::
+
+          def on_row(row):
+              request.write(json.dumps(row.value) + "\\n")
+
+          producer = cb.queryStream(on_row, "beer", "brewery_beers")
+          request.registerProducer(producer, True)
+          producer.deferred.addCallback(lambda x: request.finish())
+        """
+        return self._stream(super(RawBucket, self).query, StreamingView,
+                            onRow, args, kwargs)
+
+    def n1qlQueryStream(self, onRow, *args, **kwargs):
+        """
+        Execute a N1QL query, invoking `onRow` for each row as it is
+        received.
+
+        :return: A :class:`StreamingN1QLRequest`
+
+        .. seealso:: :meth:`queryStream`
+        """
+        return self._stream(super(RawBucket, self).n1ql_query,
+                            StreamingN1QLRequest, onRow, args, kwargs)
+
+
 class Bucket(RawBucket):
     def __init__(self, *args, **kwargs):
         """
@@ -419,3 +588,87 @@ class Bucket(RawBucket):
     for x in RawBucket._MEMCACHED_OPERATIONS:
         if locals().get(x+'_multi', None):
             locals().update({x+"Multi": locals()[x+"_multi"]})
+
+    def multiDeferreds(self, opname, keys, *args, **kwargs):
+        """
+        Perform a ``*_multi`` operation, returning a :class:`Deferred` for
+        each key rather than a single one for the whole
+        :class:`~couchbase.result.MultiResult`.
+
+        All the Deferreds are fired together, in a single pass, once the
+        operation completes. This is much cheaper than issuing a
+        single-key operation for every key.
+
+        :param string opname: The name of the operation, e.g.
+          ``'get_multi'``
+        :param keys: The keys (or key-value dictionary, or
+          :class:`~couchbase.items.ItemCollection`) for the operation
+        :return: A ``dict`` of ``key -> Deferred``. Each Deferred's
+          ``callback`` is invoked with the key's
+          :class:`~couchbase.result.Result`, or its ``errback`` with an
+          exception if the key failed. If the operation cannot be scheduled
+          at all (e.g. because of an invalid value), all the Deferreds
+          fail with the same error.
+
+        Example::
+
+          ds = cb.multiDeferreds('get_multi', keys)
+          for key, d in ds.items():
+              d.addCallback(on_value, key)
+        """
+        klist = self._fanout_keys(opname, keys)
+        if not isinstance(keys, (dict, ItemCollection)):
+            keys = klist
+        ds = dict((k, Deferred()) for k in klist)
+
+        def fail_all(err):
+            for d in ds.values():
+                d.errback(err)
+
+        def schedule(*_):
+            try:
+                opres = getattr(RawBucket, opname)(self, keys, *args, **kwargs)
+            except Exception:
+                # e.g. an invalid key or value
+                fail_all(Failure())
+                return
+            self._fanout(opres, klist,
+                         lambda k, res: ds[k].callback(res),
+                         lambda k, exc: ds[k].errback(exc))
+
+        if self.connected:
+            schedule()
+        else:
+            self.connect().addCallbacks(schedule, fail_all)
+        return ds
+
+    def getHedged(self, key, policy, quiet=None, **kwargs):
+        """
+        Retrieve a key, hedging against a slow active node by also
+        reading from a replica if no response arrives within the delay
+        dictated by `policy`.
+
+        :param key: The key to fetch
+        :param policy: The policy controlling the hedging delay, which also
+            collects statistics on how often hedging was needed
+        :type policy: :class:`~couchbase.hedging.HedgePolicy`
+        :param quiet: Passed to both :meth:`get` and :meth:`rget`
+        :param kwargs: Additional arguments passed to :meth:`get`
+        :return: A :class:`Deferred` fired with the first successful
+            result, or with the error of the active read
+
+        .. seealso:: :mod:`couchbase.hedging`
+        """
+        d = Deferred()
+        hr = HedgedRead(policy, d.callback, d.errback)
+
+        def fire():
+            if hr.fire():
+                self.rget(key, quiet=quiet).addCallbacks(
+                    hr.replica_ok, hr.replica_err)
+
+        timer = reactor.callLater(policy.delay, fire)
+        hr.cancel_timer = timer.cancel
+        self.get(key, quiet=quiet, **kwargs).addCallbacks(
+            hr.active_ok, hr.active_err)
+        return d
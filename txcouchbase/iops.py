@@ -1,3 +1,7 @@
+from heapq import heappush, heappop, heapify
+from itertools import count
+from math import ceil
+
 from twisted.internet import error as TxErrors
 
 import couchbase._libcouchbase as LCB
@@ -20,11 +24,10 @@ class TxIOEvent(IOEvent):
     def __init__(self):
         super(TxIOEvent, self).__init__()
 
-    def doRead(self):
-        self.ready_r()
-
-    def doWrite(self):
-        self.ready_w()
+    # The reactor invokes these directly; binding them to the C methods
+    # avoids an extra Python frame for every readiness notification
+    doRead = IOEvent.ready_r
+    doWrite = IOEvent.ready_w
 
     def connectionLost(self, reason):
         if self.state == PYCBC_EVSTATE_ACTIVE:
@@ -80,12 +83,14 @@ class v0Iops(object):
     IOPS Implementation to be used with Twisted's "FD" based reactors
     """
 
-    __slots__ = [ 'reactor', 'is_sync', '_stop' ]
+    __slots__ = [ 'reactor', 'is_sync', '_stop', '_readers', '_rsuspended' ]
 
     def __init__(self, reactor, is_sync=False):
         self.reactor = reactor
         self.is_sync = is_sync
         self._stop = False
+        self._readers = set()
+        self._rsuspended = 0
 
     def update_event(self, event, action, flags):
         """
@@ -93,21 +98,50 @@ class v0Iops(object):
         """
         if action == PYCBC_EVACTION_UNWATCH:
             if event.flags & LCB_READ_EVENT:
+                self._readers.discard(event)
                 self.reactor.removeReader(event)
             if event.flags & LCB_WRITE_EVENT:
                 self.reactor.removeWriter(event)
 
         elif action == PYCBC_EVACTION_WATCH:
             if flags & LCB_READ_EVENT:
-                self.reactor.addReader(event)
+                self._readers.add(event)
+                if not self._rsuspended:
+                    self.reactor.addReader(event)
             if flags & LCB_WRITE_EVENT:
                 self.reactor.addWriter(event)
 
             if flags & LCB_READ_EVENT == 0:
+                self._readers.discard(event)
                 self.reactor.removeReader(event)
             if flags & LCB_WRITE_EVENT == 0:
                 self.reactor.removeWriter(event)
 
+        elif action == PYCBC_EVACTION_CLEANUP:
+            self._readers.discard(event)
+
+    def suspend_reading(self):
+        """
+        Stop reading from all sockets until :meth:`resume_reading` is
+        called. This applies backpressure to the server. Calls nest; reading
+        resumes once each call has been matched by :meth:`resume_reading`.
+        """
+        self._rsuspended += 1
+        if self._rsuspended == 1:
+            for event in self._readers:
+                self.reactor.removeReader(event)
+
+    def resume_reading(self):
+        """
+        Undo a prior call to :meth:`suspend_reading`
+        """
+        if not self._rsuspended:
+            return
+        self._rsuspended -= 1
+        if not self._rsuspended:
+            for event in self._readers:
+                self.reactor.addReader(event)
+
     def update_timer(self, timer, action, usecs):
         """
         Called by libcouchbase to add/remove timers
@@ -141,3 +175,101 @@ class v0Iops(object):
 
     def stop_watching(self):
         self._stop = True
+
+
+class TxCoalescedTimer(TimerEvent):
+    __slots__ = ['lcb_active', 'deadline', 'gen']
+
+    def __init__(self):
+        super(TxCoalescedTimer, self).__init__()
+        self.lcb_active = False
+        self.deadline = 0
+        self.gen = 0
+
+
+class CoalescingIops(v0Iops):
+    """
+    IOPS implementation which multiplexes all of the library's timers over
+    a single reactor ``DelayedCall``.
+
+    Timer deadlines are rounded up to `granularity` seconds, so timers
+    expiring close to each other are fired from one reactor callback, and
+    rescheduling a timer to the same rounded deadline is free.
+    """
+
+    __slots__ = ['granularity', '_theap', '_tcall', '_tseq', '_tlive']
+
+    def __init__(self, reactor, is_sync=False, granularity=0.001):
+        super(CoalescingIops, self).__init__(reactor, is_sync)
+        self.granularity = granularity
+        self._theap = []
+        self._tcall = None
+        self._tseq = count()
+        self._tlive = 0
+
+    def update_timer(self, timer, action, usecs):
+        if action == PYCBC_EVACTION_WATCH:
+            deadline = self.reactor.seconds() + usecs / 1000000.0
+            if self.granularity:
+                deadline = ceil(deadline / self.granularity) * self.granularity
+            if timer.lcb_active:
+                if timer.deadline == deadline:
+                    return
+            else:
+                self._tlive += 1
+                timer.lcb_active = True
+
+            timer.gen += 1
+            timer.deadline = deadline
+            heappush(self._theap,
+                     (deadline, next(self._tseq), timer.gen, timer))
+            self._compact()
+            self._arm()
+
+        elif timer.lcb_active:
+            # Unwatch or cleanup. The heap entry is discarded lazily
+            timer.lcb_active = False
+            timer.gen += 1
+            self._tlive -= 1
+
+    def _compact(self):
+        if len(self._theap) < 64 or len(self._theap) < 4 * self._tlive:
+            return
+        self._theap = [e for e in self._theap
+                       if e[3].lcb_active and e[2] == e[3].gen]
+        heapify(self._theap)
+
+    def _arm(self):
+        if not self._theap:
+            return
+
+        first = self._theap[0][0]
+        delay = max(0, first - self.reactor.seconds())
+        if self._tcall and self._tcall.active():
+            if self._tcall.getTime() <= first:
+                return
+            self._tcall.reset(delay)
+        else:
+            self._tcall = self.reactor.callLater(delay, self._fire)
+
+    def _fire(self):
+        self._tcall = None
+        now = self.reactor.seconds()
+        expired = []
+        while self._theap and self._theap[0][0] <= now:
+            _, _, gen, timer = heappop(self._theap)
+            if timer.lcb_active and timer.gen == gen:
+                expired.append(timer)
+
+        for timer in expired:
+            # A previous callback may have rescheduled or cancelled it
+            if timer.lcb_active and timer.deadline <= now:
+                timer.lcb_active = False
+                timer.gen += 1
+                self._tlive -= 1
+                timer.ready(0)
+
+        self._arm()
+
+    def timer_event_factory(self):
+        return TxCoalescedTimer()
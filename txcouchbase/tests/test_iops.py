@@ -0,0 +1,66 @@
+#
+# Copyright 2016, Couchbase, Inc.
+# All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from twisted.internet.task import Clock
+from twisted.trial.unittest import TestCase
+
+from couchbase._libcouchbase import (
+    PYCBC_EVACTION_WATCH, PYCBC_EVACTION_UNWATCH)
+from txcouchbase.iops import CoalescingIops, TxCoalescedTimer
+
+
+class RecordingTimer(TxCoalescedTimer):
+    fired = []
+
+    def ready(self, flags):
+        self.fired.append(self)
+
+
+class CoalescingIopsTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.iops = CoalescingIops(self.clock, granularity=0.01)
+        RecordingTimer.fired = []
+
+    def schedule(self, timer, secs):
+        self.iops.update_timer(timer, PYCBC_EVACTION_WATCH, int(secs * 1e6))
+
+    def test_coalesce(self):
+        t1, t2, t3 = RecordingTimer(), RecordingTimer(), RecordingTimer()
+        self.schedule(t1, 0.101)
+        self.schedule(t2, 0.105)
+        self.schedule(t3, 0.5)
+
+        # Only one reactor call is ever pending
+        self.assertEqual(1, len(self.clock.getDelayedCalls()))
+
+        self.clock.advance(0.11)
+        self.assertEqual(set([t1, t2]), set(RecordingTimer.fired))
+        self.clock.advance(1)
+        self.assertEqual(3, len(RecordingTimer.fired))
+        self.assertEqual(0, len(self.clock.getDelayedCalls()))
+
+    def test_reschedule_and_cancel(self):
+        t1, t2 = RecordingTimer(), RecordingTimer()
+        self.schedule(t1, 0.1)
+        self.schedule(t1, 0.3)
+        self.schedule(t2, 0.2)
+        self.iops.update_timer(t2, PYCBC_EVACTION_UNWATCH, 0)
+
+        self.clock.advance(0.25)
+        self.assertEqual([], RecordingTimer.fired)
+        self.clock.advance(0.1)
+        self.assertEqual([t1], RecordingTimer.fired)
@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from twisted.internet.defer import DeferredList
+
 from couchbase.tests.base import ConnectionTestCase
 
 from txcouchbase.tests.base import gen_base
-from couchbase.exceptions import NotFoundError
+from couchbase.exceptions import NotFoundError, ValueFormatError
 from couchbase.result import (
     Result, OperationResult, ValueResult, MultiResult)
 
@@ -110,3 +112,39 @@ class OperationTestCase(gen_base(ConnectionTestCase)):
 
         d.addErrback(t)
         return d
+
+    def testMultiDeferreds(self):
+        cb = self.make_connection()
+        kv = self.gen_kv_dict(prefix="test_multi_deferreds")
+        cb.setMulti(kv)
+
+        rmkey = list(kv.keys())[0]
+        cb.delete(rmkey)
+
+        ds = cb.multiDeferreds('get_multi', kv.keys())
+        self.assertEqual(set(ds.keys()), set(kv.keys()))
+
+        def t_ok(res, key):
+            self.assertNotEqual(key, rmkey)
+            self.assertEqual(res.value, kv[key])
+
+        def t_err(err, key):
+            self.assertEqual(key, rmkey)
+            self.assertIsInstance(err.value, NotFoundError)
+            self.assertEqual(err.value.key, key)
+
+        for k, d in ds.items():
+            d.addCallback(t_ok, k).addErrback(t_err, k)
+        return DeferredList(list(ds.values()), fireOnOneErrback=True)
+
+    def testMultiDeferredsBadValue(self):
+        cb = self.make_connection()
+        kv = {self.gen_key("test_multi_deferreds_badvalue"): object()}
+        ds = cb.multiDeferreds('upsert_multi', kv)
+
+        def t_err(err):
+            self.assertIsInstance(err.value, ValueFormatError)
+
+        for d in ds.values():
+            d.addCallbacks(lambda x: self.fail('Expected an error'), t_err)
+        return DeferredList(list(ds.values()), fireOnOneErrback=True)
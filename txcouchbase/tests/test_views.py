@@ -13,9 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from twisted.internet import defer
+from twisted.internet import defer, reactor
 
-from txcouchbase.bucket import BatchedView
+from txcouchbase.bucket import BatchedView, StreamingView
 from couchbase.exceptions import HTTPError, ArgumentError
 from couchbase.async.view import AsyncViewBase
 
@@ -86,3 +86,22 @@ class TxViewsTests(gen_base(ViewTestCase)):
         d.addCallback(verify)
         o._d = d
         return d
+
+    def testStreamingRows(self):
+        cb = self.make_connection()
+        rows = []
+        o = cb.queryStream(rows.append, 'beer', 'brewery_beers', limit=20)
+        self.assertIsInstance(o, StreamingView)
+
+        # Rows are held back while paused, and delivered on resume
+        o.pauseProducing()
+        def resume():
+            self.assertEqual(0, len(rows))
+            o.resumeProducing()
+        reactor.callLater(0.5, resume)
+
+        def verify(res):
+            self.assertIs(o, res)
+            self.assertEqual(20, len(rows))
+
+        return o.deferred.addCallback(verify)